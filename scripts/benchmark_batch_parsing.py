@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Benchmark the parsing of `globus transfer --batch` input.
+
+A batch file is generated and parsed into a TransferData document, first with the
+fast-path line parser and then (with `--compare`) with every line going through
+the click parser, as all lines did before the fast path existed.
+
+usage: python scripts/benchmark_batch_parsing.py [--lines N] [--compare]
+"""
+
+from __future__ import annotations
+
+import argparse
+import pathlib
+import tempfile
+import time
+import typing as t
+
+import globus_sdk
+
+import globus_cli.services.transfer.data
+from globus_cli.services.transfer import add_batch_to_transfer_data
+from globus_cli.utils import shlex_process_stream
+
+
+def write_batch_file(path: pathlib.Path, lines: int) -> None:
+    with open(path, "w") as fp:
+        for i in range(lines):
+            # a mix of the common forms of batch lines
+            if i % 10 == 0:
+                fp.write(f"--recursive dir{i} dir{i}\n")
+            elif i % 10 == 1:
+                fp.write(f"'file {i}.txt' 'file {i}.txt'\n")
+            else:
+                fp.write(f"data/file{i}.dat data/file{i}.dat\n")
+
+
+def parse_batch_file(path: pathlib.Path) -> int:
+    transfer_data = globus_sdk.TransferData(
+        source_endpoint="aa752cea-8222-5bc8-acd9-555b090c0ccb",
+        destination_endpoint="313ce13e-b597-5858-ae13-29e46fea26e6",
+    )
+    with open(path) as batch:
+        add_batch_to_transfer_data(
+            "/source/", "/dest/", globus_sdk.MISSING, transfer_data, batch
+        )
+    return len(transfer_data["DATA"])
+
+
+def click_only_process_stream(
+    process_command: t.Any, stream: t.TextIO, name: str, **kwargs: t.Any
+) -> None:
+    shlex_process_stream(process_command, stream, name)
+
+
+def timed(label: str, path: pathlib.Path) -> float:
+    start = time.perf_counter()
+    items = parse_batch_file(path)
+    elapsed = time.perf_counter() - start
+    print(f"{label:>10}: {items} items in {elapsed:.2f}s ({items / elapsed:,.0f}/s)")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="also time the click parser alone (this is much slower)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = pathlib.Path(tmpdir) / "batch.txt"
+        write_batch_file(path, args.lines)
+
+        fast = timed("fast path", path)
+        if args.compare:
+            setattr(
+                globus_cli.services.transfer.data,
+                "shlex_process_stream",
+                click_only_process_stream,
+            )
+            slow = timed("click", path)
+            print(f"   speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""
+Benchmark the startup time of the CLI.
+
+Each command line is run in a fresh interpreter, which times the import of the CLI
+and the run of the command (but not the startup of the interpreter itself). The
+best of several runs is reported, to reduce noise.
+
+`globus version` looks up the latest version of the CLI, so the lookup is made
+to fail immediately, in order to time only the CLI.
+
+usage: python scripts/benchmark_startup.py [--runs N] [--importtime] [ARGS ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+DEFAULT_COMMAND_LINES = (("--help",), ("version",), ("ls", "--help"))
+
+_TIMED_RUN = """\
+import sys, time
+start = time.perf_counter()
+from globus_cli import main
+try:
+    main.main(sys.argv[1:], prog_name="globus")
+except SystemExit:
+    pass
+sys.stderr.write(f"{time.perf_counter() - start}\\n")
+"""
+
+
+def time_startup(args: tuple[str, ...], *, runs: int = 5) -> float:
+    """
+    The best time, in seconds, to import the CLI and run a command line.
+    """
+    env = dict(os.environ)
+    # nothing listens on the discard port, so web requests fail immediately
+    env["HTTPS_PROXY"] = "http://127.0.0.1:9"
+    env.pop("GLOBUS_CLI_DAEMON_SOCKET", None)
+
+    times = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _TIMED_RUN, *args],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+        times.append(float(proc.stderr.strip().splitlines()[-1]))
+    return min(times)
+
+
+def show_importtime(args: tuple[str, ...]) -> None:
+    """
+    Show the slowest imports made by a command line.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _TIMED_RUN, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit():
+                rows.append((int(cumulative), name.rstrip()))
+    for cumulative, name in sorted(rows, reverse=True)[:25]:
+        print(f"{cumulative / 1000:8.1f}ms {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="show the slowest imports, rather than the time taken",
+    )
+    parser.add_argument("args", nargs="*", help="a command line to time")
+    args = parser.parse_args()
+
+    command_lines = [tuple(args.args)] if args.args else DEFAULT_COMMAND_LINES
+    for command_line in command_lines:
+        label = " ".join(("globus",) + command_line)
+        if args.importtime:
+            print(f"{label}:")
+            show_importtime(command_line)
+        else:
+            elapsed = time_startup(command_line, runs=args.runs)
+            print(f"{label:>24}: {elapsed * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
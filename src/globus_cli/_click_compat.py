@@ -3,16 +3,17 @@ A compatibility module for handling click v8.2.0+ and 8.1.x API differences.
 """
 
 import functools
-import importlib.metadata
+import inspect
 import typing as t
 
 import click
 
 C = t.TypeVar("C", bound=t.Callable[..., t.Any])
 
-CLICK_VERSION = importlib.metadata.version("click")
-
-OLDER_CLICK_API = CLICK_VERSION.startswith("8.1.")
+# click 8.2.0 added a `ctx` parameter to `get_metavar`
+# this is checked, rather than the installed version of click, because reading the
+# version from the package metadata is slow enough to noticeably delay startup
+OLDER_CLICK_API = "ctx" not in inspect.signature(click.ParamType.get_metavar).parameters
 NEWER_CLICK_API = not OLDER_CLICK_API
 
 
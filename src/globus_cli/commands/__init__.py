@@ -7,6 +7,7 @@ from globus_cli.parsing import main_group
         "bookmark": ("bookmark", "bookmark_command"),
         "cli-profile-list": ("cli_profile_list", "cli_profile_list"),
         "collection": ("collection", "collection_command"),
+        "daemon": ("daemon", "daemon_command"),
         "delete": ("delete", "delete_command"),
         "endpoint": ("endpoint", "endpoint_command"),
         "flows": ("flows", "flows_command"),
@@ -23,6 +24,7 @@ from globus_cli.parsing import main_group
         "rm": ("rm", "rm_command"),
         "search": ("search", "search_command"),
         "session": ("session", "session_command"),
+        "shell": ("shell", "shell_command"),
         "stat": ("stat", "stat_command"),
         "task": ("task", "task_command"),
         "timer": ("timer", "timer_command"),
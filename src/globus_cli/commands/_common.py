@@ -1,16 +1,139 @@
 from __future__ import annotations
 
 import sys
+import time
 import typing as t
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
-from globus_cli.termio import display
+from globus_cli.login_manager.utils import refresh_token_if_needed
+from globus_cli.termio import Field, display
 
 if t.TYPE_CHECKING:
+    import globus_sdk
+
     from ..services.transfer import CustomTransferClient
 
+# the maximum number of task status checks which are run at once when waiting
+# on multiple tasks
+TASK_WAIT_MAX_WORKERS = 8
+# with adaptive polling, the factor by which the time between task status checks
+# grows after each check
+POLLING_BACKOFF_FACTOR = 2
+# when following a task or run, the number of records (e.g. events) requested at a
+# time while looking for ones which have not been seen yet
+FOLLOW_PAGE_SIZE = 100
+
+T = t.TypeVar("T")
+
+
+class TaskPollingSchedule:
+    """
+    Decides how long to wait between task status checks.
+
+    Without a maximum interval, this is simply the fixed polling interval.
+    Otherwise, the interval starts at the polling interval and grows geometrically
+    up to the maximum, so that long-running tasks are checked rarely. If the
+    progress of a task predicts that it will finish before the next scheduled
+    check, that check is moved up to the predicted time instead.
+
+    :param polling_interval: The initial (and minimum) number of seconds between
+        checks
+    :param max_polling_interval: The maximum number of seconds between checks,
+        or None to poll at a fixed interval
+    """
+
+    def __init__(
+        self, polling_interval: int, max_polling_interval: int | None = None
+    ) -> None:
+        self._min_interval = polling_interval
+        self._max_interval = max(polling_interval, max_polling_interval or 0)
+        self._interval = polling_interval
+
+    def reset(self) -> None:
+        """
+        Return to the initial interval, e.g. because something has just changed and
+        more changes are likely to follow.
+        """
+        self._interval = self._min_interval
+
+    def next_interval(self, tasks: t.Iterable[t.Mapping[str, t.Any]]) -> float:
+        """
+        Get the number of seconds to wait before checking on some active tasks.
+        """
+        interval: float = self._interval
+        self._interval = min(
+            self._max_interval, self._interval * POLLING_BACKOFF_FACTOR
+        )
+
+        predictions = [
+            prediction
+            for prediction in map(_predict_remaining_time, tasks)
+            if prediction is not None
+        ]
+        if predictions:
+            interval = min(interval, max(self._min_interval, min(predictions)))
+        return interval
+
+
+def follow_new_items(
+    fetch_new: t.Callable[[], list[T]],
+    check_status: t.Callable[[], t.Mapping[str, t.Any]],
+    *,
+    unfinished_statuses: t.Collection[str],
+    polling_interval: int,
+    max_polling_interval: int | None = None,
+) -> t.Iterator[T]:
+    """
+    Get new items (e.g. the events of a task) as they appear, until the thing which
+    produces them has finished.
+
+    :param fetch_new: Get the items which have not been seen yet, oldest first
+    :param check_status: Get the current state of the thing being followed, which
+        has a `status`
+    :param unfinished_statuses: The statuses in which more items may appear
+    :param polling_interval: The initial number of seconds between checks
+    :param max_polling_interval: The maximum number of seconds between checks
+    """
+    schedule = TaskPollingSchedule(polling_interval, max_polling_interval)
+    while True:
+        # the status is checked before fetching new items, so that once it is seen
+        # to have finished, one more fetch finds all of its items
+        doc = check_status()
+        if doc["status"] not in unfinished_statuses:
+            yield from fetch_new()
+            return
+
+        time.sleep(schedule.next_interval([doc]))
+        new_items = fetch_new()
+        # while items are arriving, keep checking at the initial interval
+        if new_items:
+            schedule.reset()
+        yield from new_items
+
+
+def _predict_remaining_time(task: t.Mapping[str, t.Any]) -> float | None:
+    """
+    Estimate the number of seconds until a task finishes, from its progress so far.
+
+    The total size of a task is not known, so this assumes that the remaining files
+    are the same size, on average, as those which have been transferred. If the
+    task has made no progress yet, there is no estimate.
+    """
+    files = task.get("files") or 0
+    files_transferred = task.get("files_transferred") or 0
+    bytes_transferred = task.get("bytes_transferred") or 0
+    rate = task.get("effective_bytes_per_second") or 0
+    if not (files_transferred and bytes_transferred and rate):
+        return None
+
+    remaining_files = files - files_transferred - (task.get("files_skipped") or 0)
+    if remaining_files <= 0:
+        return 0.0
+    return remaining_files * (bytes_transferred / files_transferred) / rate
+
 
 def transfer_task_wait_with_io(
     transfer_client: CustomTransferClient,
@@ -20,6 +143,8 @@ def transfer_task_wait_with_io(
     timeout: int | None,
     task_id: str | uuid.UUID,
     timeout_exit_code: int,
+    *,
+    max_polling_interval: int | None = None,
 ) -> None:
     """
     Options are the core "task wait" options, including the `--meow` easter
@@ -29,45 +154,45 @@ def transfer_task_wait_with_io(
     It *does exit* on behalf of the caller. (We can enhance with a
     `noabort=True` param or somesuch in the future if necessary.)
     """
+    transfer_tasks_wait_with_io(
+        transfer_client,
+        meow,
+        heartbeat,
+        polling_interval,
+        timeout,
+        [task_id],
+        timeout_exit_code,
+        max_polling_interval=max_polling_interval,
+    )
 
-    def timed_out(waited_time: int) -> bool:
-        if timeout is None:
-            return False
-        else:
-            return waited_time >= timeout
 
-    def check_completed() -> bool:
-        completed = transfer_client.task_wait(
-            task_id, timeout=polling_interval, polling_interval=polling_interval
-        )
-        if completed:
-            if heartbeat:
-                click.echo("", err=True)
-            # meowing tasks wake up!
-            if meow:
-                click.echo(
-                    r"""
-                  _..
-  /}_{\           /.-'
- ( a a )-.___...-'/
- ==._.==         ;
-      \ i _..._ /,
-      {_;/   {_//""",
-                    err=True,
-                )
-
-            # TODO: possibly update TransferClient.task_wait so that we don't
-            # need to do an extra fetch to get the task status after completion
-            res = transfer_client.get_task(task_id)
-            display(res, text_mode=display.SILENT)
+def transfer_tasks_wait_with_io(
+    transfer_client: CustomTransferClient,
+    meow: bool,
+    heartbeat: bool,
+    polling_interval: int,
+    timeout: int | None,
+    task_ids: t.Sequence[str | uuid.UUID],
+    timeout_exit_code: int,
+    *,
+    max_polling_interval: int | None = None,
+) -> None:
+    """
+    The multi-task form of `transfer_task_wait_with_io`.
 
-            status = res["status"]
-            if status == "SUCCEEDED":
-                click.get_current_context().exit(0)
-            else:
-                click.get_current_context().exit(1)
+    All of the tasks which are still active are checked once per polling interval,
+    concurrently, so the wait is bounded by the slowest task rather than the sum of
+    all of them. If `max_polling_interval` is given, the polling interval adapts as
+    described in `TaskPollingSchedule`.
 
-        return completed
+    When all tasks are done (or the timeout is reached), the last status fetched
+    for each task is displayed and the command exits with
+    - 0 if every task succeeded
+    - 1 if any task ended with an unsuccessful status
+    - `timeout_exit_code` if no task failed, but some had yet to complete
+    """
+    # drop duplicates, preserving order
+    unique_task_ids = list(dict.fromkeys(str(task_id) for task_id in task_ids))
 
     # Tasks start out sleepy
     if meow:
@@ -80,25 +205,119 @@ def transfer_task_wait_with_io(
             err=True,
         )
 
-    waited_time = 0
-    while not timed_out(waited_time) and not check_completed():
-        if heartbeat:
-            click.echo(".", err=True, nl=False)
-            sys.stderr.flush()
+    # the most recently fetched document for each task
+    tasks: dict[str, globus_sdk.GlobusHTTPResponse] = {}
+    pending = list(unique_task_ids)
+    schedule = TaskPollingSchedule(polling_interval, max_polling_interval)
+
+    executor: ThreadPoolExecutor | None = None
+    if len(unique_task_ids) > 1:
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(unique_task_ids), TASK_WAIT_MAX_WORKERS),
+            thread_name_prefix="task_wait",
+        )
 
-        waited_time += polling_interval
+    try:
+        waited_time = 0.0
+        while True:
+            tasks.update(_get_tasks(transfer_client, executor, pending))
+            pending = [
+                task_id for task_id in pending if tasks[task_id]["status"] == "ACTIVE"
+            ]
+            if not pending or (timeout is not None and waited_time >= timeout):
+                break
 
-    # add a trailing newline to heartbeats if we fail
+            if heartbeat:
+                click.echo(".", err=True, nl=False)
+                sys.stderr.flush()
+
+            interval = schedule.next_interval(
+                tasks[task_id].data for task_id in pending
+            )
+            # never sleep past the timeout
+            if timeout is not None:
+                interval = min(interval, timeout - waited_time)
+            time.sleep(interval)
+            waited_time += interval
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # add a trailing newline to heartbeats
     if heartbeat:
         click.echo("", err=True)
 
-    exit_code = 1
-    if timed_out(waited_time):
-        click.echo(f"Task has yet to complete after {timeout} seconds", err=True)
-        exit_code = timeout_exit_code
+    if pending:
+        if len(unique_task_ids) == 1:
+            click.echo(f"Task has yet to complete after {timeout} seconds", err=True)
+        else:
+            click.echo(
+                f"{len(pending)} of {len(unique_task_ids)} tasks have yet to complete "
+                f"after {timeout} seconds",
+                err=True,
+            )
+    # meowing tasks wake up!
+    elif meow:
+        click.echo(
+            r"""
+                  _..
+  /}_{\           /.-'
+ ( a a )-.___...-'/
+ ==._.==         ;
+      \ i _..._ /,
+      {_;/   {_//""",
+            err=True,
+        )
 
-    # output json if requested, but nothing for text mode
-    res = transfer_client.get_task(task_id)
-    display(res, text_mode=display.SILENT)
+    if len(unique_task_ids) == 1:
+        # output json if requested, but nothing for text mode
+        display(tasks[unique_task_ids[0]], text_mode=display.SILENT)
+    else:
+        display(
+            {"DATA": [tasks[task_id].data for task_id in unique_task_ids]},
+            fields=[Field("Task ID", "task_id"), Field("Status", "status")],
+            response_key="DATA",
+        )
 
+    statuses = {tasks[task_id]["status"] for task_id in unique_task_ids}
+    if statuses == {"SUCCEEDED"}:
+        exit_code = 0
+    elif statuses - {"SUCCEEDED", "ACTIVE"}:
+        exit_code = 1
+    else:
+        exit_code = timeout_exit_code
     click.get_current_context().exit(exit_code)
+
+
+def _get_tasks(
+    transfer_client: CustomTransferClient,
+    executor: ThreadPoolExecutor | None,
+    task_ids: list[str],
+) -> dict[str, globus_sdk.GlobusHTTPResponse]:
+    if executor is None:
+        return {task_id: transfer_client.get_task(task_id) for task_id in task_ids}
+
+    refresh_token_if_needed(transfer_client)
+    futures = {
+        task_id: executor.submit(transfer_client.get_task, task_id)
+        for task_id in task_ids
+    }
+    return {task_id: future.result() for task_id, future in futures.items()}
+
+
+def display_task_submissions(results: list[globus_sdk.GlobusHTTPResponse]) -> None:
+    """
+    Display the results of task submissions.
+
+    A single submission is shown as a record, as it always has been. When a batch
+    was split into multiple tasks, the submissions are shown as a list.
+    """
+    fields = [Field("Message", "message"), Field("Task ID", "task_id")]
+    if len(results) == 1:
+        display(results[0], text_mode=display.RECORD, fields=fields)
+    else:
+        display(
+            {"DATA": [res.data for res in results]},
+            fields=fields,
+            response_key="DATA",
+        )
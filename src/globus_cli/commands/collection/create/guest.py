@@ -18,9 +18,11 @@ from globus_cli.login_manager import LoginManager, MissingLoginError
 from globus_cli.login_manager.context import LoginContext
 from globus_cli.parsing import command, endpointish_params, mutex_option_group
 from globus_cli.parsing.shared_options import activity_notifications_option
-from globus_cli.services.gcs import CustomGCSClient
 from globus_cli.termio import display
 
+if t.TYPE_CHECKING:
+    from globus_cli.services.gcs import CustomGCSClient
+
 
 @command("guest", short_help="Create a GCSv5 Guest Collection.")
 @click.argument("MAPPED_COLLECTION_ID", type=click.UUID)
@@ -25,6 +25,12 @@ def collection_delete(login_manager: LoginManager, *, collection_id: uuid.UUID)
     If a Mapped Collection is deleted, then all Guest Collections and roles associated
     with it are also deleted.
     """
+    from globus_cli.services.endpoint_cache import get_endpoint_cache
+
     gcs_client = login_manager.get_gcs_client(collection_id=collection_id)
     res = gcs_client.delete_collection(collection_id)
+
+    endpoint_cache = get_endpoint_cache()
+    if endpoint_cache is not None:
+        endpoint_cache.delete(str(collection_id))
     display(res, text_mode=display.RAW, response_key="code")
@@ -139,7 +139,7 @@ def collection_list(
     paginator = Paginator.wrap(gcs_client.get_collection_list)
     paginated_call = paginator(**params)
     paging_wrapper = PagingWrapper(
-        paginated_call.items(), json_conversion_key="DATA", limit=limit
+        paginated_call, json_conversion_key="DATA", limit=limit
     )
 
     display(
@@ -0,0 +1,13 @@
+from globus_cli.parsing import group
+
+
+@group(
+    "daemon",
+    lazy_subcommands={
+        "start": (".start", "daemon_start"),
+        "status": (".status", "daemon_status"),
+        "stop": (".stop", "daemon_stop"),
+    },
+)
+def daemon_command() -> None:
+    """Run commands in a long-lived CLI process."""
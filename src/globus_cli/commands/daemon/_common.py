@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import os
+import typing as t
+
+import click
+
+from globus_cli.daemon import SOCKET_ENV_VAR
+from globus_cli.daemon.client import daemon_is_supported
+
+C = t.TypeVar("C", bound=t.Callable[..., t.Any])
+
+
+def default_socket_path() -> str:
+    from globus_cli.utils import ensure_data_dir
+
+    return os.path.join(ensure_data_dir(), "daemon.sock")
+
+
+def socket_option(f: C) -> C:
+    def callback(ctx: click.Context, param: click.Parameter, value: str | None) -> str:
+        if not daemon_is_supported():
+            raise click.UsageError("The CLI daemon is not supported on this platform.")
+        return value or default_socket_path()
+
+    return click.option(
+        "--socket",
+        "socket_path",
+        envvar=SOCKET_ENV_VAR,
+        type=click.Path(dir_okay=False),
+        callback=callback,
+        help=(
+            "The path of the daemon's socket. "
+            f"Defaults to ${SOCKET_ENV_VAR}, or 'daemon.sock' in the CLI's data "
+            "directory."
+        ),
+    )(f)
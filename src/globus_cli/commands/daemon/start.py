@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import click
+
+from globus_cli.parsing import command
+
+from ._common import socket_option
+
+
+@command(
+    "start",
+    disable_options=["format", "map_http_status"],
+    short_help="Run the CLI daemon.",
+    adoc_examples="""Run the daemon in the background, and use it for later commands
+
+[source,bash]
+----
+$ globus daemon start &
+$ export GLOBUS_CLI_DAEMON_SOCKET=~/.globus/cli/daemon.sock
+$ globus ls 'ddb59aef-6d04-11e5-ba46-22000b92c6ec:/share/godata/'
+----
+""",
+)
+@socket_option
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Stop the daemon after this many seconds without a command.",
+)
+def daemon_start(socket_path: str, idle_timeout: float | None) -> None:
+    """
+    Run the CLI daemon in the foreground, until it is stopped.
+
+    The daemon is a long-lived process which runs commands on behalf of the
+    `globus` command. When $GLOBUS_CLI_DAEMON_SOCKET is set to the daemon's socket,
+    each command is handed to the daemon, which has already loaded the CLI, so
+    commands start faster. If the daemon is not running, commands run as usual.
+
+    Each command runs in a process of its own, forked from the daemon, so several
+    commands may run at once, and Ctrl-C interrupts a command as usual. The daemon
+    only runs commands whose Globus environment variables (such as
+    $GLOBUS_PROFILE) match its own. Any other command, or any command given while
+    the daemon is busy, runs as usual.
+    """
+    from globus_cli.daemon.server import DaemonAlreadyRunningError, run_daemon
+
+    def on_ready() -> None:
+        click.echo(f"Globus CLI daemon listening on {socket_path}", err=True)
+
+    try:
+        run_daemon(socket_path, idle_timeout=idle_timeout, on_ready=on_ready)
+    except DaemonAlreadyRunningError:
+        raise click.ClickException(
+            f"A daemon is already listening on {socket_path}"
+        ) from None
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import click
+
+from globus_cli.parsing import command
+
+from ._common import socket_option
+
+
+@command(
+    "status",
+    disable_options=["format", "map_http_status"],
+    short_help="Check whether the CLI daemon is running.",
+)
+@socket_option
+def daemon_status(socket_path: str) -> None:
+    """
+    Check whether the CLI daemon is running.
+
+    Exits with status 1 if no daemon is listening on the socket.
+    """
+    from globus_cli.daemon.client import request
+
+    try:
+        reply = request(socket_path, {"op": "ping"})
+    except OSError:
+        click.echo(f"The daemon on {socket_path} is not responding", err=True)
+        click.get_current_context().exit(1)
+
+    if reply is None:
+        click.echo(f"No daemon is listening on {socket_path}")
+        click.get_current_context().exit(1)
+    click.echo(f"The daemon is listening on {socket_path} (PID {reply['pid']})")
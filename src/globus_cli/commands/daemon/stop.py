@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import click
+
+from globus_cli.parsing import command
+
+from ._common import socket_option
+
+
+@command(
+    "stop",
+    disable_options=["format", "map_http_status"],
+    short_help="Stop the CLI daemon.",
+)
+@socket_option
+def daemon_stop(socket_path: str) -> None:
+    """
+    Stop the CLI daemon, once it has finished any command which it is running.
+    """
+    from globus_cli.daemon.client import request
+
+    if request(socket_path, {"op": "stop"}, timeout=None) is None:
+        click.echo(f"No daemon is listening on {socket_path}", err=True)
+        click.get_current_context().exit(1)
+    click.echo("Stopped the Globus CLI daemon")
@@ -14,11 +14,14 @@ from globus_cli.parsing import (
     command,
     delete_and_rm_options,
     local_user_option,
+    max_items_per_task_option,
     task_submission_options,
 )
 from globus_cli.termio import Field, display, err_is_terminal, term_is_interactive
 from globus_cli.utils import make_dict_json_serializable
 
+from ._common import display_task_submissions
+
 
 @command(
     "delete",
@@ -66,6 +69,7 @@ $ globus task wait "$task_id"
 )
 @task_submission_options
 @delete_and_rm_options()
+@max_items_per_task_option()
 @local_user_option
 @click.argument("endpoint_plus_path", type=ENDPOINT_PLUS_OPTPATH)
 @LoginManager.requires_login("transfer")
@@ -73,6 +77,7 @@ def delete_command(
     login_manager: LoginManager,
     *,
     batch: t.TextIO | None,
+    max_items_per_task: int | None,
     ignore_missing: bool,
     star_silent: bool,
     recursive: bool | globus_sdk.MissingType,
@@ -118,72 +123,109 @@ def delete_command(
     \b
     If you use `--batch` and supply a PATH via the commandline, the commandline PATH is
     treated as a prefix to all of the paths read from the `--batch` input.
+
+    Use `--max-items-per-task` to split very large batches into multiple tasks.
+    Each task is submitted as soon as it is full, and the IDs of all of the
+    tasks are reported.
     """
+    from globus_cli.services.transfer import ChunkedTaskSubmission
+
     endpoint_id, path = endpoint_plus_path
     transfer_client = login_manager.get_transfer_client()
 
-    delete_data = globus_sdk.DeleteData(
-        endpoint_id,
-        label=label,
-        recursive=recursive,
-        submission_id=submission_id,
-        deadline=deadline,
-        local_user=local_user,
-        additional_fields={
-            "ignore_missing": ignore_missing,
-            "interpret_globs": enable_globs,
-            **notify,
-        },
-    )
-
-    if batch:
-        # although this sophisticated structure (like that in transfer)
-        # isn't strictly necessary, it gives us the ability to add options in
-        # the future to these lines with trivial modifications
-        @click.command()
-        @click.argument("path", type=TaskPath(base_dir=path))
-        def process_batch_line(path: TaskPath) -> None:
-            """
-            Parse a line of batch input and add it to the delete submission
-            item.
-            """
-            delete_data.add_item(str(path))
-
-        utils.shlex_process_stream(process_batch_line, batch, "--batch")
-    else:
-        if path is None:
-            raise click.UsageError("delete requires either a PATH OR --batch")
-
-        if not star_silent and enable_globs and path.endswith("*"):
-            # not intuitive, but `click.confirm(abort=True)` prints to stdout
-            # unnecessarily, which we don't really want...
-            # only do this check if stderr is a pty
-            if (
-                err_is_terminal()
-                and term_is_interactive()
-                and not click.confirm(
-                    'Are you sure you want to delete all files matching "{}"?'.format(
-                        path
-                    ),
-                    err=True,
-                )
-            ):
-                click.echo("Aborted.", err=True)
-                click.get_current_context().exit(1)
-        delete_data.add_item(path)
-
-    if dry_run:
-        display(
-            make_dict_json_serializable(delete_data),
-            response_key="DATA",
-            fields=[Field("Path", "path")],
+    if max_items_per_task is not None:
+        if not batch:
+            raise click.UsageError(
+                "`--max-items-per-task` can only be used with `--batch`."
+            )
+        if submission_id is not globus_sdk.MISSING:
+            raise click.UsageError(
+                "You cannot use `--submission-id` in addition to "
+                "`--max-items-per-task`, because a batch may be split into "
+                "multiple tasks."
+            )
+
+    def make_delete_data() -> globus_sdk.DeleteData:
+        return globus_sdk.DeleteData(
+            endpoint_id,
+            label=label,
+            recursive=recursive,
+            submission_id=submission_id,
+            deadline=deadline,
+            local_user=local_user,
+            additional_fields={
+                "ignore_missing": ignore_missing,
+                "interpret_globs": enable_globs,
+                **notify,
+            },
         )
-        # exit safely
-        return
-
-    res = transfer_client.submit_delete(delete_data)
-    display(
-        res,
-        text_mode=display.RECORD,
-        fields=[Field("Message", "message"), Field("Task ID", "task_id")],
-    )
+
+    with ChunkedTaskSubmission(
+        make_delete_data,
+        transfer_client.submit_delete,
+        # a dry run shows every item, rather than submitting tasks
+        max_items=None if dry_run else max_items_per_task,
+    ) as delete_data:
+        if batch:
+            # although this sophisticated structure (like that in transfer)
+            # isn't strictly necessary, it gives us the ability to add options in
+            # the future to these lines with trivial modifications
+            @click.command()
+            @click.argument("path", type=TaskPath(base_dir=path))
+            def process_batch_line(path: TaskPath) -> None:
+                """
+                Parse a line of batch input and add it to the delete submission
+                item.
+                """
+                delete_data.add_item(str(path))
+
+            path_type = TaskPath(base_dir=path)
+
+            def fast_process_batch_line(argv: list[str]) -> bool:
+                """
+                Add a line consisting of a single path without building a click
+                context. Anything else is left to `process_batch_line`.
+                """
+                if len(argv) != 1 or argv[0].startswith("-"):
+                    return False
+                delete_data.add_item(str(path_type.convert(argv[0], None, None)))
+                return True
+
+            utils.shlex_process_stream(
+                process_batch_line,
+                batch,
+                "--batch",
+                fast_path=fast_process_batch_line,
+            )
+        else:
+            if path is None:
+                raise click.UsageError("delete requires either a PATH OR --batch")
+
+            if not star_silent and enable_globs and path.endswith("*"):
+                # not intuitive, but `click.confirm(abort=True)` prints to stdout
+                # unnecessarily, which we don't really want...
+                # only do this check if stderr is a pty
+                if (
+                    err_is_terminal()
+                    and term_is_interactive()
+                    and not click.confirm(
+                        f'Are you sure you want to delete all files matching "{path}"?',
+                        err=True,
+                    )
+                ):
+                    click.echo("Aborted.", err=True)
+                    click.get_current_context().exit(1)
+            delete_data.add_item(path)
+
+        if dry_run:
+            display(
+                make_dict_json_serializable(delete_data.data),
+                response_key="DATA",
+                fields=[Field("Path", "path")],
+            )
+            # exit safely
+            return
+
+        results = delete_data.submit()
+
+    display_task_submissions(results)
@@ -150,7 +150,7 @@ def endpoint_search(
             filter_scope=filter_scope,
             filter_owner_id=owner_id if owner_id is not None else globus_sdk.MISSING,
             filter_entity_type=filter_entity_type,
-        ).items(),
+        ),
         limit=limit,
     )
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import uuid
 
 import globus_sdk
-from globus_sdk.services.gcs import UserCredentialDocument
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
@@ -31,7 +30,7 @@ def posix(
     gcs_client = login_manager.get_gcs_client(endpoint_id=endpoint_id)
     auth_client = login_manager.get_auth_client()
 
-    data = UserCredentialDocument(
+    data = globus_sdk.UserCredentialDocument(
         storage_gateway_id=storage_gateway,
         identity_id=(
             auth_client.maybe_lookup_identity_id(globus_identity) or globus_sdk.MISSING
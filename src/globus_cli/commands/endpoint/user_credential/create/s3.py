@@ -4,7 +4,6 @@ import uuid
 
 import click
 import globus_sdk
-from globus_sdk.services.gcs import UserCredentialDocument
 
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, endpoint_id_arg
@@ -43,7 +42,7 @@ def s3(
         "s3_secret_key": s3_secret_key,
     }
 
-    data = UserCredentialDocument(
+    data = globus_sdk.UserCredentialDocument(
         storage_gateway_id=storage_gateway,
         identity_id=(
             auth_client.maybe_lookup_identity_id(globus_identity) or globus_sdk.MISSING
@@ -121,7 +121,7 @@ def list_command(
             filter_roles=filter_roles or globus_sdk.MISSING,
             filter_fulltext=filter_fulltext,
             orderby=",".join(f"{field} {order}" for field, order in orderby),
-        ).items(),
+        ),
         json_conversion_key="flows",
         limit=limit,
     )
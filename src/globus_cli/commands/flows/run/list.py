@@ -77,7 +77,7 @@ def list_command(
         paginator(
             filter_flow_id=filter_flow_id,
             filter_roles=filter_roles,
-        ).items(),
+        ),
         json_conversion_key="runs",
         limit=limit,
     )
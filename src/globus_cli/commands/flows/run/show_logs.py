@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import typing as t
 import uuid
 
 import click
@@ -8,10 +9,108 @@ from globus_sdk.paging import Paginator
 
 from globus_cli.commands.flows._common import FlowScopeInjector
 from globus_cli.login_manager import LoginManager
-from globus_cli.parsing import command, run_id_arg
+from globus_cli.parsing import command, follow_options, run_id_arg
 from globus_cli.termio import Field, display, print_command_hint
 from globus_cli.utils import PagingWrapper
 
+from ..._common import FOLLOW_PAGE_SIZE
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+# the statuses of runs which may log more entries
+UNFINISHED_RUN_STATUSES = ("ACTIVE", "INACTIVE")
+
+
+def _serialize_details(
+    entries: t.Iterable[dict[str, t.Any]],
+) -> t.Iterator[dict[str, t.Any]]:
+    # the details of each entry are serialized as it is printed, rather than reading
+    # every entry first
+    for entry in entries:
+        yield {**entry, "details": json.dumps(entry["details"])}
+
+
+class RunLogTail:
+    """
+    Finds the log entries of a run which have not been seen yet.
+
+    The marker of the page holding the newest entry seen is kept, so each check
+    starts from that page rather than from the start of the log. Only the entries on
+    that page which were seen before are read again.
+    """
+
+    def __init__(self, flows_client: globus_sdk.FlowsClient, run_id: uuid.UUID) -> None:
+        self._flows_client = flows_client
+        self._run_id = run_id
+        self._marker: str | None = None
+        self._seen_on_page = 0
+
+    def fetch_new(self) -> list[dict[str, t.Any]]:
+        """
+        Get the entries which have not been seen yet, oldest first.
+        """
+        import globus_sdk
+
+        new_entries: list[dict[str, t.Any]] = []
+        while True:
+            page = self._flows_client.get_run_logs(
+                self._run_id,
+                limit=FOLLOW_PAGE_SIZE,
+                marker=self._marker or globus_sdk.MISSING,
+            )
+            entries = page["entries"]
+            new_entries.extend(entries[self._seen_on_page :])
+            self._seen_on_page = max(self._seen_on_page, len(entries))
+
+            next_marker = page.get("marker")
+            if not (page.get("has_next_page") and next_marker):
+                return new_entries
+            self._marker, self._seen_on_page = next_marker, 0
+
+
+def _follow_run_logs(
+    login_manager: LoginManager,
+    flows_client: globus_sdk.FlowsClient,
+    run_id: uuid.UUID,
+    polling_interval: int,
+    max_polling_interval: int,
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Get the log entries of a run as they are logged, until the run has finished.
+    """
+    from globus_cli.commands._common import follow_new_items
+
+    scope_injector = FlowScopeInjector(login_manager)
+    tail = RunLogTail(flows_client, run_id)
+    last_status = None
+
+    def fetch_new() -> list[dict[str, t.Any]]:
+        with scope_injector.for_run(run_id):
+            return tail.fetch_new()
+
+    def check_run() -> t.Mapping[str, t.Any]:
+        nonlocal last_status
+        with scope_injector.for_run(run_id):
+            run_doc = flows_client.get_run(run_id)
+        if run_doc["status"] == "INACTIVE" and last_status != "INACTIVE":
+            print_command_hint(
+                "NOTE: This run is INACTIVE. "
+                "No further logs will be added until it is resumed.",
+                color="bright_blue",
+            )
+        last_status = run_doc["status"]
+        return t.cast(t.Mapping[str, t.Any], run_doc.data)
+
+    yield from fetch_new()
+    yield from follow_new_items(
+        fetch_new,
+        check_run,
+        unfinished_statuses=UNFINISHED_RUN_STATUSES,
+        polling_interval=polling_interval,
+        max_polling_interval=max_polling_interval,
+    )
+
 
 @command("show-logs")
 @run_id_arg
@@ -33,6 +132,12 @@ from globus_cli.utils import PagingWrapper
     type=click.IntRange(1),
     help="The maximum number of results to return.",
 )
+@follow_options(
+    follow_help=(
+        "Show new log entries as they are logged, until the run has finished. "
+        "All entries are shown, and --limit does not apply."
+    )
+)
 @LoginManager.requires_login("flows")
 def show_logs_command(
     login_manager: LoginManager,
@@ -41,39 +146,73 @@ def show_logs_command(
     details: bool,
     reverse: bool,
     limit: int,
+    follow: bool,
+    polling_interval: int,
+    max_polling_interval: int,
 ) -> None:
     """
     List run logs entries.
 
     Enumerates the run log entries for a given run.
+
+    With '--follow', new entries are shown as they are logged, until the run
+    succeeds or fails. Each check reads only the entries which are new.
     """
+    if follow and reverse:
+        raise click.UsageError("--follow cannot be used with --reverse")
 
     flows_client = login_manager.get_flows_client()
 
+    fields = [
+        Field("Time", "time"),
+        Field("Code", "code"),
+        Field("Description", "description"),
+    ]
+    if details:
+        fields.append(Field("Details", "details"))
+
+    if follow:
+        from globus_cli.termio import StreamingJsonDocument
+        from globus_cli.termio.printers import TablePrinter
+
+        entries = _follow_run_logs(
+            login_manager, flows_client, run_id, polling_interval, max_polling_interval
+        )
+        if details:
+            display(
+                _serialize_details(entries),
+                text_mode=display.RECORD_LIST,
+                fields=fields,
+                json_converter=lambda it: StreamingJsonDocument("entries", it),
+            )
+        else:
+            # the columns are sized by the first entry, so that entries are printed
+            # as they arrive
+            display(
+                entries,
+                text_mode=TablePrinter(fields, max_lookahead=1).echo,
+                json_converter=lambda it: StreamingJsonDocument("entries", it),
+            )
+        return
+
     paginator = Paginator.wrap(flows_client.get_run_logs)
     with FlowScopeInjector(login_manager).for_run(run_id):
         # Note: `PagingWrapper.__init__` calls `_step` which is why we wrap this block
         #   with the flow scope injector, not later usages of it.
         entry_iterator = PagingWrapper(
-            paginator(run_id=run_id, reverse_order=reverse).items(),
+            paginator(run_id=run_id, reverse_order=reverse),
             limit=limit,
             json_conversion_key="entries",
         )
 
-    fields = [
-        Field("Time", "time"),
-        Field("Code", "code"),
-        Field("Description", "description"),
-    ]
-
     if details:
         # Display the log entries, including the details field, in text record format.
-        fields.append(Field("Details", "details"))
-        entry_list = list(entry_iterator)
-        for entry in entry_list:
-            entry["details"] = json.dumps(entry["details"])
-
-        display(entry_list, text_mode=display.RECORD_LIST, fields=fields)
+        display(
+            _serialize_details(entry_iterator),
+            text_mode=display.RECORD_LIST,
+            fields=fields,
+            json_converter=list,
+        )
     else:
         print_command_hint(
             "Displaying summary data. "
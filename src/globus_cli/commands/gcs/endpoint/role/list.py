@@ -28,7 +28,7 @@ def list_command(
 
     paginator = Paginator.wrap(gcs_client.get_role_list)
     paginated_call = paginator(include="all_roles") if all_roles else paginator()
-    paging_wrapper = PagingWrapper(paginated_call.items(), json_conversion_key="DATA")
+    paging_wrapper = PagingWrapper(paginated_call, json_conversion_key="DATA")
 
     display(
         paging_wrapper,
@@ -33,15 +33,32 @@ Resolve multiple usernames and or IDs with tabular output
 $ globus get-identities --verbose go@globusid.org clitester1a@globusid.org \
 84942ca8-17c4-4080-9036-2f58e0093869
 ----
+
+Resolve a file of usernames, one per line
+
+[source,bash]
+----
+$ globus get-identities --from-file usernames.txt
+----
 """,
 )
-@click.argument(
-    "values", type=IdentityType(allow_b32_usernames=True), required=True, nargs=-1
+@click.argument("values", type=IdentityType(allow_b32_usernames=True), nargs=-1)
+@click.option(
+    "--from-file",
+    type=click.File("r"),
+    help=(
+        "Read usernames and/or IDs from a file, one per line. "
+        "Use '-' to read from stdin. Blank lines are ignored."
+    ),
 )
 @click.option("--provision", hidden=True, is_flag=True)
 @LoginManager.requires_login("auth")
 def get_identities_command(
-    login_manager: LoginManager, *, values: tuple[ParsedIdentity, ...], provision: bool
+    login_manager: LoginManager,
+    *,
+    values: tuple[ParsedIdentity, ...],
+    from_file: t.TextIO | None,
+    provision: bool,
 ) -> None:
     """
     Lookup Globus Auth Identities given one or more uuids
@@ -52,51 +69,50 @@ def get_identities_command(
     If a particular input had no corresponding identity in Globus Auth,
     "NO_SUCH_IDENTITY" is printed instead.
 
-    If more fields are desired, --verbose will give tabular output, but does not
-    guarantee order and ignores inputs with no corresponding Globus Auth identity.
+    If more fields are desired, --verbose will give tabular output, with one row
+    per identity, and ignores inputs with no corresponding Globus Auth identity.
+
+    Many inputs may be given, either as arguments or with --from-file. They are
+    looked up in batches, and each distinct input is only looked up once.
     """
+    if from_file is not None:
+        values += tuple(_read_values(from_file))
+    if not values:
+        raise click.MissingParameter(
+            param_hint="'VALUES...' or '--from-file'", param_type="argument"
+        )
+
     auth_client = login_manager.get_auth_client()
+    index = auth_client.resolve_identities(
+        ids=(v.value for v in values if v.idtype == "identity"),
+        usernames=(v.value for v in values if v.idtype == "username"),
+        provision=provision,
+    )
 
-    # since API doesn't accept mixed ids and usernames,
-    # split input values into separate lists
-    ids = [v.value for v in values if v.idtype == "identity"]
-    usernames = [v.value for v in values if v.idtype == "username"]
-
-    # make two calls to get_identities with ids and usernames
-    # then combine the calls into one response
-    results = []
-    if len(ids):
-        results += auth_client.get_identities(ids=ids, provision=provision)[
-            "identities"
-        ]
-    if len(usernames):
-        results += auth_client.get_identities(usernames=usernames, provision=provision)[
-            "identities"
-        ]
-    res = {"identities": results}
+    # each identity which was found, once, in the order of the inputs
+    found: dict[str, dict[str, t.Any]] = {}
+    for val in values:
+        identity = index.get(val.value)
+        if identity is not None:
+            found.setdefault(identity["id"], identity)
+    res = {"identities": list(found.values())}
 
     def _custom_text_format(identities: list[dict[str, t.Any]]) -> None:
         """
         Non-verbose text output is customized.
         """
-
-        def resolve_identity(value: dict[str, t.Any]) -> str:
-            """
-            Helper to deal with variable inputs and uncertain response order.
-            """
-            for identity in identities:
-                if identity["id"] == value:
-                    return t.cast(str, identity["username"])
-                if identity["username"] == value:
-                    return t.cast(str, identity["id"])
-            return "NO_SUCH_IDENTITY"
-
         # standard output is one resolved identity per line in the same order
         # as the inputs. A resolved identity is either a username if given a
         # UUID vice versa, or "NO_SUCH_IDENTITY" if the identity could not be
         # found
         for val in values:
-            click.echo(resolve_identity(val.value))
+            identity = index.get(val.value)
+            if identity is None:
+                click.echo("NO_SUCH_IDENTITY")
+            elif val.idtype == "identity":
+                click.echo(identity["username"])
+            else:
+                click.echo(identity["id"])
 
     display(
         res,
@@ -108,7 +124,14 @@ def get_identities_command(
             Field("Organization", "organization"),
             Field("Email Address", "email"),
         ],
-        # verbose output is a table. Order not guaranteed, may contain
-        # duplicates
+        # verbose output is a table
         text_mode=(display.TABLE if is_verbose() else _custom_text_format),
     )
+
+
+def _read_values(stream: t.TextIO) -> t.Iterator[ParsedIdentity]:
+    param_type = IdentityType(allow_b32_usernames=True)
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield param_type.convert(line, None, None)
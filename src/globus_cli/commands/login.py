@@ -11,7 +11,6 @@ from globus_sdk.scopes import (
     SpecificFlowScopes,
     TimersScopes,
 )
-from globus_sdk.services.flows import SpecificFlowClient
 
 from globus_cli._click_compat import shim_get_metavar
 from globus_cli.login_manager import LoginManager, is_client_login
@@ -216,9 +215,9 @@ def login_command(
     for flow_id in flow_ids:
         # TODO - evaluate flow authorization requirements dynamically once
         #  `validate_run` has been updated to properly expose session requirements.
-        # Rely on the SpecificFlowClient's scope builder.
-        flow_scopes = SpecificFlowClient(flow_id).scopes
-        assert flow_scopes is not None
+        # Rely on the SDK's scope builder for flows (rather than SpecificFlowClient,
+        # which would import the SDK's transport layer whenever help is shown).
+        flow_scopes = SpecificFlowScopes(flow_id)
         manager.add_requirement(flow_scopes.resource_server, [flow_scopes.user])
 
     for resource_type, resource_id in timer_targets:
@@ -3,6 +3,10 @@ import globus_sdk
 
 from globus_cli.login_manager import LoginManager, is_client_login
 from globus_cli.parsing import command
+from globus_cli.services.endpoint_cache import get_endpoint_cache
+from globus_cli.services.identity_cache import clear_identity_cache
+from globus_cli.services.listing_cache import get_listing_cache
+from globus_cli.services.task_index import get_task_index
 
 
 def warnecho(msg: str) -> None:
@@ -140,6 +144,20 @@ def logout_command(
         login_manager.storage.adapter.remove_tokens_for_resource_server(rs)
 
     login_manager.storage.remove_well_known_config("auth_user_data")
+    login_manager.storage.clear_token_validations()
+    login_manager.storage.clear_consents()
+
+    # data which was looked up while logged in should not outlive the login
+    clear_identity_cache()
+    endpoint_cache = get_endpoint_cache()
+    if endpoint_cache is not None:
+        endpoint_cache.clear()
+    listing_cache = get_listing_cache()
+    if listing_cache is not None:
+        listing_cache.clear()
+    task_index = get_task_index()
+    if task_index is not None:
+        task_index.clear()
 
     if is_client_login():
         click.echo(_CLIENT_LOGOUT_EPILOG)
@@ -14,7 +14,7 @@ from globus_cli.parsing import (
     local_user_option,
     mutex_option_group,
 )
-from globus_cli.termio import Field, display, formatters, is_verbose, outformat_is_text
+from globus_cli.termio import Field, display, formatters, is_verbose
 
 # Transfer supports all file fields, so this list is missing 'link_target'
 #
@@ -161,6 +161,26 @@ $ globus ls $ep_id:/share/godata/ --filter '~*.txt'  # done with --filter, bette
         "this should behave like a non-recursive `ls`"
     ),
 )
+@click.option(
+    "--parallel",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    metavar="INTEGER",
+    help=(
+        "The number of directories to list at once in `--recursive` listings. "
+        "Results are shown in the same order regardless of this value."
+    ),
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help=(
+        "Periodically save the progress of a `--recursive` listing to this file. "
+        "If the file already exists, the listing resumes from the saved progress. "
+        "The file is removed when the listing completes."
+    ),
+)
 @local_user_option
 @mutex_option_group("--recursive", "--orderby")
 @LoginManager.requires_login("transfer")
@@ -170,6 +190,8 @@ def ls_command(
     endpoint_plus_path: tuple[uuid.UUID, str | None],
     recursive_depth_limit: int,
     recursive: bool,
+    parallel: int,
+    checkpoint: str | None,
     long_output: bool,
     show_hidden: bool,
     orderby: tuple[
@@ -219,6 +241,8 @@ def ls_command(
     from globus_sdk.services.transfer.response import IterableTransferResponse
 
     from globus_cli.services.transfer import (
+        InvalidCheckpointError,
+        RecursiveLsCheckpoint,
         RecursiveLsResponse,
         iterable_response_to_dict,
     )
@@ -239,6 +263,10 @@ def ls_command(
     # dir structures anyway)
     if filter_val and "/" in filter_val:
         raise click.UsageError('--filter cannot contain "/"')
+    if checkpoint and not recursive:
+        raise click.UsageError(
+            "`--checkpoint` can only be used with `--recursive` listings"
+        )
 
     # get the `ls` result
     if recursive:
@@ -248,11 +276,21 @@ def ls_command(
         if filter_val:
             ls_params["filter"] = [{"type": "dir"}, {"name": filter_val}]
 
-        res: IterableTransferResponse | RecursiveLsResponse = (
-            transfer_client.recursive_operation_ls(
-                endpoint_id, ls_params, depth=recursive_depth_limit
+        # the checkpoint (if any) is loaded as the listing starts
+        try:
+            res: IterableTransferResponse | RecursiveLsResponse = (
+                transfer_client.recursive_operation_ls(
+                    endpoint_id,
+                    ls_params,
+                    depth=recursive_depth_limit,
+                    max_workers=parallel,
+                    checkpoint=(
+                        RecursiveLsCheckpoint(checkpoint) if checkpoint else None
+                    ),
+                )
             )
-        )
+        except InvalidCheckpointError as err:
+            raise click.UsageError(str(err)) from err
     else:
         # format filter_val into a simple filter clause which operates on name
         if filter_val:
@@ -261,7 +299,13 @@ def ls_command(
         res = transfer_client.operation_ls(endpoint_id, **ls_params)
 
     # and then print it, per formatting rules
+    # simple output is printed as items arrive, rather than after the full listing
     pathformatter = PathItemFormatter()
+
+    def print_paths(data: t.Iterable[t.Any]) -> None:
+        for item in data:
+            click.echo(pathformatter.parse(item))
+
     display(
         res,
         fields=[
@@ -273,10 +317,6 @@ def ls_command(
             Field("File Type", "type"),
             Field("Filename", "@", formatter=pathformatter),
         ],
-        simple_text=(
-            None
-            if long_output or is_verbose() or not outformat_is_text()
-            else "\n".join(pathformatter.parse(x) for x in res)
-        ),
+        text_mode=display.TABLE if long_output or is_verbose() else print_paths,
         json_converter=iterable_response_to_dict,
     )
@@ -64,6 +64,7 @@ def rm_command(
     meow: bool,
     heartbeat: bool,
     polling_interval: int,
+    max_polling_interval: int | None,
     timeout: int | None,
     timeout_exit_code: int,
 ) -> None:
@@ -133,4 +134,5 @@ def rm_command(
         timeout,
         task_id,
         timeout_exit_code,
+        max_polling_interval=max_polling_interval,
     )
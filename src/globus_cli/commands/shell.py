@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import contextlib
+import shlex
+import sys
+import typing as t
+
+import click
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import command
+
+PROMPT = "globus> "
+
+# commands which cannot be run from the shell:
+#   a nested 'shell' would be confusing, and 'update' replaces the installed CLI
+#   as the process exits
+_NOT_IN_SHELL = frozenset({"shell", "update"})
+
+
+def _read_lines(stream: t.TextIO, interactive: bool) -> t.Iterator[str]:
+    if not interactive:
+        yield from stream
+        return
+
+    # line editing and history, where available
+    with contextlib.suppress(ImportError):
+        import readline  # noqa: F401
+
+    while True:
+        try:
+            yield input(PROMPT)
+        except EOFError:
+            click.echo(err=True)
+            return
+        # interrupting the input discards the line, as in other shells
+        except KeyboardInterrupt:
+            click.echo(err=True)
+
+
+def _parse_line(line: str) -> list[str] | None:
+    """
+    Split a line into the arguments of a `globus` command, or return None for a
+    line with no command.
+
+    :raises ValueError: if the line cannot be split, e.g. because of unbalanced
+        quotes
+    """
+    args = shlex.split(line, comments=True)
+    # the command name is optional
+    if args and args[0] == "globus":
+        args = args[1:]
+    return args or None
+
+
+@command(
+    "shell",
+    disable_options=["format", "map_http_status"],
+    short_help="Run many commands in one process.",
+    adoc_output="""Each command prints its output as it would if run on its own.
+
+The exit status is that of the last command which was run.
+""",
+    adoc_examples="""Run a script of commands
+
+[source,bash]
+----
+$ cat commands.txt
+mkdir ddb59aef-6d04-11e5-ba46-22000b92c6ec:~/results
+ls ddb59aef-6d04-11e5-ba46-22000b92c6ec:~/
+$ globus shell --exit-on-error commands.txt
+----
+
+Start an interactive session
+
+[source,bash]
+----
+$ globus shell
+globus> whoami
+globus> exit
+----
+""",
+)
+@click.argument("script", type=click.File("r"), required=False)
+@click.option(
+    "--exit-on-error",
+    "-e",
+    is_flag=True,
+    help="Stop at the first command which fails, and exit with its status.",
+)
+def shell_command(script: t.TextIO | None, exit_on_error: bool) -> None:
+    """
+    Run many `globus` commands in one process.
+
+    Commands are read one per line from SCRIPT, or from stdin. They are written as
+    they would be in a shell, and may leave off the leading `globus`. Lines
+    starting with '#' are ignored, and 'exit' ends the session.
+
+    All of the commands share one login session and one set of connections to
+    Globus services, so they run much faster than separate `globus` commands.
+    When stdin is a terminal and no SCRIPT is given, commands are read
+    interactively.
+
+    Commands which read from stdin (such as 'transfer --batch -') should be used
+    with a SCRIPT, since otherwise they read the following lines of commands.
+    """
+    from globus_cli.commands import main
+
+    interactive = script is None and sys.stdin.isatty()
+    stream = script or click.get_text_stream("stdin")
+
+    status = 0
+    with LoginManager.shared():
+        for line in _read_lines(stream, interactive):
+            try:
+                args = _parse_line(line)
+            except ValueError as err:
+                click.echo(f"globus shell: {err}", err=True)
+                status = 2
+            else:
+                if args is None:
+                    continue
+                if args == ["exit"]:
+                    break
+                name = main.get_subcommand_name(args)
+                if name in _NOT_IN_SHELL:
+                    click.echo(f"globus shell: '{name}' cannot be run here", err=True)
+                    status = 2
+                else:
+                    status = main.run_in_process(args)
+
+            if status and exit_on_error:
+                break
+
+    click.get_current_context().exit(status)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import itertools
 import json
+import time
 import typing as t
 import uuid
 
@@ -8,12 +10,16 @@ import click
 from globus_sdk.paging import Paginator
 
 from globus_cli.login_manager import LoginManager
-from globus_cli.parsing import command
+from globus_cli.parsing import command, follow_options
 from globus_cli.termio import Field, display, formatters
 from globus_cli.utils import PagingWrapper
 
+from .._common import FOLLOW_PAGE_SIZE
 from ._common import task_id_arg
 
+if t.TYPE_CHECKING:
+    from globus_cli.services.transfer import CustomTransferClient
+
 
 class SquashedJsonFormatter(formatters.FieldFormatter[t.Tuple[t.Any, bool]]):
     def parse(self, value: t.Any) -> tuple[t.Any, bool]:
@@ -40,6 +46,144 @@ class SquashedJsonFormatter(formatters.FieldFormatter[t.Tuple[t.Any, bool]]):
             return str(data.replace("\n", "\\n"))
 
 
+def _event_key(event: t.Mapping[str, t.Any]) -> tuple[t.Any, ...]:
+    return (event["time"], event["code"], event["is_error"], event["details"])
+
+
+class EventTail:
+    """
+    Finds the events of a task which have not been seen yet.
+
+    Transfer lists events newest first, so new events are found by reading from the
+    start of the list until reaching an event which has been seen. The cost of a
+    check therefore depends on the number of new events, not on the length of the
+    task's history.
+    """
+
+    def __init__(
+        self,
+        transfer_client: CustomTransferClient,
+        task_id: uuid.UUID,
+        filter_string: str,
+    ) -> None:
+        self._transfer_client = transfer_client
+        self._task_id = task_id
+        self._filter_string = filter_string
+        # the time of the newest event seen, and the events seen at that time (there
+        # may be several events with the same timestamp)
+        self._last_time: str | None = None
+        self._seen_at_last_time: set[tuple[t.Any, ...]] = set()
+
+    def _is_seen(self, event: t.Mapping[str, t.Any]) -> bool:
+        if self._last_time is None or event["time"] > self._last_time:
+            return False
+        if event["time"] < self._last_time:
+            return True
+        return _event_key(event) in self._seen_at_last_time
+
+    def fetch_new(self, limit: int | None = None) -> list[dict[str, t.Any]]:
+        """
+        Get the events which have not been seen yet, oldest first.
+
+        :param limit: The maximum number of events to get. If there are more new
+            events than this, only the newest ones are returned.
+        """
+        new_events: list[dict[str, t.Any]] = []
+        # events which arrive while paging push older ones to later offsets, so the
+        # same event may be read on more than one page
+        collected: set[tuple[t.Any, ...]] = set()
+        offset = 0
+        while limit is None or len(new_events) < limit:
+            page = self._transfer_client.task_event_list(
+                self._task_id,
+                limit=FOLLOW_PAGE_SIZE,
+                offset=offset,
+                query_params={"filter": self._filter_string},
+            )
+            events = page["DATA"]
+            unseen = list(itertools.takewhile(lambda e: not self._is_seen(e), events))
+            for event in unseen:
+                key = _event_key(event)
+                if key not in collected:
+                    collected.add(key)
+                    new_events.append(event)
+            offset += len(events)
+            if len(unseen) < len(events) or len(events) < FOLLOW_PAGE_SIZE:
+                break
+        if limit is not None:
+            del new_events[limit:]
+
+        if new_events:
+            newest_time = new_events[0]["time"]
+            if newest_time != self._last_time:
+                self._last_time = newest_time
+                self._seen_at_last_time = set()
+            self._seen_at_last_time.update(
+                _event_key(event)
+                for event in new_events
+                if event["time"] == newest_time
+            )
+        return new_events[::-1]
+
+
+def _format_bytes(num_bytes: float) -> str:
+    for unit in ("B", "kB", "MB", "GB", "TB"):
+        if abs(num_bytes) < 1000 or unit == "TB":
+            break
+        num_bytes /= 1000
+    return f"{num_bytes:.1f} {unit}" if unit != "B" else f"{int(num_bytes)} B"
+
+
+class ThroughputMeter:
+    """
+    Reports the progress of a task on stderr, with its throughput measured from the
+    change in `bytes_transferred` between checks.
+    """
+
+    def __init__(self) -> None:
+        self._last: tuple[int, float] | None = None
+
+    def report(self, task: t.Mapping[str, t.Any]) -> None:
+        bytes_transferred = task.get("bytes_transferred") or 0
+        now = time.monotonic()
+        message = f"{task['status']}: {_format_bytes(bytes_transferred)} transferred"
+        if self._last is not None:
+            last_bytes, last_time = self._last
+            if now > last_time:
+                rate = (bytes_transferred - last_bytes) / (now - last_time)
+                message += f" ({_format_bytes(rate)}/s)"
+        self._last = (bytes_transferred, now)
+        click.echo(message, err=True)
+
+
+def _follow_events(
+    transfer_client: CustomTransferClient,
+    task_id: uuid.UUID,
+    tail: EventTail,
+    polling_interval: int,
+    max_polling_interval: int,
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Get new events for a task as they happen, until the task is no longer active.
+    """
+    from .._common import follow_new_items
+
+    meter = ThroughputMeter()
+
+    def check_task() -> t.Mapping[str, t.Any]:
+        task = transfer_client.get_task(task_id)
+        meter.report(task.data)
+        return t.cast(t.Mapping[str, t.Any], task.data)
+
+    return follow_new_items(
+        tail.fetch_new,
+        check_task,
+        unfinished_statuses=("ACTIVE",),
+        polling_interval=polling_interval,
+        max_polling_interval=max_polling_interval,
+    )
+
+
 @command(
     "event-list",
     short_help="List events for a given task.",
@@ -49,6 +193,8 @@ class SquashedJsonFormatter(formatters.FieldFormatter[t.Tuple[t.Any, bool]]):
 `globus task event-list --filter-errors [OPTIONS] TASK_ID`
 
 `globus task event-list --filter-non-errors [OPTIONS] TASK_ID`
+
+`globus task event-list --follow [OPTIONS] TASK_ID`
 """,
     adoc_output="""When output is in text mode, the following fields are used:
 
@@ -63,6 +209,13 @@ class SquashedJsonFormatter(formatters.FieldFormatter[t.Tuple[t.Any, bool]]):
 ----
 $ globus task pause-info TASK_ID --format JSON
 ----
+
+Follow the events of an active task until it completes, as JSON Lines:
+
+[source,bash]
+----
+$ globus task event-list --follow --format jsonl TASK_ID
+----
 """,
 )
 @task_id_arg()
@@ -71,6 +224,12 @@ $ globus task pause-info TASK_ID --format JSON
 )
 @click.option("--filter-errors", is_flag=True, help="Filter results to errors")
 @click.option("--filter-non-errors", is_flag=True, help="Filter results to non errors")
+@follow_options(
+    follow_help=(
+        "Show new events as they happen, until the task is no longer active. "
+        "The task's progress is shown on stderr."
+    )
+)
 @LoginManager.requires_login("transfer")
 def task_event_list(
     login_manager: LoginManager,
@@ -79,6 +238,9 @@ def task_event_list(
     limit: int,
     filter_errors: bool,
     filter_non_errors: bool,
+    follow: bool,
+    polling_interval: int,
+    max_polling_interval: int,
 ) -> None:
     """
     This command shows the recent events for a running task.
@@ -90,6 +252,9 @@ def task_event_list(
     Events may be filtered using '--filter-errors' or '--filter-non-errors', but
     these two options may not be used in tandem.
 
+    With '--follow', the most recent events are shown oldest first, followed by new
+    events as they happen. Each check for events reads only the events which are new.
+
     NOTE: Tasks older than one month may no longer have event log history. In this
     case, no events will be shown.
     """
@@ -110,23 +275,49 @@ def task_event_list(
     else:
         filter_string = ""
 
+    fields = [
+        Field("Time", "time"),
+        Field("Code", "code"),
+        Field("Is Error", "is_error"),
+        Field("Details", "details", formatter=SquashedJsonFormatter()),
+    ]
+
+    if follow:
+        from globus_cli.termio.printers import TablePrinter
+
+        tail = EventTail(transfer_client, task_id, filter_string)
+        recent_events = tail.fetch_new(limit=limit)
+        # the table is sized by the events which are already known, so that it is
+        # printed right away rather than after waiting for more events
+        printer = TablePrinter(fields, max_lookahead=max(1, len(recent_events)))
+        display(
+            itertools.chain(
+                recent_events,
+                _follow_events(
+                    transfer_client,
+                    task_id,
+                    tail,
+                    polling_interval,
+                    max_polling_interval,
+                ),
+            ),
+            text_mode=printer.echo,
+            json_converter=iterable_response_to_dict,
+        )
+        return
+
     paginator = Paginator.wrap(transfer_client.task_event_list)
     event_iterator = PagingWrapper(
         paginator(
             task_id,
             # TODO: convert to `filter=filter_string` when SDK support is added
             query_params={"filter": filter_string},
-        ).items(),
+        ),
         limit=limit,
     )
 
     display(
         event_iterator,
-        fields=[
-            Field("Time", "time"),
-            Field("Code", "code"),
-            Field("Is Error", "is_error"),
-            Field("Details", "details", formatter=SquashedJsonFormatter()),
-        ],
+        fields=fields,
         json_converter=iterable_response_to_dict,
     )
@@ -66,6 +66,16 @@ $ globus task list --limit 100 \
     --filter-not-label 'autolabel' --exact
 ----
 
+List the tasks which failed last year, from the local task index:
+
+[source,bash]
+----
+$ globus task sync
+$ globus task list --local --limit 1000 --filter-status FAILED \
+    --filter-requested-after 2025-01-01 \
+    --filter-requested-before 2026-01-01
+----
+
 List active transfers in a tabular format suitable for consumption by unix
 tools:
 
@@ -168,7 +178,15 @@ globus task list --format=unix --jmespath='DATA[*].[task_id, status]' | \
     callback=_format_date_callback,
     help="Filter results to tasks that were completed before given time.",
 )
-@LoginManager.requires_login("transfer")
+@click.option(
+    "--local",
+    is_flag=True,
+    help=(
+        "List tasks from the local task index, which is updated by "
+        "'globus task sync', rather than from Globus Transfer."
+    ),
+)
+@LoginManager.requires_login()
 def task_list(
     login_manager: LoginManager,
     *,
@@ -183,13 +201,19 @@ def task_list(
     filter_requested_before: str,
     filter_completed_after: str,
     filter_completed_before: str,
+    local: bool,
 ) -> None:
     """
     List tasks for the current user.
 
     This lists your most recent tasks. The tasks displayed may be filtered by a number
     of attributes, each with a separate commandline option.
+
+    With '--local', tasks are listed from the index kept by 'globus task sync', which
+    works offline and is not limited to your 1000 most recent tasks.
     """
+    from globus_sdk.scopes import TransferScopes
+
     from globus_cli.services.transfer import iterable_response_to_dict
 
     # make filter string
@@ -223,14 +247,24 @@ def task_list(
 
     filter_string = "/".join(p for p in filter_parts if p is not None)
 
-    transfer_client = login_manager.get_transfer_client()
-    paginator = Paginator.wrap(transfer_client.task_list)
-    task_iterator = PagingWrapper(
-        paginator(
-            filter=filter_string, query_params={"orderby": "request_time DESC"}
-        ).items(),
-        limit=limit,
-    )
+    task_iterator: t.Iterable[t.Any]
+    if local:
+        from globus_cli.services.task_index import get_task_index
+
+        index = get_task_index()
+        if index is None:
+            raise click.ClickException("The local task index could not be opened.")
+        task_iterator = index.query(filter_string, limit=limit)
+    else:
+        login_manager.assert_logins(TransferScopes.resource_server)
+        transfer_client = login_manager.get_transfer_client()
+        paginator = Paginator.wrap(transfer_client.task_list)
+        task_iterator = PagingWrapper(
+            paginator(
+                filter=filter_string, query_params={"orderby": "request_time DESC"}
+            ),
+            limit=limit,
+        )
 
     fields = [
         Field("Task ID", "task_id"),
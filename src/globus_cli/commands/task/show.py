@@ -9,6 +9,7 @@ from globus_sdk.paging import Paginator
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, mutex_option_group
 from globus_cli.termio import Field, display
+from globus_cli.utils import prefetch_items
 
 from ._common import task_id_arg
 
@@ -71,7 +72,7 @@ def print_successful_transfers(
     from globus_cli.services.transfer import iterable_response_to_dict
 
     paginator = Paginator.wrap(client.task_successful_transfers)
-    res = paginator(task_id).items()
+    res = prefetch_items(paginator(task_id))
     display(
         res,
         fields=SUCCESSFULL_TRANSFER_FIELDS,
@@ -83,7 +84,7 @@ def print_skipped_errors(client: globus_sdk.TransferClient, task_id: uuid.UUID)
     from globus_cli.services.transfer import iterable_response_to_dict
 
     paginator = Paginator.wrap(client.task_skipped_errors)
-    res = paginator(task_id).items()
+    res = prefetch_items(paginator(task_id))
     display(
         res,
         fields=SKIPPED_PATHS_FIELDS,
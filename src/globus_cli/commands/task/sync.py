@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import typing as t
+
+import click
+
+from globus_cli.login_manager import LoginManager
+from globus_cli.parsing import command
+from globus_cli.termio import Field, display
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+    from globus_cli.services.task_index import TaskIndex
+
+# Transfer returns at most this many tasks for any one filter, so a longer history is
+# read in windows of time
+TASK_LIST_MAX_RESULTS = 1000
+
+
+def _tasks_since(
+    transfer_client: globus_sdk.TransferClient,
+    time_field: str,
+    since: str | None,
+    filter_parts: t.Sequence[str] = (),
+) -> t.Iterator[dict[str, t.Any]]:
+    """
+    Get the tasks whose `time_field` is at or after `since`, oldest first.
+
+    Each query is ordered by the time field, so when a query reaches the result limit,
+    the next one starts from the last time which was seen. Tasks at that time are
+    seen twice, which is harmless because the index replaces them.
+    """
+    from globus_cli.services.task_index import normalize_time
+
+    while True:
+        filter_string = "/".join(
+            [
+                "type:TRANSFER,DELETE",
+                *filter_parts,
+                *([f"{time_field}:{since},"] if since else []),
+            ]
+        )
+        response = transfer_client.task_list(
+            filter=filter_string,
+            orderby=f"{time_field} ASC",
+            limit=TASK_LIST_MAX_RESULTS,
+        )
+        tasks = [dict(task) for task in response]
+        yield from tasks
+
+        if len(tasks) < TASK_LIST_MAX_RESULTS:
+            return
+        last_seen = normalize_time(tasks[-1].get(time_field))
+        # if a whole window of tasks shares one time, there is no way to page past it
+        if last_seen is None or last_seen == since:
+            return
+        since = last_seen
+
+
+def sync_task_index(
+    transfer_client: globus_sdk.TransferClient, index: TaskIndex
+) -> tuple[int, int]:
+    """
+    Bring the task index up to date, fetching only the tasks which may have changed.
+
+    That is
+    - tasks requested since the most recently requested task in the index
+    - tasks completed since the oldest unfinished task in the index was requested
+    - tasks which are still unfinished, whose status may have changed (e.g. from
+      ACTIVE to INACTIVE) without them completing
+
+    :returns: The number of tasks added to the index, and the number updated
+    """
+    from globus_cli.services.task_index import UNFINISHED_STATUSES
+
+    # the cursors are read before anything is fetched, so that each query starts from
+    # the state of the index as of the last sync
+    request_cursor = index.latest_request_time()
+    completion_cursor = index.earliest_unfinished_request_time()
+
+    added, updated = index.upsert(
+        _tasks_since(transfer_client, "request_time", request_cursor)
+    )
+    if completion_cursor is not None:
+        for tasks in (
+            _tasks_since(transfer_client, "completion_time", completion_cursor),
+            _tasks_since(
+                transfer_client,
+                "request_time",
+                completion_cursor,
+                [f"status:{','.join(UNFINISHED_STATUSES)}"],
+            ),
+        ):
+            more_added, more_updated = index.upsert(tasks)
+            added += more_added
+            updated += more_updated
+    return added, updated
+
+
+@command(
+    "sync",
+    short_help="Update the local index of your tasks.",
+    adoc_output="""When text output is requested, the following fields are used:
+
+- 'Added'
+- 'Updated'
+- 'Indexed Tasks'
+""",
+    adoc_examples="""Update the index, and then list failed tasks from it:
+
+[source,bash]
+----
+$ globus task sync
+$ globus task list --local --filter-status FAILED --limit 100
+----
+""",
+)
+@click.option(
+    "--full",
+    is_flag=True,
+    help="Discard the index and rebuild it from your whole task history.",
+)
+@LoginManager.requires_login("transfer")
+def task_sync(login_manager: LoginManager, *, full: bool) -> None:
+    """
+    Update the local index of your tasks, which can be listed with
+    'globus task list --local'.
+
+    The first sync reads your whole task history. After that, only tasks which are
+    new, or which may have changed since the last sync, are read.
+    """
+    from globus_cli.services.task_index import get_task_index
+
+    index = get_task_index()
+    if index is None:
+        raise click.ClickException("The local task index could not be opened.")
+    if full:
+        index.clear()
+
+    transfer_client = login_manager.get_transfer_client()
+    added, updated = sync_task_index(transfer_client, index)
+
+    display(
+        {"added": added, "updated": updated, "total": len(index)},
+        text_mode=display.RECORD,
+        fields=[
+            Field("Added", "added"),
+            Field("Updated", "updated"),
+            Field("Indexed Tasks", "total"),
+        ],
+    )
@@ -2,22 +2,27 @@ from __future__ import annotations
 
 import uuid
 
+import click
+
 from globus_cli.login_manager import LoginManager
 from globus_cli.parsing import command, synchronous_task_wait_options
 
-from .._common import transfer_task_wait_with_io
-from ._common import task_id_arg
+from .._common import transfer_tasks_wait_with_io
 
 
 @command(
     "wait",
-    short_help="Wait for a task to complete.",
+    short_help="Wait for one or more tasks to complete.",
     adoc_output="""
 When text output is requested, no output is written to standard out. All output
 is written to standard error.
 
 When JSON output is requested, the standard error output remains, but the task
 status after waiting will be sent to stdout.
+
+When waiting on multiple tasks, the status of each task is sent to stdout: as a
+table for text output, and as a list of task documents under the key `DATA` for
+JSON output.
 """,
     adoc_examples="""
 Wait 30 seconds for a task to complete, printing heartbeats to stderr and
@@ -34,9 +39,18 @@ Wait for a task without limit, silently, polling every 5 minutes:
 ----
 $ globus task wait --polling-interval 300 TASK_ID
 ----
+
+Wait up to an hour for several tasks at once:
+
+[source,bash]
+----
+$ globus task wait --timeout 3600 TASK_ID1 TASK_ID2 TASK_ID3
+----
 """,
 )
-@task_id_arg()
+@click.argument(
+    "TASK_IDS", metavar="TASK_ID...", type=click.UUID, nargs=-1, required=True
+)
 @synchronous_task_wait_options
 @LoginManager.requires_login("transfer")
 def task_wait(
@@ -45,26 +59,30 @@ def task_wait(
     meow: bool,
     heartbeat: bool,
     polling_interval: int,
+    max_polling_interval: int | None,
     timeout: int | None,
-    task_id: uuid.UUID,
+    task_ids: tuple[uuid.UUID, ...],
     timeout_exit_code: int,
 ) -> None:
     """
-    Wait for a task to complete.
+    Wait for one or more tasks to complete.
 
     This command waits until the timeout is reached, checking every 'M' seconds
-    (where 'M' is the polling interval).
+    (where 'M' is the polling interval). When multiple tasks are given, they are
+    all checked at the same time.
 
-    If the task succeeds by then, it exits with status 0. Otherwise, it exits with
-    status 1.
+    If all of the tasks succeed by then, it exits with status 0. If any task fails,
+    it exits with status 1. Otherwise, some tasks have yet to complete, and it
+    exits with the '--timeout-exit-code' status.
     """
     transfer_client = login_manager.get_transfer_client()
-    transfer_task_wait_with_io(
+    transfer_tasks_wait_with_io(
         transfer_client,
         meow,
         heartbeat,
         polling_interval,
         timeout,
-        task_id,
+        task_ids,
         timeout_exit_code,
+        max_polling_interval=max_polling_interval,
     )
@@ -34,9 +34,11 @@ CREATE_FORMAT_FIELDS = [
 ]
 
 
+# the members are quoted so that the SDK's timer payloads (and with them, the SDK's
+# transport layer) are not imported whenever a timer command is loaded
 TimerSchedule: TypeAlias = t.Union[
-    globus_sdk.RecurringTimerSchedule,
-    globus_sdk.OnceTimerSchedule,
+    "globus_sdk.RecurringTimerSchedule",
+    "globus_sdk.OnceTimerSchedule",
 ]
 
 
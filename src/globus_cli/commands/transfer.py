@@ -15,6 +15,7 @@ from globus_cli.parsing import (
     encrypt_data_option,
     fail_on_quota_errors_option,
     filter_rule_options,
+    max_items_per_task_option,
     mutex_option_group,
     preserve_timestamp_option,
     skip_source_errors_option,
@@ -27,6 +28,8 @@ from globus_cli.parsing import (
 from globus_cli.termio import Field, display
 from globus_cli.utils import make_dict_json_serializable
 
+from ._common import display_task_submissions
+
 
 @command(
     "transfer",
@@ -134,6 +137,13 @@ fi
 @task_submission_options
 @sync_level_option(aliases=("-s",))
 @transfer_batch_option
+@max_items_per_task_option(
+    extra_help=(
+        "With --include or --exclude, no task is submitted until an item with "
+        "--recursive has been read, and the rules are only sent with tasks which "
+        "have recursive items."
+    )
+)
 @transfer_recursive_option
 @preserve_timestamp_option(aliases=("--preserve-mtime",))
 @verify_checksum_option
@@ -207,6 +217,7 @@ def transfer_command(
     login_manager: LoginManager,
     *,
     batch: t.TextIO | None,
+    max_items_per_task: int | None,
     sync_level: (
         t.Literal["exists", "size", "mtime", "checksum"] | globus_sdk.MissingType
     ),
@@ -281,6 +292,10 @@ def transfer_command(
     If you use `--batch` and a commandline SOURCE_PATH and/or DEST_PATH, these
     paths will be used as dir prefixes to any paths read from the `--batch` input.
 
+    Use `--max-items-per-task` to split very large batches into multiple tasks.
+    Each task is submitted as soon as it is full, and the IDs of all of the
+    tasks are reported.
+
     \b
     === Sync Levels
 
@@ -318,7 +333,10 @@ def transfer_command(
     For example, `globus transfer --include "*.txt" --exclude "*" ...` will
     only transfer files ending in .txt found within the directory structure.
     """
-    from globus_cli.services.transfer import add_batch_to_transfer_data
+    from globus_cli.services.transfer import (
+        ChunkedTaskSubmission,
+        add_batch_to_transfer_data,
+    )
 
     transfer_client = login_manager.get_transfer_client()
 
@@ -367,74 +385,110 @@ def transfer_command(
         if v is not None
     }
 
-    transfer_data = globus_sdk.TransferData(
-        source_endpoint=source_endpoint,
-        destination_endpoint=dest_endpoint,
-        label=label,
-        sync_level=sync_level,
-        verify_checksum=verify_checksum,
-        preserve_timestamp=preserve_timestamp,
-        encrypt_data=encrypt_data,
-        submission_id=submission_id,
-        deadline=deadline,
-        skip_source_errors=skip_source_errors,
-        fail_on_quota_errors=fail_on_quota_errors,
-        delete_destination_extra=(delete or delete_destination_extra),
-        source_local_user=source_local_user,
-        destination_local_user=destination_local_user,
-        additional_fields={**perf_opts, **notify},
-    )
-
-    for rule in filter_rules:
-        method, name = rule
-        transfer_data.add_filter_rule(method=method, name=name, type="file")
+    if max_items_per_task is not None:
+        if not batch:
+            raise click.UsageError(
+                "`--max-items-per-task` can only be used with `--batch`."
+            )
+        if submission_id is not globus_sdk.MISSING:
+            raise click.UsageError(
+                "You cannot use `--submission-id` in addition to "
+                "`--max-items-per-task`, because a batch may be split into "
+                "multiple tasks."
+            )
 
-    if batch:
-        add_batch_to_transfer_data(
-            cmd_source_path, cmd_dest_path, checksum_algorithm, transfer_data, batch
+    def make_transfer_data() -> globus_sdk.TransferData:
+        transfer_data = globus_sdk.TransferData(
+            source_endpoint=source_endpoint,
+            destination_endpoint=dest_endpoint,
+            label=label,
+            sync_level=sync_level,
+            verify_checksum=verify_checksum,
+            preserve_timestamp=preserve_timestamp,
+            encrypt_data=encrypt_data,
+            submission_id=submission_id,
+            deadline=deadline,
+            skip_source_errors=skip_source_errors,
+            fail_on_quota_errors=fail_on_quota_errors,
+            delete_destination_extra=(delete or delete_destination_extra),
+            source_local_user=source_local_user,
+            destination_local_user=destination_local_user,
+            additional_fields={**perf_opts, **notify},
         )
-    else:
-        if cmd_source_path is None or cmd_dest_path is None:
+
+        for rule in filter_rules:
+            method, name = rule
+            transfer_data.add_filter_rule(method=method, name=name, type="file")
+        return transfer_data
+
+    def submit_transfer(
+        transfer_data: globus_sdk.TransferData,
+    ) -> globus_sdk.GlobusHTTPResponse:
+        # when a batch is split into multiple tasks, some of them may have no
+        # recursive items, and filter rules do not apply to them
+        # (the input as a whole was checked for recursive items before any task
+        # is submitted)
+        if filter_rules and not _has_recursive_items(transfer_data):
+            del transfer_data["filter_rules"]
+        return transfer_client.submit_transfer(transfer_data)
+
+    with ChunkedTaskSubmission(
+        make_transfer_data,
+        submit_transfer,
+        # a dry run shows every item, rather than submitting tasks
+        max_items=None if dry_run else max_items_per_task,
+        # filter rules require a recursive item, so tasks are not submitted until
+        # one has been found
+        hold_until=_has_recursive_items if filter_rules else None,
+    ) as submission:
+        if batch:
+            add_batch_to_transfer_data(
+                cmd_source_path, cmd_dest_path, checksum_algorithm, submission, batch
+            )
+        else:
+            if cmd_source_path is None or cmd_dest_path is None:
+                raise click.UsageError(
+                    "Transfer requires either `SOURCE_PATH` and `DEST_PATH` or "
+                    "`--batch`"
+                )
+            submission.add_item(
+                cmd_source_path,
+                cmd_dest_path,
+                external_checksum=external_checksum,
+                checksum_algorithm=checksum_algorithm,
+                recursive=recursive,
+            )
+
+        # if no task has been submitted yet, none of the items read so far was
+        # recursive, except possibly those in the task which is not yet full
+        if (
+            filter_rules
+            and submission.holding
+            and not _has_recursive_items(submission.data)
+        ):
             raise click.UsageError(
-                "Transfer requires either `SOURCE_PATH` and `DEST_PATH` or `--batch`"
+                "`--include` and `--exclude` can only be used with `--recursive` "
+                "transfers"
             )
-        transfer_data.add_item(
-            cmd_source_path,
-            cmd_dest_path,
-            external_checksum=external_checksum,
-            checksum_algorithm=checksum_algorithm,
-            recursive=recursive,
-        )
 
-    for item in transfer_data["DATA"]:
-        if item.get("recursive"):
-            has_recursive_items = True
-            break
-    else:
-        has_recursive_items = False
+        if dry_run:
+            display(
+                make_dict_json_serializable(submission.data),
+                response_key="DATA",
+                fields=[
+                    Field("Source Path", "source_path"),
+                    Field("Dest Path", "destination_path"),
+                    Field("Recursive", "recursive"),
+                    Field("External Checksum", "external_checksum"),
+                ],
+            )
+            # exit safely
+            return
 
-    if filter_rules and not has_recursive_items:
-        raise click.UsageError(
-            "`--include` and `--exclude` can only be used with `--recursive` transfers"
-        )
+        results = submission.submit()
 
-    if dry_run:
-        display(
-            make_dict_json_serializable(transfer_data),
-            response_key="DATA",
-            fields=[
-                Field("Source Path", "source_path"),
-                Field("Dest Path", "destination_path"),
-                Field("Recursive", "recursive"),
-                Field("External Checksum", "external_checksum"),
-            ],
-        )
-        # exit safely
-        return
-
-    res = transfer_client.submit_transfer(transfer_data)
-    display(
-        res,
-        text_mode=display.RECORD,
-        fields=[Field("Message", "message"), Field("Task ID", "task_id")],
-    )
+    display_task_submissions(results)
+
+
+def _has_recursive_items(transfer_data: globus_sdk.TransferData) -> bool:
+    return any(item.get("recursive") for item in transfer_data["DATA"])
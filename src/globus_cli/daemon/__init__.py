@@ -0,0 +1,21 @@
+"""
+The Globus CLI daemon: a long-lived process which runs commands on behalf of
+short-lived ones.
+
+A CLI process which finds `GLOBUS_CLI_DAEMON_SOCKET` set connects to the daemon
+listening on that socket, and hands it the command line, working directory,
+environment, and standard streams. The daemon forks a process for the command,
+which runs it exactly as the client would have, writing directly to the client's
+streams, and replies with the exit status. Because the daemon has already
+imported the CLI and SDK, each command skips that startup cost.
+
+If no daemon is listening, or it is busy, the client simply runs the command
+itself.
+
+The client side (`client`) only uses the standard library, so that it can run
+before any of the CLI is imported.
+"""
+
+from .client import LOCAL_COMMANDS, SOCKET_ENV_VAR, forward_to_daemon
+
+__all__ = ("LOCAL_COMMANDS", "SOCKET_ENV_VAR", "forward_to_daemon")
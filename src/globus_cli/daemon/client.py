@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import socket
+import sys
+import typing as t
+
+SOCKET_ENV_VAR = "GLOBUS_CLI_DAEMON_SOCKET"
+
+# the largest message which will be read, as a guard against a misbehaving peer
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+# how long a client waits for the daemon to answer before running a command itself
+ACCEPT_TIMEOUT = 2.0
+
+# commands which always run in the calling process:
+#   'daemon' manages the daemon itself, 'shell' is a long-lived process of its
+#   own, and 'update' replaces the installed CLI as the process exits
+LOCAL_COMMANDS = frozenset({"daemon", "shell", "update"})
+
+
+class DaemonProtocolError(Exception):
+    """
+    The daemon or client sent something which could not be understood.
+    """
+
+
+def daemon_is_supported() -> bool:
+    """
+    The daemon passes file descriptors over a Unix socket, which is only possible on
+    some platforms.
+    """
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def send_message(
+    sock: socket.socket, message: dict[str, t.Any], fds: t.Sequence[int] = ()
+) -> None:
+    data = json.dumps(message).encode("utf-8") + b"\n"
+    if fds:
+        # the descriptors travel with the first part of the message
+        sent = socket.send_fds(sock, [data], list(fds))
+        data = data[sent:]
+    if data:
+        sock.sendall(data)
+
+
+def recv_message(
+    sock: socket.socket, *, max_fds: int = 0
+) -> tuple[dict[str, t.Any], list[int]]:
+    """
+    Read one message, and any file descriptors which were sent with it.
+
+    :raises DaemonProtocolError: if the connection is closed before a complete
+        message is read, or the message is malformed
+    """
+    if max_fds:
+        data, fds, _flags, _addr = socket.recv_fds(sock, 65536, max_fds)
+    else:
+        data, fds = sock.recv(65536), []
+
+    buffer = bytearray(data)
+    while data and not buffer.endswith(b"\n"):
+        if len(buffer) > MAX_MESSAGE_SIZE:
+            raise DaemonProtocolError("message too large")
+        data = sock.recv(65536)
+        buffer += data
+    if not buffer.endswith(b"\n"):
+        raise DaemonProtocolError("connection closed before a complete message")
+
+    try:
+        message = json.loads(buffer)
+    except ValueError as err:
+        raise DaemonProtocolError(f"malformed message: {err}") from err
+    if not isinstance(message, dict):
+        raise DaemonProtocolError("malformed message: not an object")
+    return message, fds
+
+
+def connect(socket_path: str) -> socket.socket | None:
+    """
+    Connect to the daemon, or return None if there is no daemon listening.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def connect_when_ready(socket_path: str, *, timeout: float) -> socket.socket | None:
+    """
+    Connect to the daemon, and wait for it to be ready for a request.
+
+    The daemon answers each connection before reading the request on it, so a
+    client which gives up waiting knows that its request was never seen.
+
+    :param timeout: How many seconds to wait for the daemon
+    :returns: The connection, or None if there is no daemon listening or it does
+        not answer in time
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+        greeting, _ = recv_message(sock)
+    except (OSError, DaemonProtocolError):
+        sock.close()
+        return None
+    if greeting.get("status") != "ready":
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def request(
+    socket_path: str, message: dict[str, t.Any], *, timeout: float | None = 10.0
+) -> dict[str, t.Any] | None:
+    """
+    Send a simple request (e.g. "ping" or "stop") to the daemon and return its
+    reply, or None if there is no daemon listening.
+
+    :raises OSError: if the daemon does not reply within the timeout
+    """
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+    with sock:
+        sock.settimeout(timeout)
+        # the daemon's answer to the connection
+        recv_message(sock)
+        send_message(sock, message)
+        reply, _ = recv_message(sock)
+    return reply
+
+
+def forward_to_daemon(
+    argv: list[str], *, timeout: float = ACCEPT_TIMEOUT
+) -> int | None:
+    """
+    Run a command line in the daemon, if one is in use.
+
+    Commands in `LOCAL_COMMANDS` should not be passed here.
+
+    The daemon is used when `GLOBUS_CLI_DAEMON_SOCKET` is set and a daemon is
+    listening on that socket, unless it does not answer within `timeout` seconds
+    or is already running as many commands as it allows.
+
+    Ctrl-C interrupts the command in the daemon, as it would have done here. A
+    second Ctrl-C stops waiting for it.
+
+    :param argv: The arguments to the `globus` command
+    :returns: The exit status of the command, or None if the command was not run
+        by the daemon and should be run by the caller instead
+    """
+    socket_path = os.environ.get(SOCKET_ENV_VAR)
+    if not socket_path or not daemon_is_supported():
+        return None
+    # shell completion depends on the calling shell, so it always runs locally
+    if "_GLOBUS_COMPLETE" in os.environ:
+        return None
+
+    sock = connect_when_ready(socket_path, timeout=timeout)
+    if sock is None:
+        return None
+
+    with sock:
+        # anything already written must appear before the command's output
+        sys.stdout.flush()
+        sys.stderr.flush()
+        try:
+            send_message(
+                sock,
+                {
+                    "op": "run",
+                    "argv": argv,
+                    "cwd": os.getcwd(),
+                    "env": dict(os.environ),
+                },
+                fds=[0, 1, 2],
+            )
+        # e.g. one of the standard streams is closed
+        except OSError:
+            return None
+
+        interrupted = False
+        while True:
+            try:
+                reply, _ = recv_message(sock)
+                break
+            except KeyboardInterrupt:
+                if interrupted:
+                    return 130
+                # closing our side of the connection tells the daemon to interrupt
+                # the command, which still replies with its exit status
+                interrupted = True
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_WR)
+            except (OSError, DaemonProtocolError) as err:
+                # the command may have partially run, so it must not be run again
+                print(
+                    f"Lost contact with the Globus CLI daemon: {err}", file=sys.stderr
+                )
+                return 1
+
+    if reply.get("status") in ("rejected", "busy"):
+        return None
+    return int(reply.get("exit_code", 1))
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+import typing as t
+
+from .client import (
+    SOCKET_ENV_VAR,
+    DaemonProtocolError,
+    connect,
+    recv_message,
+    send_message,
+)
+
+log = logging.getLogger(__name__)
+
+CommandRunner = t.Callable[[t.List[str]], int]
+
+# how often the daemon checks whether it should stop, and for finished commands
+POLL_INTERVAL = 0.5
+# how long the daemon waits for a request, once a client has connected
+REQUEST_TIMEOUT = 5.0
+# the most commands which the daemon runs at once -- beyond this, it is busy, and
+# clients run their commands themselves
+DEFAULT_MAX_COMMANDS = 8
+
+
+class DaemonAlreadyRunningError(Exception):
+    pass
+
+
+class DaemonServer:
+    """
+    Listen on a Unix socket and run the commands sent by clients.
+
+    Each command runs in a process of its own, forked from the daemon, so that it
+    can take on the client's working directory, environment, and standard streams,
+    and so that commands can run at the same time.
+
+    :param socket_path: The path of the socket to listen on
+    :param idle_timeout: Stop after this many seconds without a request or a
+        running command, or never if None
+    :param max_commands: The most commands to run at once. Beyond this, clients are
+        told that the daemon is busy.
+    :param runner: The function which runs a command line and returns its exit
+        status. By default, this is the CLI itself.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        *,
+        idle_timeout: float | None = None,
+        max_commands: int = DEFAULT_MAX_COMMANDS,
+        runner: CommandRunner | None = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.max_commands = max_commands
+        self._runner = runner or run_cli
+        # commands are only run for clients with the same configuration as the
+        # daemon, since much of it is read once, when the CLI is first imported
+        self._config = _config_env(os.environ)
+
+        self._sock: socket.socket | None = None
+        self._stopping = False
+        # the process IDs of the commands which are running
+        self._commands: set[int] = set()
+
+    def bind(self) -> None:
+        """
+        Create the socket, which only the current user may connect to.
+
+        :raises DaemonAlreadyRunningError: if a daemon is already listening on the
+            socket
+        """
+        if os.path.exists(self.socket_path):
+            existing = connect(self.socket_path)
+            if existing is not None:
+                existing.close()
+                raise DaemonAlreadyRunningError(self.socket_path)
+            # left behind by a daemon which did not exit cleanly
+            os.unlink(self.socket_path)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o077)
+        try:
+            sock.bind(self.socket_path)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        sock.listen()
+        self._sock = sock
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.socket_path)
+
+    def serve_forever(self) -> None:
+        """
+        Handle requests until asked to stop, or the idle timeout is reached.
+
+        Commands which are running when the daemon stops are allowed to finish.
+        """
+        if self._sock is None:
+            self.bind()
+        assert self._sock is not None
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._handle_sigterm)
+        idle_since = time.monotonic()
+        try:
+            while not self._stopping:
+                self._reap_commands()
+                if self._commands:
+                    idle_since = time.monotonic()
+
+                timeout = POLL_INTERVAL
+                if self.idle_timeout is not None:
+                    remaining = idle_since + self.idle_timeout - time.monotonic()
+                    if remaining <= 0:
+                        log.debug("daemon idle timeout reached, stopping")
+                        break
+                    timeout = min(timeout, remaining)
+                self._sock.settimeout(timeout)
+
+                try:
+                    conn, _ = self._sock.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    conn.settimeout(REQUEST_TIMEOUT)
+                    self._handle_connection(conn)
+                idle_since = time.monotonic()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def _handle_sigterm(self, signum: int, frame: t.Any) -> None:
+        self._stopping = True
+
+    def _reap_commands(self) -> None:
+        for pid in list(self._commands):
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished = pid
+            if finished:
+                self._commands.discard(pid)
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        # the client only sends its request once the daemon has answered, so that
+        # a client which gives up waiting can run the command itself, knowing that
+        # the daemon will not also run it
+        try:
+            send_message(conn, {"status": "ready"})
+            message, fds = recv_message(conn, max_fds=3)
+        except (OSError, DaemonProtocolError) as err:
+            log.debug("bad request to daemon: %s", err)
+            return
+
+        try:
+            op = message.get("op")
+            if op == "ping":
+                reply: dict[str, t.Any] | None = {"status": "ok", "pid": os.getpid()}
+            elif op == "stop":
+                self._stopping = True
+                reply = {"status": "ok"}
+            elif op == "run":
+                reply = self._handle_run(conn, message, fds)
+            else:
+                reply = {"status": "error", "reason": f"unknown op: {op!r}"}
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+        # a command which was started replies for itself
+        if reply is None:
+            return
+        try:
+            send_message(conn, reply)
+        except OSError as err:
+            log.debug("could not reply to daemon client: %s", err)
+
+    def _handle_run(
+        self, conn: socket.socket, message: dict[str, t.Any], fds: list[int]
+    ) -> dict[str, t.Any] | None:
+        argv, cwd, env = message.get("argv"), message.get("cwd"), message.get("env")
+        if (
+            len(fds) != 3
+            or not isinstance(argv, list)
+            or not isinstance(cwd, str)
+            or not isinstance(env, dict)
+        ):
+            return {"status": "error", "reason": "malformed run request"}
+        if _config_env(env) != self._config:
+            return {
+                "status": "rejected",
+                "reason": "the client's Globus configuration differs from the daemon's",
+            }
+        if len(self._commands) >= self.max_commands:
+            return {"status": "busy"}
+
+        pid = os.fork()
+        if pid == 0:
+            self._run_command(conn, [str(arg) for arg in argv], fds, cwd, env)
+        self._commands.add(pid)
+        return None
+
+    def _run_command(
+        self,
+        conn: socket.socket,
+        argv: list[str],
+        fds: list[int],
+        cwd: str,
+        env: dict[str, str],
+    ) -> t.NoReturn:
+        """
+        Run a command in the process forked for it, and reply with its exit status.
+
+        The command is interrupted, as it would be by Ctrl-C, if the client hangs
+        up or closes its side of the connection.
+        """
+        exit_code = 1
+        try:
+            try:
+                assert self._sock is not None
+                # the socket belongs to the daemon, which removes it when it stops
+                self._sock.close()
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+
+                _take_client_process_state(fds, cwd, env)
+                conn.settimeout(None)
+                threading.Thread(
+                    target=_interrupt_on_hangup, args=(conn,), daemon=True
+                ).start()
+
+                try:
+                    exit_code = self._runner(argv)
+                finally:
+                    # the command is over, so it can no longer be interrupted
+                    signal.signal(signal.SIGINT, signal.SIG_IGN)
+            # interrupted before the command started
+            except KeyboardInterrupt:
+                exit_code = 130
+            except Exception:
+                traceback.print_exc()
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            send_message(conn, {"status": "ok", "exit_code": exit_code})
+        except OSError as err:
+            log.debug("could not reply to daemon client: %s", err)
+        finally:
+            os._exit(0)
+
+
+def _config_env(env: t.Mapping[str, str]) -> dict[str, str]:
+    return {
+        key: value
+        for key, value in env.items()
+        if key.startswith("GLOBUS_") and key != SOCKET_ENV_VAR
+    }
+
+
+def _take_client_process_state(fds: list[int], cwd: str, env: dict[str, str]) -> None:
+    """
+    Take on the client's standard streams, working directory, and environment.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for client_fd, fd in zip(fds, (0, 1, 2)):
+        os.dup2(client_fd, fd)
+        os.close(client_fd)
+    # a fresh reader, so that nothing buffered by the daemon is seen by the command
+    sys.stdin = open(0, closefd=False)
+    os.environ.clear()
+    os.environ.update(env)
+    os.chdir(cwd)
+
+
+def _interrupt_on_hangup(conn: socket.socket) -> None:
+    # the client sends nothing more after its request, so anything received here
+    # (including the end of the connection) means that the command should stop
+    with contextlib.suppress(OSError):
+        conn.recv(1)
+    os.kill(os.getpid(), signal.SIGINT)
+
+
+def run_cli(argv: list[str]) -> int:
+    from globus_cli.commands import main
+
+    return main.run_in_process(argv)
+
+
+def warm_up() -> None:
+    """
+    Import the parts of the CLI and SDK which nearly every command needs.
+    """
+    import click
+    import globus_sdk  # noqa: F401
+
+    from globus_cli.commands import main
+
+    ctx = click.Context(main)
+    for name in main.list_commands(ctx):
+        main.get_command(ctx, name)
+
+
+def run_daemon(
+    socket_path: str,
+    *,
+    idle_timeout: float | None = None,
+    on_ready: t.Callable[[], None] | None = None,
+) -> None:
+    """
+    Run the daemon for the CLI until it is stopped.
+
+    :param on_ready: Called once the daemon is ready to accept commands
+
+    :raises DaemonAlreadyRunningError: if a daemon is already listening on the
+        socket
+    """
+    # nothing is shared with the commands but what is imported here: an open
+    # connection (to the token storage, or to a Globus service) must not be used
+    # by more than one of the processes forked from the daemon
+    server = DaemonServer(socket_path, idle_timeout=idle_timeout)
+    server.bind()
+    try:
+        warm_up()
+        if on_ready is not None:
+            on_ready()
+        server.serve_forever()
+    finally:
+        server.close()
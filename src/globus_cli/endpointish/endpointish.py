@@ -14,24 +14,76 @@ log = logging.getLogger(__name__)
 
 
 class Endpointish:
+    """
+    An endpoint or collection, as described by Transfer.
+
+    :param endpoint_id: The ID of the endpoint or collection
+    :param transfer_client: The client used to look it up
+    :param use_cache: Use a recently cached document for the endpoint, if there is
+        one, rather than looking it up. If the lookup fails with a network or server
+        error, an expired document from the cache is used instead. Only use this
+        where the entity type and addresses are needed, not up-to-date details.
+    """
+
     def __init__(
         self,
         endpoint_id: str | uuid.UUID,
         *,
         transfer_client: globus_sdk.TransferClient,
+        use_cache: bool = False,
     ) -> None:
         self._client = transfer_client
         self.endpoint_id = endpoint_id
 
         log.debug("Endpointish getting ep data")
-        res = self._client.get_endpoint(endpoint_id)
-        self.data = res.data
+        if use_cache:
+            self.data = self._get_data_with_cache()
+        else:
+            self.data = self._client.get_endpoint(endpoint_id).data
         log.debug("Endpointish.data=%s", self.data)
 
         log.debug("Endpointish determine entity type")
         self.entity_type = EntityType.determine_entity_type(self.data)
         log.debug("Endpointish.entity_type=%s", self.entity_type)
 
+    def _get_data_with_cache(self) -> dict[str, t.Any]:
+        from globus_cli.parsing.command_state import caching_is_disabled
+        from globus_cli.services.endpoint_cache import get_endpoint_cache
+
+        endpoint_id = str(self.endpoint_id)
+        cache = get_endpoint_cache()
+        if cache is None:
+            return t.cast(
+                t.Dict[str, t.Any], self._client.get_endpoint(endpoint_id).data
+            )
+
+        # with --no-cache, the cached document is not used, but is still refreshed
+        use_cached = not caching_is_disabled()
+        if use_cached:
+            cached = cache.get(endpoint_id)
+            if cached is not None:
+                log.debug("Endpointish using cached ep data")
+                return cached
+
+        try:
+            data = t.cast(
+                t.Dict[str, t.Any], self._client.get_endpoint(endpoint_id).data
+            )
+        except (globus_sdk.NetworkError, globus_sdk.GlobusAPIError) as err:
+            # client errors (e.g. a deleted endpoint) are never masked by stale data
+            if not use_cached or (
+                isinstance(err, globus_sdk.GlobusAPIError) and err.http_status < 500
+            ):
+                raise
+            stale = cache.get(endpoint_id, allow_stale=True)
+            if stale is None:
+                raise
+            log.warning("could not get ep data (%s), using cached ep data", err)
+            return stale
+
+        cache.set(endpoint_id, data)
+        return data
+
     @property
     def nice_type_name(self) -> str:
         return EntityType.nice_name(self.entity_type)
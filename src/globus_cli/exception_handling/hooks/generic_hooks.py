@@ -5,7 +5,12 @@ import json
 import click
 import globus_sdk
 
-from globus_cli.termio import PrintableErrorField, outformat_is_json, write_error_info
+from globus_cli.termio import (
+    PrintableErrorField,
+    outformat_is_json,
+    outformat_is_jsonl,
+    write_error_info,
+)
 
 from ..registry import sdk_error_handler
 
@@ -21,10 +26,14 @@ def null_data_error_handler(exception: globus_sdk.GlobusAPIError) -> None:
 
 
 @sdk_error_handler(
-    error_class="GlobusAPIError", condition=lambda err: outformat_is_json()
+    error_class="GlobusAPIError",
+    condition=lambda err: outformat_is_json() or outformat_is_jsonl(),
 )
 def json_error_handler(exception: globus_sdk.GlobusAPIError) -> None:
-    msg = json.dumps(exception.raw_json, indent=2)
+    if outformat_is_jsonl():
+        msg = json.dumps(exception.raw_json, separators=(",", ":"))
+    else:
+        msg = json.dumps(exception.raw_json, indent=2)
     click.secho(msg, fg="yellow", err=True)
 
 
@@ -170,6 +170,9 @@ def exchange_code_and_store(
     if not auth_user_data:
         storage.store_well_known_config("auth_user_data", {"sub": sub_new})
     storage.store(tkn)
+    # the login may have granted new consents, so the stored consents are out of date
+    # (this is not done on every `store()`, which also handles token refreshes)
+    storage.clear_consents()
 
 
 def _response_clock_delta(response: globus_sdk.GlobusHTTPResponse) -> float | None:
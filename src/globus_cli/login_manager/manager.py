@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import functools
 import os
 import sys
@@ -47,16 +48,57 @@ else:
 
 P = ParamSpec("P")
 R = t.TypeVar("R")
+ClientT = t.TypeVar("ClientT", bound="globus_sdk.BaseClient")
 
 
 class LoginManager:
+    # a manager which is used by all commands, rather than one for each command
+    # (see `shared()`)
+    _shared: t.ClassVar[LoginManager | None] = None
+
     def __init__(self) -> None:
         self.storage = CLIStorage()
         self._nonstatic_requirements: dict[str, list[Scope]] = {}
+        self._consent_forest: ConsentForest | None = None
+        # whether the consent forest was fetched from Auth by this process
+        self._consent_forest_is_current = False
+        # service clients kept by a shared manager, by resource server, along with
+        # the tokens they were created from
+        self._clients: dict[str, tuple[str | None, globus_sdk.BaseClient]] = {}
 
     def close(self) -> None:
         self.storage.close()
 
+    @classmethod
+    @contextlib.contextmanager
+    def shared(cls) -> t.Iterator[LoginManager]:
+        """
+        Use a single LoginManager for every command which is run in this context.
+
+        This is for running many commands in one process, so that they share one
+        connection to the token storage, and reuse service clients (see
+        `_get_client()`). If a shared manager is already in use, it is used here too.
+        """
+        if cls._shared is not None:
+            yield cls._shared
+            return
+
+        manager = cls()
+        cls._shared = manager
+        try:
+            yield manager
+        finally:
+            cls._shared = None
+            manager.close()
+
+    def _start_command(self) -> None:
+        """
+        Forget any state from a previous command, when the manager is shared.
+        """
+        self._nonstatic_requirements = {}
+        self._consent_forest = None
+        self._consent_forest_is_current = False
+
     def add_requirement(self, rs_name: str, scopes: t.Sequence[Scope]) -> None:
         self._nonstatic_requirements[rs_name] = list(scopes)
 
@@ -113,7 +155,19 @@ class LoginManager:
 
         return self._tokens_meet_auth_requirements(
             resource_server, tokens
-        ) and self._validate_token(tokens["refresh_token"])
+        ) and self._validate_token_with_cache(tokens["refresh_token"])
+
+    def _validate_token_with_cache(self, token: str) -> bool:
+        """
+        Validate a token, unless it was already validated within the last few
+        minutes (see GLOBUS_CLI_TOKEN_VALIDATION_TTL).
+        """
+        if self.storage.token_validation_is_fresh(token):
+            return True
+        if not self._validate_token(token):
+            return False
+        self.storage.record_token_validation(token)
+        return True
 
     def _tokens_meet_auth_requirements(
         self, resource_server: str, tokens: dict[str, t.Any]
@@ -180,14 +234,37 @@ class LoginManager:
         else:
             # If there are dependent scopes all required scope paths are present in the
             #   user's cached consent forest.
-            return self._cached_consent_forest.meets_scope_requirements(required_scopes)
+            if self._get_consent_forest().meets_scope_requirements(required_scopes):
+                return True
+            # consents which were read from storage may be missing any which were
+            # granted since, so check again with the current consents before
+            # declaring the requirements unmet
+            if self._consent_forest_is_current:
+                return False
+            return self._get_consent_forest(refresh=True).meets_scope_requirements(
+                required_scopes
+            )
+
+    def _get_consent_forest(self, *, refresh: bool = False) -> ConsentForest:
+        """
+        Get the user's consent forest.
+
+        Consents are stored alongside the tokens, so that repeated commands need not
+        fetch them. They are fetched from Auth when the stored copy has expired or
+        was removed by a login or logout, or if ``refresh`` is set.
+        """
+        if self._consent_forest is not None and not refresh:
+            return self._consent_forest
 
-    @property
-    @functools.lru_cache(maxsize=1)  # noqa: B019
-    def _cached_consent_forest(self) -> ConsentForest:
         identity_id = self.get_current_identity_id()
+        consents = None if refresh else self.storage.read_consents(identity_id)
+        if consents is None:
+            consents = self.get_auth_client().get_consents(identity_id)["consents"]
+            self.storage.store_consents(identity_id, consents)
+            self._consent_forest_is_current = True
 
-        return self.get_auth_client().get_consents(identity_id).to_forest()
+        self._consent_forest = ConsentForest(consents)
+        return self._consent_forest
 
     def run_login_flow(
         self,
@@ -308,9 +385,13 @@ class LoginManager:
         ) -> t.Callable[P, R]:
             @functools.wraps(func)
             def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                manager = cls()
-                context = click.get_current_context()
-                context.call_on_close(manager.close)
+                if cls._shared is not None:
+                    manager = cls._shared
+                    manager._start_command()
+                else:
+                    manager = cls()
+                    context = click.get_current_context()
+                    context.call_on_close(manager.close)
 
                 manager.assert_logins(*resource_servers)
                 return func(manager, *args, **kwargs)
@@ -369,29 +450,61 @@ class LoginManager:
                 on_refresh=self.storage.store,
             )
 
+    def _get_client(
+        self,
+        resource_server: str,
+        client_class: type[ClientT],
+    ) -> ClientT:
+        """
+        Create a client for one of the CLI's core services.
+
+        A shared manager keeps the client for later commands, for as long as the
+        stored tokens for the resource server are the same as when it was created.
+        Reusing a client keeps its authorizer, and so any access token which it has
+        refreshed.
+        """
+        if self is not type(self)._shared:
+            return self._make_client(resource_server, client_class)
+
+        tokens = self.storage.adapter.get_token_data(resource_server)
+        token_key: str | None = None
+        if tokens is not None:
+            token_key = tokens["refresh_token"] or tokens["access_token"]
+        if resource_server in self._clients:
+            cached_key, client = self._clients[resource_server]
+            if cached_key == token_key:
+                return t.cast(ClientT, client)
+
+        client = self._make_client(resource_server, client_class)
+        self._clients[resource_server] = (token_key, client)
+        return client
+
+    def _make_client(
+        self, resource_server: str, client_class: type[ClientT]
+    ) -> ClientT:
+        authorizer = self._get_client_authorizer(resource_server)
+        return _rate_limited(
+            client_class(authorizer=authorizer, app_name=version.app_name)
+        )
+
     def get_transfer_client(self) -> CustomTransferClient:
         from ..services.transfer import CustomTransferClient
 
-        authorizer = self._get_client_authorizer(TransferScopes.resource_server)
-        return CustomTransferClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_client(TransferScopes.resource_server, CustomTransferClient)
 
     def get_auth_client(self) -> CustomAuthClient:
         from ..services.auth import CustomAuthClient
 
-        authorizer = self._get_client_authorizer(AuthScopes.resource_server)
-        return CustomAuthClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_client(AuthScopes.resource_server, CustomAuthClient)
 
     def get_groups_client(self) -> globus_sdk.GroupsClient:
-        authorizer = self._get_client_authorizer(GroupsScopes.resource_server)
-        return globus_sdk.GroupsClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_client(GroupsScopes.resource_server, globus_sdk.GroupsClient)
 
     def get_flows_client(self) -> globus_sdk.FlowsClient:
-        authorizer = self._get_client_authorizer(FlowsScopes.resource_server)
-        return globus_sdk.FlowsClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_client(FlowsScopes.resource_server, globus_sdk.FlowsClient)
 
     def get_search_client(self) -> globus_sdk.SearchClient:
-        authorizer = self._get_client_authorizer(SearchScopes.resource_server)
-        return globus_sdk.SearchClient(authorizer=authorizer, app_name=version.app_name)
+        return self._get_client(SearchScopes.resource_server, globus_sdk.SearchClient)
 
     def get_timer_client(
         self, *, flow_id: uuid.UUID | None = None
@@ -402,9 +515,12 @@ class LoginManager:
         """
         if flow_id:
             self._assert_requester_has_timer_flow_consent(flow_id)
-
-        authorizer = self._get_client_authorizer(TimersScopes.resource_server)
-        return globus_sdk.TimersClient(authorizer=authorizer, app_name=version.app_name)
+            # the flow's scope is required, so a client for another flow (or for
+            # no flow) cannot be reused
+            return self._make_client(
+                TimersScopes.resource_server, globus_sdk.TimersClient
+            )
+        return self._get_client(TimersScopes.resource_server, globus_sdk.TimersClient)
 
     def _assert_requester_has_timer_flow_consent(self, flow_id: uuid.UUID) -> None:
         flow_scope = SpecificFlowScopes(flow_id).user
@@ -429,10 +545,14 @@ class LoginManager:
         transfer_client = self.get_transfer_client()
 
         if collection_id is not None:
-            epish = Endpointish(collection_id, transfer_client=transfer_client)
+            epish = Endpointish(
+                collection_id, transfer_client=transfer_client, use_cache=True
+            )
             resolved_ep_id = epish.get_collection_endpoint_id()
         elif endpoint_id is not None:
-            epish = Endpointish(endpoint_id, transfer_client=transfer_client)
+            epish = Endpointish(
+                endpoint_id, transfer_client=transfer_client, use_cache=True
+            )
             epish.assert_entity_type(EntityType.GCSV5_ENDPOINT)
             resolved_ep_id = str(endpoint_id)
         else:  # pragma: no cover
@@ -463,7 +583,7 @@ class LoginManager:
                 f"Try login with '--flow {flow_id}' to fix."
             ),
         )
-        return client
+        return _rate_limited(client)
 
     def get_gcs_client(
         self,
@@ -531,11 +651,13 @@ class LoginManager:
                 f"Please run:\n\n  {login_context.login_command}\n"
             ),
         )
-        return CustomGCSClient(
-            epish.get_gcs_address(),
-            source_epish=epish,
-            authorizer=authorizer,
-            app_name=version.app_name,
+        return _rate_limited(
+            CustomGCSClient(
+                epish.get_gcs_address(),
+                source_epish=epish,
+                authorizer=authorizer,
+                app_name=version.app_name,
+            )
         )
 
     def get_current_identity_id(self) -> str:
@@ -552,3 +674,13 @@ class LoginManager:
             )
             sub: str = user_data["sub"]
             return sub
+
+
+def _rate_limited(client: ClientT) -> ClientT:
+    """
+    Share the client-side rate limiter for the client's service with the client.
+    """
+    from ..services.rate_limit import install_rate_limiter
+
+    install_rate_limiter(client)
+    return client
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import functools
+import hashlib
 import os
-import sys
+import threading
+import time
 import typing as t
 
+import click
 import globus_sdk
 from globus_sdk.token_storage.legacy import SQLiteAdapter
 
+from globus_cli.utils import ensure_data_dir
+
 from ._old_config import invalidate_old_config
 from .client_login import get_client_login, is_client_login
 from .scopes import CURRENT_SCOPE_CONTRACT_VERSION
@@ -15,6 +20,81 @@ from .scopes import CURRENT_SCOPE_CONTRACT_VERSION
 # env vars used throughout this module
 GLOBUS_ENV = os.environ.get("GLOBUS_SDK_ENVIRONMENT")
 
+# the default number of seconds for which a successful token validation is trusted
+DEFAULT_TOKEN_VALIDATION_TTL = 300
+# the number of seconds for which a user's consents are read from storage rather
+# than fetched from Auth
+CONSENTS_TTL = 3600
+
+
+class ThreadSafeSQLiteAdapter(SQLiteAdapter):
+    """
+    A SQLiteAdapter whose connection may be used from any thread.
+
+    Tokens may be refreshed, and therefore stored, by the threads which fetch
+    results in the background, so every use of the connection is serialized.
+    """
+
+    def __init__(
+        self,
+        dbname: str,
+        *,
+        namespace: str = "DEFAULT",
+        connect_params: dict[str, t.Any] | None = None,
+    ) -> None:
+        self._lock = threading.RLock()
+        super().__init__(
+            dbname,
+            namespace=namespace,
+            connect_params={**(connect_params or {}), "check_same_thread": False},
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            super().close()
+
+    def store_config(
+        self, config_name: str, config_dict: t.Mapping[str, t.Any]
+    ) -> None:
+        with self._lock:
+            super().store_config(config_name, config_dict)
+
+    def read_config(self, config_name: str) -> dict[str, t.Any] | None:
+        with self._lock:
+            return super().read_config(config_name)
+
+    def remove_config(self, config_name: str) -> bool:
+        with self._lock:
+            return super().remove_config(config_name)
+
+    def store(self, token_response: globus_sdk.OAuthTokenResponse) -> None:
+        with self._lock:
+            super().store(token_response)
+
+    def get_token_data(self, resource_server: str) -> dict[str, t.Any] | None:
+        with self._lock:
+            return super().get_token_data(resource_server)
+
+    def get_by_resource_server(self) -> dict[str, t.Any]:
+        with self._lock:
+            return super().get_by_resource_server()
+
+    def remove_tokens_for_resource_server(self, resource_server: str) -> bool:
+        with self._lock:
+            return super().remove_tokens_for_resource_server(resource_server)
+
+    def iter_namespaces(
+        self, *, include_config_namespaces: bool = False
+    ) -> t.Iterator[str]:
+        # the namespaces are read up front, so that the lock is not held between items
+        with self._lock:
+            namespaces = list(
+                super().iter_namespaces(
+                    include_config_namespaces=include_config_namespaces
+                )
+            )
+        return iter(namespaces)
+
 
 class CLIStorage:
     """
@@ -32,7 +112,7 @@ class CLIStorage:
         if not os.path.exists(fname):
             invalidate_old_config(self.cli_native_client)
 
-        return SQLiteAdapter(fname, namespace=_resolve_namespace())
+        return ThreadSafeSQLiteAdapter(fname, namespace=_resolve_namespace())
 
     def close(self) -> None:
         self.adapter.close()
@@ -181,6 +261,99 @@ class CLIStorage:
             contract_versions[rs_name] = CURRENT_SCOPE_CONTRACT_VERSION
         self.store_well_known_config("scope_contract_versions", contract_versions)
 
+    def token_validation_is_fresh(self, token: str) -> bool:
+        """
+        Check whether a token was validated recently enough that it need not be
+        validated again.
+
+        Tokens are identified by their hashes, so that a new token (e.g. from a new
+        login) is never mistaken for one which was already validated.
+        """
+        ttl = _token_validation_ttl()
+        if ttl <= 0:
+            return False
+        validated_at = self._read_token_validations().get(_hash_token(token))
+        if validated_at is None:
+            return False
+        # a validation time in the future means that the clock has changed, so
+        # the record cannot be trusted
+        return 0 <= time.time() - validated_at < ttl
+
+    def record_token_validation(self, token: str) -> None:
+        """
+        Record that a token was just validated.
+        """
+        ttl = _token_validation_ttl()
+        if ttl <= 0:
+            return
+        now = time.time()
+        # drop any records which have expired, so that old tokens do not pile up
+        validations = {
+            token_hash: validated_at
+            for token_hash, validated_at in self._read_token_validations().items()
+            if 0 <= now - validated_at < ttl
+        }
+        validations[_hash_token(token)] = now
+        self.adapter.store_config("token_validations", validations)
+
+    def clear_token_validations(self) -> None:
+        self.adapter.remove_config("token_validations")
+
+    def _read_token_validations(self) -> dict[str, float]:
+        return self.adapter.read_config("token_validations") or {}
+
+    def read_consents(self, identity_id: str) -> list[dict[str, t.Any]] | None:
+        """
+        Read the consents which were stored for an identity, or None if there are
+        none or they were stored too long ago.
+        """
+        data = self.adapter.read_config("consents")
+        if data is None or data.get("identity_id") != identity_id:
+            return None
+        if not 0 <= time.time() - data["fetched_at"] < CONSENTS_TTL:
+            return None
+        return t.cast(t.List[t.Dict[str, t.Any]], data["consents"])
+
+    def store_consents(
+        self, identity_id: str, consents: list[dict[str, t.Any]]
+    ) -> None:
+        self.adapter.store_config(
+            "consents",
+            {
+                "identity_id": identity_id,
+                "fetched_at": time.time(),
+                "consents": consents,
+            },
+        )
+
+    def clear_consents(self) -> None:
+        self.adapter.remove_config("consents")
+
+
+def _hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _token_validation_ttl() -> float:
+    """
+    The number of seconds for which a successful token validation is trusted, as
+    set by GLOBUS_CLI_TOKEN_VALIDATION_TTL. A value of 0 disables the cache.
+    """
+    value = os.getenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL")
+    if not value:
+        return DEFAULT_TOKEN_VALIDATION_TTL
+    try:
+        ttl = float(value)
+    except ValueError:
+        ttl = float("nan")
+    # written so that NaN is also rejected
+    if not ttl >= 0:
+        raise click.ClickException(
+            "GLOBUS_CLI_TOKEN_VALIDATION_TTL must be a non-negative number of "
+            f"seconds, but got '{value}'"
+        )
+    return ttl
+
 
 def _template_client_id() -> str:
     template_id = "95fdeba8-fac2-42bd-a357-e068d82ff78e"
@@ -195,40 +368,8 @@ def _template_client_id() -> str:
     return template_id
 
 
-def _get_data_dir() -> str:
-    # get the dir to store Globus CLI data
-    #
-    # on Windows, the datadir is typically
-    #   ~\AppData\Local\globus\cli
-    #
-    # on Linux and macOS, we use
-    #   ~/.globus/cli/
-    #
-    # This is not necessarily a match with XDG_DATA_HOME or macOS use of
-    # '~/Library/Application Support'. The simplified directories for non-Windows
-    # platforms will allow easier access to the dir if necessary in support of users
-    if sys.platform == "win32":
-        # try to get the app data dir, preferring the local appdata
-        datadir = os.getenv("LOCALAPPDATA", os.getenv("APPDATA"))
-        if not datadir:
-            home = os.path.expanduser("~")
-            datadir = os.path.join(home, "AppData", "Local")
-        return os.path.join(datadir, "globus", "cli")
-    else:
-        return os.path.expanduser("~/.globus/cli/")
-
-
-def _ensure_data_dir() -> str:
-    dirname = _get_data_dir()
-    try:
-        os.makedirs(dirname)
-    except FileExistsError:
-        pass
-    return dirname
-
-
 def _get_storage_filename() -> str:
-    datadir = _ensure_data_dir()
+    datadir = ensure_data_dir()
     return os.path.join(datadir, "storage.db")
 
 
@@ -1,5 +1,24 @@
+from __future__ import annotations
+
 import os
+import typing as t
+
+if t.TYPE_CHECKING:
+    import globus_sdk
 
 
 def is_remote_session() -> bool:
     return bool(os.environ.get("SSH_TTY", os.environ.get("SSH_CONNECTION")))
+
+
+def refresh_token_if_needed(client: globus_sdk.BaseClient) -> None:
+    """
+    If a client's token is renewed as needed, renew it now if it is about to expire.
+
+    This is done before a client is used from several threads at once, so that the
+    threads do not each refresh the same token.
+    """
+    from globus_sdk.authorizers import RenewingAuthorizer
+
+    if isinstance(client.authorizer, RenewingAuthorizer):
+        client.authorizer.ensure_valid_token()
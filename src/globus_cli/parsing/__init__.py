@@ -25,8 +25,11 @@ from .shared_callbacks import emptyable_opt_list_callback
 from .shared_options import (
     activity_notifications_option,
     delete_and_rm_options,
+    follow_options,
     local_user_option,
+    max_items_per_task_option,
     no_local_server_option,
+    polling_interval_options,
     security_principal_opts,
     subscription_admin_verified_option,
     synchronous_task_wait_options,
@@ -90,6 +93,9 @@ __all__ = [
     "task_submission_options",
     "delete_and_rm_options",
     "synchronous_task_wait_options",
+    "polling_interval_options",
+    "follow_options",
+    "max_items_per_task_option",
     "security_principal_opts",
     "no_local_server_option",
     "transfer_recursive_option",
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import logging.config
 import typing as t
 
 import click
@@ -11,6 +10,7 @@ from globus_cli.types import AnyCommand
 # Format Enum for output formatting
 # could use a namedtuple, but that's overkill
 JSON_FORMAT = "json"
+JSONL_FORMAT = "jsonl"
 TEXT_FORMAT = "text"
 UNIX_FORMAT = "unix"
 
@@ -18,6 +18,9 @@ F = t.TypeVar("F", bound=AnyCommand)
 
 
 def _setup_logging(level: str = "DEBUG") -> None:
+    # only imported when logging is configured, since it is slow to import
+    import logging.config
+
     conf = {
         "version": 1,
         "formatters": {
@@ -54,6 +57,7 @@ class CommandState:
         self.verbosity: int = 0
         self.http_status_map: dict[int, int] = {}
         self.show_server_timing: bool = False
+        self.no_cache: bool = False
 
     def outformat_is_text(self) -> bool:
         return self.output_format == TEXT_FORMAT
@@ -64,6 +68,9 @@ class CommandState:
     def outformat_is_unix(self) -> bool:
         return self.output_format == UNIX_FORMAT
 
+    def outformat_is_jsonl(self) -> bool:
+        return self.output_format == JSONL_FORMAT
+
     def is_verbose(self) -> bool:
         return self.verbosity > 0
 
@@ -128,9 +135,14 @@ def format_option(f: F) -> F:
         "-F",
         "--format",
         type=click.Choice(
-            [UNIX_FORMAT, JSON_FORMAT, TEXT_FORMAT], case_sensitive=False
+            [UNIX_FORMAT, JSON_FORMAT, JSONL_FORMAT, TEXT_FORMAT],
+            case_sensitive=False,
+        ),
+        help=(
+            "Output format for stdout. Defaults to text. "
+            "'jsonl' prints one compact JSON document per line, one for each "
+            "item in a list."
         ),
-        help="Output format for stdout. Defaults to text.",
         expose_value=False,
         callback=callback,
     )(f)
@@ -254,6 +266,36 @@ def map_http_status_option(f: F) -> F:
     )(f)
 
 
+def no_cache_option(f: F) -> F:
+    def callback(ctx: click.Context, param: click.Parameter, value: t.Any) -> None:
+        if not value:
+            return
+        state = ctx.ensure_object(CommandState)
+        state.no_cache = True
+
+    return click.option(
+        "--no-cache",
+        is_flag=True,
+        expose_value=False,
+        callback=callback,
+        help=(
+            "Do not use cached information about identities and endpoints. "
+            "Fetch it from Globus instead."
+        ),
+    )(f)
+
+
+def caching_is_disabled() -> bool:
+    """
+    Check whether `--no-cache` was given. Outside of a click context, caching is
+    enabled.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return False
+    return ctx.ensure_object(CommandState).no_cache
+
+
 def show_server_timing_option(f: F) -> F:
     def callback(ctx: click.Context, param: click.Parameter, value: t.Any) -> None:
         if not value:
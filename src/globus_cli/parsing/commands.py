@@ -10,18 +10,19 @@ from __future__ import annotations
 
 import importlib
 import logging
+import os
 import sys
+import traceback
 import typing as t
 from shutil import get_terminal_size
 
 import click
 
 from globus_cli._click_compat import OLDER_CLICK_API
-from globus_cli.exception_handling import custom_except_hook
 from globus_cli.termio import env_interactive
 
 from .shared_options import common_options
-from .shell_completion import print_completer_option
+from .shell_completion import GlobusBashComplete, print_completer_option
 
 C = t.TypeVar("C", bound=t.Union[click.Command, t.Callable[..., t.Any]])
 
@@ -200,8 +201,80 @@ class TopLevelGroup(GlobusCommandGroup):
     designed specifically for the top level command.
     It's specialization is that it catches all exceptions from subcommands and
     passes them to a custom error handler.
+
+    When a CLI daemon is in use, the command line is handed to it rather than run
+    in this process. Shell completion is answered from a completion index, where
+    possible, without loading the commands.
     """
 
+    def main(  # type: ignore[override]
+        self, args: t.Sequence[str] | None = None, **kwargs: t.Any
+    ) -> t.Any:
+        completion_instruction = os.environ.get("_GLOBUS_COMPLETE")
+        if completion_instruction:
+            from click.shell_completion import add_completion_class
+
+            from .completion_index import complete_from_index
+
+            add_completion_class(GlobusBashComplete)
+
+            if complete_from_index(
+                self, "globus", "_GLOBUS_COMPLETE", completion_instruction
+            ):
+                sys.exit(0)
+
+        # only a command line from the real process arguments is forwarded -- a
+        # daemon (or test) which invokes the CLI passes `args` explicitly
+        if args is None:
+            from globus_cli.daemon import LOCAL_COMMANDS, forward_to_daemon
+
+            if self.get_subcommand_name(sys.argv[1:]) not in LOCAL_COMMANDS:
+                exit_code = forward_to_daemon(sys.argv[1:])
+                if exit_code is not None:
+                    sys.exit(exit_code)
+        return super().main(args, **kwargs)
+
+    def get_subcommand_name(self, args: t.Sequence[str]) -> str | None:
+        """
+        Find the name of the subcommand in a command line, without parsing it.
+        """
+        value_opts = {
+            opt
+            for param in self.params
+            if isinstance(param, click.Option) and not (param.is_flag or param.count)
+            for opt in param.opts
+        }
+        args_iter = iter(args)
+        for arg in args_iter:
+            if arg in value_opts:
+                next(args_iter, None)
+            elif not arg.startswith("-"):
+                return arg
+        return None
+
+    def run_in_process(self, args: list[str]) -> int:
+        """
+        Run a command line, as the `globus` command would, and return its exit
+        status rather than exiting.
+
+        This lets one process (the CLI daemon, or `globus shell`) run many commands.
+        """
+        try:
+            self.main(args=args, prog_name="globus")
+        except SystemExit as exit_:
+            if exit_.code is None:
+                return 0
+            if isinstance(exit_.code, int):
+                return exit_.code
+            click.echo(exit_.code, err=True)
+            return 1
+        # errors are normally handled by the CLI, but one which escapes must not
+        # stop the calling process
+        except Exception:
+            traceback.print_exc()
+            return 1
+        return 0
+
     def invoke(self, ctx: click.Context) -> t.Any:
         try:
             return super().invoke(ctx)
@@ -209,7 +282,15 @@ class TopLevelGroup(GlobusCommandGroup):
         # click's existing handling of broken pipes
         except OSError:
             raise
+        # an exit (e.g. after showing `--help`) is not an error, so there is no need
+        # to load the error handlers
+        except click.exceptions.Exit:
+            raise
         except Exception:
+            # the error handlers (and the SDK error types which they handle) are only
+            # imported when there is an error to handle
+            from globus_cli.exception_handling import custom_except_hook
+
             # mypy thinks that exc_info could be (None, None, None), but... nope. False.
             custom_except_hook(sys.exc_info())  # type: ignore[arg-type,type-var]
 
@@ -0,0 +1,334 @@
+"""
+A static index of the CLI's commands and options, used to answer shell completion
+without importing the command modules.
+
+Completion normally runs the CLI, which resolves (and therefore imports) every
+command on the command line being completed. Instead, the command tree is walked
+once to build an index, which is stored in the CLI's data directory and rebuilt
+whenever the CLI is upgraded or its source changes.
+
+Completions which depend on more than the command tree (e.g. a parameter with a
+custom `shell_complete`) are marked as "dynamic" in the index, and are left to
+click.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import typing as t
+
+import click
+from click.shell_completion import CompletionItem, get_completion_class
+
+from globus_cli.utils import ensure_data_dir
+from globus_cli.version import __version__
+
+log = logging.getLogger(__name__)
+
+INDEX_FILENAME = "completion_index.json"
+
+# the shells for which completion is answered from the index
+# any other shell (or instruction, like `bash_source`) is handled by click
+INDEXED_SHELLS = ("bash", "zsh")
+
+# the completion of a parameter value, as stored in the index, is one of
+#   null                        no completions
+#   "dynamic"                   only the parameter itself can complete the value
+#   ["file"] or ["dir"]         the shell completes a path
+#   ["choice", [...], bool]     one of the choices, and whether case matters
+ValueCompletion = t.Union[None, str, t.List[t.Any]]
+
+
+def index_path() -> str:
+    return os.path.join(ensure_data_dir(), INDEX_FILENAME)
+
+
+def source_fingerprint() -> str:
+    """
+    A string which changes whenever the CLI is upgraded, used to detect that the
+    index is out of date.
+
+    This is checked on every completion, so it must be cheap: an installed CLI is
+    identified by its version alone. An editable install (i.e. one which is not in
+    site-packages) may change without its version changing, so the latest
+    modification time of the package directory and of the command package
+    directories is added. A directory's modification time only changes when its
+    own entries do, so this catches modules being added, removed, or replaced
+    anywhere under `commands/`, but not every edit -- remove the index to rebuild
+    it.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if os.path.basename(os.path.dirname(package_dir)) in (
+        "site-packages",
+        "dist-packages",
+    ):
+        return __version__
+    return f"{__version__}:{_latest_dir_mtime(package_dir)}"
+
+
+def _latest_dir_mtime(package_dir: str) -> int:
+    # only directories are checked, not the modules in them
+    latest = os.stat(package_dir).st_mtime_ns
+    pending = [os.path.join(package_dir, "commands")]
+    while pending:
+        path = pending.pop()
+        try:
+            latest = max(latest, os.stat(path).st_mtime_ns)
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+        pending.extend(
+            entry.path
+            for entry in entries
+            # bytecode caches change whenever a module is first imported
+            if entry.name != "__pycache__" and entry.is_dir(follow_symlinks=False)
+        )
+    return latest
+
+
+def _value_completion(param: click.Parameter) -> ValueCompletion:
+    if getattr(param, "_custom_shell_complete", None) is not None:
+        return "dynamic"
+
+    param_type = param.type
+    complete_method = type(param_type).shell_complete
+    if isinstance(param_type, click.Choice):
+        if complete_method is not click.Choice.shell_complete:
+            return "dynamic"
+        return [
+            "choice",
+            [str(c) for c in param_type.choices],
+            param_type.case_sensitive,
+        ]
+    if isinstance(param_type, click.Path):
+        if complete_method is not click.Path.shell_complete:
+            return "dynamic"
+        if param_type.dir_okay and not param_type.file_okay:
+            return ["dir"]
+        return ["file"]
+    if isinstance(param_type, click.File):
+        if complete_method is not click.File.shell_complete:
+            return "dynamic"
+        return ["file"]
+    if complete_method is not click.ParamType.shell_complete:
+        return "dynamic"
+    return None
+
+
+def _command_node(ctx: click.Context) -> dict[str, t.Any]:
+    options: list[dict[str, t.Any]] = []
+    arguments: list[dict[str, t.Any]] = []
+    for param in ctx.command.get_params(ctx):
+        if isinstance(param, click.Option):
+            options.append(
+                {
+                    "names": [*param.opts, *param.secondary_opts],
+                    "help": param.help,
+                    "hidden": param.hidden,
+                    "multiple": param.multiple,
+                    "nargs": 0 if param.is_flag or param.count else param.nargs,
+                    "values": _value_completion(param),
+                }
+            )
+        elif isinstance(param, click.Argument):
+            arguments.append({"nargs": param.nargs, "values": _value_completion(param)})
+    return {
+        "help": ctx.command.get_short_help_str(),
+        "options": options,
+        "arguments": arguments,
+    }
+
+
+def _tree_node(
+    tree: tuple[click.Context, list[click.Context], list[t.Any]],
+) -> dict[str, t.Any]:
+    ctx, subcommands, subgroups = tree
+    commands = {sub_ctx.info_name: _command_node(sub_ctx) for sub_ctx in subcommands}
+    for subtree in subgroups:
+        commands[subtree[0].info_name] = _tree_node(subtree)
+
+    node = _command_node(ctx)
+    # keep the order in which the group lists its commands
+    group = t.cast(click.Group, ctx.command)
+    node["commands"] = {
+        name: commands[name] for name in group.list_commands(ctx) if name in commands
+    }
+    return node
+
+
+def build_index(cli: click.Group) -> dict[str, t.Any]:
+    """
+    Build the completion index for a CLI, loading all of its commands.
+    """
+    from globus_cli.reflect import walk_contexts
+
+    return {
+        "fingerprint": source_fingerprint(),
+        "tree": _tree_node(walk_contexts("globus", cli)),
+    }
+
+
+def load_index() -> dict[str, t.Any] | None:
+    """
+    Load the stored completion index, or return None if there is no index or if it
+    is out of date.
+    """
+    try:
+        with open(index_path(), encoding="utf-8") as fp:
+            index: dict[str, t.Any] = json.load(fp)
+    except (OSError, ValueError):
+        return None
+    if index.get("fingerprint") != source_fingerprint():
+        return None
+    return index
+
+
+def write_index(index: dict[str, t.Any]) -> None:
+    # write to a temporary file and rename it into place, so that a concurrent
+    # completion never reads a partial index
+    path = index_path()
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fp:
+        json.dump(index, fp, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def _find_option(node: dict[str, t.Any], name: str) -> dict[str, t.Any] | None:
+    options: list[dict[str, t.Any]] = node["options"]
+    for option in options:
+        if name in option["names"]:
+            return option
+    return None
+
+
+def _complete_value(
+    completion: ValueCompletion, incomplete: str
+) -> list[CompletionItem] | None:
+    if completion is None:
+        return []
+    # the only string value is "dynamic"
+    if isinstance(completion, str):
+        return None
+    if completion[0] == "choice":
+        _, choices, case_sensitive = completion
+        if case_sensitive:
+            matched = [c for c in choices if c.startswith(incomplete)]
+        else:
+            matched = [c for c in choices if c.lower().startswith(incomplete.lower())]
+        return [CompletionItem(c) for c in matched]
+    return [CompletionItem(incomplete, type=completion[0])]
+
+
+def complete(
+    tree: dict[str, t.Any], args: list[str], incomplete: str
+) -> list[CompletionItem] | None:
+    """
+    Complete a command line from the index, as click would.
+
+    `args` are the complete arguments which precede the incomplete one.
+    Returns None if the completion cannot be answered from the index, e.g. because
+    the command line names a hidden command.
+    """
+    node = tree
+    used: list[dict[str, t.Any]] = []
+    positionals = 0
+    # an option which is waiting for its value
+    pending: dict[str, t.Any] | None = None
+
+    # likewise click, complete `--opt=value` as the value of `--opt`
+    if incomplete == "=":
+        incomplete = ""
+    elif incomplete.startswith("-") and "=" in incomplete:
+        name, _, incomplete = incomplete.partition("=")
+        args = [*args, name]
+
+    for arg in args:
+        if pending is not None:
+            pending = None
+        elif arg == "--":
+            return None
+        elif arg.startswith("-") and arg != "-":
+            name, has_value, _ = arg.partition("=")
+            option = _find_option(node, name)
+            if option is None or option["nargs"] > 1:
+                return None
+            used.append(option)
+            if option["nargs"] and not has_value:
+                pending = option
+        elif "commands" in node:
+            if arg not in node["commands"]:
+                return None
+            node, used, positionals = node["commands"][arg], [], 0
+        else:
+            positionals += 1
+
+    # an option name is completed in preference to anything else
+    if incomplete.startswith("-"):
+        items: list[CompletionItem] = []
+        for option in node["options"]:
+            already_used = any(option is u for u in used)
+            if option["hidden"] or (already_used and not option["multiple"]):
+                continue
+            items.extend(
+                CompletionItem(name, help=option["help"])
+                for name in option["names"]
+                if name.startswith(incomplete)
+            )
+        return items
+
+    if pending is not None:
+        return _complete_value(pending["values"], incomplete)
+
+    for argument in node["arguments"]:
+        if argument["nargs"] == -1 or positionals < argument["nargs"]:
+            if argument["nargs"] > 1:
+                return None
+            return _complete_value(argument["values"], incomplete)
+        positionals -= argument["nargs"]
+
+    if "commands" in node:
+        return _complete_commands(node, incomplete)
+    return []
+
+
+def _complete_commands(node: dict[str, t.Any], incomplete: str) -> list[CompletionItem]:
+    return [
+        CompletionItem(name, help=subnode["help"])
+        for name, subnode in node["commands"].items()
+        if name.startswith(incomplete)
+    ]
+
+
+def complete_from_index(
+    cli: click.Group, prog_name: str, complete_var: str, instruction: str
+) -> bool:
+    """
+    Handle a shell completion request (made by the completion script, by setting
+    `complete_var`) using the index, building the index first if necessary.
+
+    Returns False if the request must be handled by click instead.
+    """
+    shell, _, action = instruction.partition("_")
+    if action != "complete" or shell not in INDEXED_SHELLS:
+        return False
+
+    index = load_index()
+    if index is None:
+        index = build_index(cli)
+        try:
+            write_index(index)
+        except OSError as err:
+            log.debug("could not write the completion index: %s", err)
+
+    completion_class = get_completion_class(shell)
+    if completion_class is None:
+        return False
+    comp = completion_class(cli, {}, prog_name, complete_var)
+    args, incomplete = comp.get_completion_args()
+    items = complete(index["tree"], args, incomplete)
+    if items is None:
+        return False
+    click.echo("\n".join(comp.format_completion(item) for item in items))
+    return True
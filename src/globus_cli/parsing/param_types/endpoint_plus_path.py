@@ -7,6 +7,9 @@ import click
 
 from globus_cli._click_compat import shim_get_metavar
 
+if t.TYPE_CHECKING:
+    from click.shell_completion import CompletionItem
+
 
 class EndpointPlusPath(click.ParamType):
     """
@@ -84,6 +87,29 @@ class EndpointPlusPath(click.ParamType):
 
         return (endpoint_id, path)
 
+    def shell_complete(
+        self, ctx: click.Context, param: click.Parameter, incomplete: str
+    ) -> list[CompletionItem]:
+        """
+        Complete the path component, by listing the directory on the endpoint.
+        """
+        from click.shell_completion import CompletionItem
+
+        from globus_cli.services.transfer.path_completion import complete_remote_path
+
+        endpoint_id, sep, path = incomplete.partition(":")
+        if not sep:
+            return []
+        try:
+            uuid.UUID(endpoint_id)
+        except ValueError:
+            return []
+
+        return [
+            CompletionItem(f"{endpoint_id}:{completion}")
+            for completion in complete_remote_path(endpoint_id, path)
+        ]
+
 
 ENDPOINT_PLUS_OPTPATH = EndpointPlusPath(path_required=False)
 ENDPOINT_PLUS_REQPATH = EndpointPlusPath(path_required=True)
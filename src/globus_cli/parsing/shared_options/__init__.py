@@ -12,6 +12,7 @@ from globus_cli.parsing.command_state import (
     debug_option,
     format_option,
     map_http_status_option,
+    no_cache_option,
     quiet_option,
     show_server_timing_option,
     verbose_option,
@@ -56,6 +57,7 @@ def common_options(*, disable_options: list[str] | None = None) -> t.Callable[[C
         f = show_server_timing_option(f)
         f = verbose_option(f)
         f = quiet_option(f)
+        f = no_cache_option(f)
         f = click.help_option("-h", "--help")(f)
 
         # if the format option is being allowed, it needs to be applied to `f`
@@ -207,7 +209,36 @@ def delete_and_rm_options(
     return decorator
 
 
-def synchronous_task_wait_options(f: C) -> C:
+def max_items_per_task_option(*, extra_help: str = "") -> t.Callable[[C], C]:
+    help_text = (
+        "Split --batch input into multiple tasks of at most N items each. "
+        "Each task is submitted as soon as it is full, so very large batches "
+        "are never held in memory all at once."
+    )
+    if extra_help:
+        help_text = f"{help_text} {extra_help}"
+
+    return click.option(
+        "--max-items-per-task",
+        type=click.IntRange(min=1),
+        metavar="N",
+        help=help_text,
+    )
+
+
+def polling_interval_options(
+    *,
+    polling_interval_help: str,
+    max_polling_interval_help: str,
+    default_polling_interval: int = 1,
+    default_max_polling_interval: int | None = None,
+) -> t.Callable[[C], C]:
+    """
+    The options which control how often a command checks on something it is
+    waiting for: `--polling-interval` and `--max-polling-interval`, as used by
+    `TaskPollingSchedule`.
+    """
+
     def polling_interval_callback(
         ctx: click.Context, param: click.Parameter, value: int
     ) -> int:
@@ -218,6 +249,54 @@ def synchronous_task_wait_options(f: C) -> C:
 
         return value
 
+    def decorator(f: C) -> C:
+        f = click.option(
+            "--polling-interval",
+            default=default_polling_interval,
+            type=int,
+            show_default=True,
+            callback=polling_interval_callback,
+            help=polling_interval_help,
+        )(f)
+        f = click.option(
+            "--max-polling-interval",
+            type=click.IntRange(min=1),
+            default=default_max_polling_interval,
+            show_default=default_max_polling_interval is not None,
+            metavar="N",
+            help=max_polling_interval_help,
+        )(f)
+        return f
+
+    return decorator
+
+
+def follow_options(*, follow_help: str) -> t.Callable[[C], C]:
+    """
+    The options of a command which can follow something as it changes: `--follow`,
+    and the polling options which control how often it is checked.
+    The time between checks doubles while nothing new arrives.
+    """
+
+    def decorator(f: C) -> C:
+        f = polling_interval_options(
+            polling_interval_help=(
+                "With --follow, the initial number of seconds between checks."
+            ),
+            max_polling_interval_help=(
+                "With --follow, the maximum number of seconds between checks. The "
+                "time between checks doubles while nothing new arrives."
+            ),
+            default_polling_interval=2,
+            default_max_polling_interval=30,
+        )(f)
+        f = click.option("--follow", "-f", is_flag=True, help=follow_help)(f)
+        return f
+
+    return decorator
+
+
+def synchronous_task_wait_options(f: C) -> C:
     def exit_code_callback(
         ctx: click.Context, param: click.Parameter, value: int
     ) -> int:
@@ -237,13 +316,16 @@ def synchronous_task_wait_options(f: C) -> C:
             "exit with status 1"
         ),
     )(f)
-    f = click.option(
-        "--polling-interval",
-        default=1,
-        type=int,
-        show_default=True,
-        callback=polling_interval_callback,
-        help="Number of seconds between task status checks.",
+    f = polling_interval_options(
+        polling_interval_help=(
+            "Number of seconds between task status checks. With "
+            "--max-polling-interval, the number of seconds before the first check."
+        ),
+        max_polling_interval_help=(
+            "Poll adaptively: start at --polling-interval and double the time "
+            "between checks up to N seconds, polling sooner when the task's "
+            "progress suggests that it is about to finish."
+        ),
     )(f)
     f = click.option(
         "--heartbeat",
@@ -4,10 +4,13 @@ import os
 import typing as t
 
 import click
+from click.shell_completion import BashComplete, CompletionItem
 
 C = t.TypeVar("C", bound=t.Union[t.Callable[..., t.Any], click.Command])
 
 # pulled by running `_GLOBUS_COMPLETE=source globus` in a bash shell
+# completions which end in a slash (remote directories) do not end the word, so that
+# completion can continue into the directory
 BASH_SHELL_COMPLETER = r"""
 _globus_completion() {
     local IFS=$'\n'
@@ -26,6 +29,9 @@ _globus_completion() {
             compopt -o default
         elif [[ $type == 'plain' ]]; then
             COMPREPLY+=($value)
+            if [[ $value == */ ]]; then
+                compopt -o nospace
+            fi
         fi
     done
 
@@ -40,11 +46,13 @@ _globus_completion_setup;
 """  # noqa: E501
 
 # pulled by running `_GLOBUS_COMPLETE=source_zsh globus` in a zsh shell
+# as with bash, completions which end in a slash do not end the word
 ZSH_SHELL_COMPLETER = r"""
 #compdef globus
 
 _globus_completion() {
     local -a completions
+    local -a completions_nospace
     local -a completions_with_descriptions
     local -a response
     (( ! $+commands[globus] )) && return 1
@@ -53,7 +61,9 @@ _globus_completion() {
 
     for type key descr in ${response}; do
         if [[ "$type" == "plain" ]]; then
-            if [[ "$descr" == "_" ]]; then
+            if [[ "$descr" == "_" && "$key" == */ ]]; then
+                completions_nospace+=("$key")
+            elif [[ "$descr" == "_" ]]; then
                 completions+=("$key")
             else
                 completions_with_descriptions+=("$key":"$descr")
@@ -72,12 +82,62 @@ _globus_completion() {
     if [ -n "$completions" ]; then
         compadd -U -V unsorted -a completions
     fi
+
+    if [ -n "$completions_nospace" ]; then
+        compadd -U -V unsorted -S '' -a completions_nospace
+    fi
 }
 
 compdef _globus_completion globus;
 """  # noqa: E501
 
 
+class GlobusBashComplete(BashComplete):
+    """
+    Bash completion which handles colons, as in `ENDPOINT_ID:PATH`.
+
+    Bash splits words on colons (which are in COMP_WORDBREAKS by default), so
+    `ENDPOINT_ID:/path` arrives as three words, and bash only replaces the text
+    after the last colon with a completion. The words are joined back together
+    before they are parsed, and completions are trimmed to match.
+    """
+
+    def __init__(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._colon_prefix = ""
+
+    def get_completion_args(self) -> tuple[list[str], str]:
+        args, incomplete = super().get_completion_args()
+        words = _join_colon_words([*args, incomplete])
+        if words[-1] != incomplete:
+            self._colon_prefix = words[-1].rpartition(":")[0] + ":"
+        return words[:-1], words[-1]
+
+    def format_completion(self, item: CompletionItem) -> str:
+        if self._colon_prefix and item.value.startswith(self._colon_prefix):
+            item = CompletionItem(
+                item.value[len(self._colon_prefix) :], type=item.type, help=item.help
+            )
+        return super().format_completion(item)
+
+
+def _join_colon_words(words: list[str]) -> list[str]:
+    joined: list[str] = []
+    after_colon = False
+    for word in words:
+        if word == ":" and joined:
+            joined[-1] += word
+            after_colon = True
+        # an empty word after a colon is a new word, which was started with a space
+        elif after_colon and word:
+            joined[-1] += word
+            after_colon = False
+        else:
+            joined.append(word)
+            after_colon = False
+    return joined
+
+
 def print_completer_option(f: C) -> C:
     def callback(ctx: click.Context, param: click.Parameter, value: str | None) -> None:
         # if `resilient_parsing=True`, shell completion is being executed, so we should
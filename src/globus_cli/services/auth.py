@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import typing as t
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import globus_sdk
 import globus_sdk.scopes
 
+from globus_cli.login_manager.utils import refresh_token_if_needed
+
+# the maximum number of IDs or usernames which Globus Auth accepts in a single
+# call to get identities
+IDENTITY_BATCH_SIZE = 100
+# the maximum number of identity lookups which are run at once
+IDENTITY_LOOKUP_MAX_WORKERS = 4
+
 
 def _is_uuid(s: str) -> bool:
     try:
@@ -21,7 +30,121 @@ class GetIdentitiesKwargs(t.TypedDict, total=False):
     ids: str
 
 
+class IdentityIndex:
+    """
+    A collection of identity documents, indexed by both ID and username.
+
+    Lookups are case-insensitive, as Globus Auth treats usernames (and IDs)
+    case-insensitively.
+    """
+
+    def __init__(self, identities: t.Iterable[dict[str, t.Any]] = ()) -> None:
+        self._by_id: dict[str, dict[str, t.Any]] = {}
+        self._by_username: dict[str, dict[str, t.Any]] = {}
+        for identity in identities:
+            self.add(identity)
+
+    def add(self, identity: dict[str, t.Any]) -> None:
+        self._by_id[identity["id"].lower()] = identity
+        if isinstance(identity.get("username"), str):
+            self._by_username[identity["username"].lower()] = identity
+
+    def get(self, value: str) -> dict[str, t.Any] | None:
+        """
+        Get the identity with a given ID or username, or None if it is not known.
+        """
+        key = value.lower()
+        return self._by_id.get(key) or self._by_username.get(key)
+
+    def __contains__(self, value: object) -> bool:
+        return isinstance(value, str) and self.get(value) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
 class CustomAuthClient(globus_sdk.AuthClient):
+    def resolve_identities(
+        self,
+        *,
+        ids: t.Iterable[str] = (),
+        usernames: t.Iterable[str] = (),
+        provision: bool = False,
+    ) -> IdentityIndex:
+        """
+        Look up many identities by ID and username, with as few calls as possible.
+
+        Duplicate values are looked up once, and values which are in the identity
+        cache are not looked up at all. The rest are split into batches of
+        ``IDENTITY_BATCH_SIZE``, which are fetched concurrently, and the results
+        are added to the cache.
+
+        Values with no corresponding identity are simply absent from the index.
+        """
+        from globus_cli.services.identity_cache import (
+            cache_identities,
+            get_identity_cache,
+        )
+
+        index = IdentityIndex()
+        # drop duplicates, preserving order
+        ids = list(dict.fromkeys(ids))
+        usernames = list(dict.fromkeys(usernames))
+
+        cache = get_identity_cache()
+        if cache is not None:
+            for value in ids + usernames:
+                if value not in index:
+                    cached = cache.get(value)
+                    if cached is not None:
+                        index.add(cached)
+        ids = [value for value in ids if value not in index]
+        usernames = [value for value in usernames if value not in index]
+
+        # since the API doesn't accept mixed ids and usernames, they are batched
+        # separately
+        batches: list[GetIdentitiesKwargs] = []
+        for i in range(0, len(ids), IDENTITY_BATCH_SIZE):
+            batches.append(
+                {
+                    "ids": ",".join(ids[i : i + IDENTITY_BATCH_SIZE]),
+                    "provision": provision,
+                }
+            )
+        for i in range(0, len(usernames), IDENTITY_BATCH_SIZE):
+            batches.append(
+                {
+                    "usernames": ",".join(usernames[i : i + IDENTITY_BATCH_SIZE]),
+                    "provision": provision,
+                }
+            )
+
+        # each batch of results is cached at once, in one write to the cache
+        for identities in self._get_identity_batches(batches):
+            for identity in identities:
+                index.add(identity)
+            cache_identities(identities)
+        return index
+
+    def _get_identity_batches(
+        self, batches: list[GetIdentitiesKwargs]
+    ) -> t.Iterator[list[dict[str, t.Any]]]:
+        if len(batches) <= 1:
+            for batch in batches:
+                yield self.get_identities(**batch)["identities"]
+            return
+
+        refresh_token_if_needed(self)
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(batches), IDENTITY_LOOKUP_MAX_WORKERS),
+            thread_name_prefix="get_identities",
+        ) as executor:
+            for response in executor.map(
+                lambda batch: self.get_identities(**batch), batches
+            ):
+                yield response["identities"]
+
     def _lookup_identity_field(
         self,
         id_name: str | None = None,
@@ -31,26 +154,20 @@ class CustomAuthClient(globus_sdk.AuthClient):
     ) -> str | None:
         assert (id_name or id_id) and not (id_name and id_id)
 
-        kw: GetIdentitiesKwargs = {"provision": provision}
         if id_name:
-            kw["usernames"] = id_name
+            index = self.resolve_identities(usernames=[id_name], provision=provision)
         elif id_id:
-            kw["ids"] = id_id
+            index = self.resolve_identities(ids=[id_id], provision=provision)
         else:
             raise NotImplementedError("must provide id or name")
 
-        try:
-            value = self.get_identities(**kw)["identities"][0][field]
+        identity = index.get(t.cast(str, id_name or id_id))
         # capture any failure to lookup this data, including:
-        # - identity doesn't exist (`identities=[]`)
+        # - identity doesn't exist
         # - field is missing
-        except LookupError:
-            return None
-
-        if not isinstance(value, str):
+        if identity is None or not isinstance(identity.get(field), str):
             return None
-
-        return value
+        return t.cast(str, identity[field])
 
     @t.overload
     def maybe_lookup_identity_id(
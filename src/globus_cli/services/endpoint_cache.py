@@ -0,0 +1,111 @@
+"""
+A persistent cache of endpoint and collection documents from Transfer.
+
+Commands which talk to a Globus Connect Server endpoint first need to look up the
+endpoint (or collection) in Transfer, to find its type and its GCS Manager URL. These
+rarely change, so the documents are cached on disk for a short time, and repeated
+commands against the same endpoint skip the lookup.
+
+Entries which have expired are kept, so that if Transfer cannot be reached (or
+returns a server error) the stale document can be used in its place.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+
+from globus_cli.services.sqlite_store import SQLiteStore, StoreHandle
+
+# entries are refreshed after an hour
+DEFAULT_TTL = 60 * 60
+DEFAULT_MAX_ENTRIES = 1_000
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS endpoints (
+    namespace TEXT NOT NULL,
+    endpoint_id TEXT NOT NULL,
+    document TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (namespace, endpoint_id)
+);
+CREATE INDEX IF NOT EXISTS endpoints_fetched_at
+    ON endpoints (namespace, fetched_at);
+"""
+
+
+class EndpointCache(SQLiteStore):
+    """
+    A SQLite-backed store of endpoint documents, keyed by endpoint ID.
+
+    Expired documents are kept as a fallback, so only the oldest documents are
+    evicted, to keep the namespace within `max_entries`.
+    """
+
+    description = "endpoint cache"
+    table = "endpoints"
+    schema = _SCHEMA
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(
+            filename, namespace=namespace, ttl=ttl, max_entries=max_entries
+        )
+
+    def get(
+        self, endpoint_id: str, *, allow_stale: bool = False
+    ) -> dict[str, t.Any] | None:
+        """
+        Get the cached document for an endpoint.
+
+        :param endpoint_id: The ID of the endpoint or collection
+        :param allow_stale: Return the document even if it has expired
+        :returns: None if there is no (fresh) document, or the cache cannot be read
+        """
+        row = None
+        with self._connection("read from") as conn:
+            row = conn.execute(
+                "SELECT document, fetched_at FROM endpoints "
+                "WHERE namespace = ? AND endpoint_id = ?",
+                (self.namespace, endpoint_id),
+            ).fetchone()
+        if row is None:
+            return None
+
+        document, fetched_at = row
+        if not allow_stale and not self._is_fresh(fetched_at):
+            return None
+        return t.cast(t.Dict[str, t.Any], json.loads(document))
+
+    def set(self, endpoint_id: str, document: dict[str, t.Any]) -> None:
+        with self._connection("write to") as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO endpoints VALUES (?, ?, ?, ?)",
+                (self.namespace, endpoint_id, json.dumps(document), time.time()),
+            )
+            self._evict(conn)
+
+    def delete(self, endpoint_id: str) -> None:
+        with self._connection("delete from") as conn:
+            conn.execute(
+                "DELETE FROM endpoints WHERE namespace = ? AND endpoint_id = ?",
+                (self.namespace, endpoint_id),
+            )
+
+
+STORE = StoreHandle(EndpointCache, "endpoint_cache.db")
+
+
+def get_endpoint_cache() -> EndpointCache | None:
+    """
+    Get the endpoint cache for the current profile, or None if it cannot be opened,
+    in which case endpoints are simply not cached.
+    """
+    return STORE.get()
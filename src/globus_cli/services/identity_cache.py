@@ -0,0 +1,229 @@
+"""
+A persistent cache of Globus Auth identities.
+
+Identities are cached on disk, next to the CLI's token storage, so that usernames and
+IDs which were resolved by one command do not need to be looked up again by the next.
+
+The cache is a mapping from identity IDs and usernames to identity documents, which
+is the form that ``globus_sdk.IdentityMap`` accepts as its ``cache``. Entries expire
+after a fixed time, and once the cache is full the least recently used entries are
+evicted.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+
+from globus_cli.services.sqlite_store import SQLiteStore, StoreHandle
+
+# entries are refreshed after a day, in case an identity's details change
+DEFAULT_TTL = 24 * 60 * 60
+# each identity is stored twice (under its ID and its username), so this holds the
+# 50,000 identities of a large batch lookup
+DEFAULT_MAX_ENTRIES = 100_000
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS identities (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    identity TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS identities_last_used
+    ON identities (namespace, last_used);
+"""
+
+
+class IdentityCache(SQLiteStore, t.MutableMapping[str, t.Dict[str, t.Any]]):
+    """
+    A SQLite-backed mapping of identity IDs and usernames to identity documents.
+
+    Expired entries are dropped when they are read, and the least recently used
+    entries are evicted, to keep the namespace within `max_entries`.
+    """
+
+    description = "identity cache"
+    table = "identities"
+    schema = _SCHEMA
+    evict_by = "last_used"
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(
+            filename, namespace=namespace, ttl=ttl, max_entries=max_entries
+        )
+
+    def __getitem__(self, key: str) -> dict[str, t.Any]:
+        now = time.time()
+        # a cache which cannot be read (e.g. because it is locked by another
+        # process for too long) is treated as a miss
+        identity = None
+        with self._connection("read from") as conn:
+            row = conn.execute(
+                "SELECT identity, fetched_at FROM identities "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is not None and self._is_fresh(row[1]):
+                identity = row[0]
+                conn.execute(
+                    "UPDATE identities SET last_used = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+            elif row is not None:
+                conn.execute(
+                    "DELETE FROM identities WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+        if identity is None:
+            raise KeyError(key)
+        return t.cast(t.Dict[str, t.Any], json.loads(identity))
+
+    def __setitem__(self, key: str, value: dict[str, t.Any]) -> None:
+        now = time.time()
+        with self._connection("write to") as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO identities VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, json.dumps(value), now, now),
+            )
+            self._evict(conn)
+
+    def update(  # type: ignore[override]
+        self,
+        other: (
+            t.Mapping[str, dict[str, t.Any]] | t.Iterable[tuple[str, dict[str, t.Any]]]
+        ) = (),
+        /,
+        **kwargs: dict[str, t.Any],
+    ) -> None:
+        """
+        Add many entries at once. They are written in one transaction, and entries
+        are evicted once afterwards, rather than after each one.
+        """
+        items = dict(other, **kwargs)
+        if not items:
+            return
+        now = time.time()
+        with self._connection("write to") as conn:
+            with self._transaction(conn):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO identities VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (self.namespace, key, json.dumps(value), now, now)
+                        for key, value in items.items()
+                    ],
+                )
+                self._evict(conn, writes=len(items))
+
+    def __delitem__(self, key: str) -> None:
+        deleted = 0
+        with self._connection("delete from") as conn:
+            deleted = conn.execute(
+                "DELETE FROM identities WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).rowcount
+        if deleted == 0:
+            raise KeyError(key)
+
+    def __iter__(self) -> t.Iterator[str]:
+        rows = []
+        with self._connection("read from") as conn:
+            rows = conn.execute(
+                "SELECT key FROM identities WHERE namespace = ? AND fetched_at > ?",
+                (self.namespace, self._stale_before()),
+            ).fetchall()
+        return iter([key for (key,) in rows])
+
+    def __len__(self) -> int:
+        # unlike the other stores, expired entries are not counted
+        count = 0
+        with self._connection("read from") as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM identities "
+                "WHERE namespace = ? AND fetched_at > ?",
+                (self.namespace, self._stale_before()),
+            ).fetchone()
+        return int(count)
+
+
+class WriteOnlyIdentityCache(t.MutableMapping[str, t.Dict[str, t.Any]]):
+    """
+    A view of an identity cache which never finds anything, but to which identities
+    are still added.
+    """
+
+    def __init__(self, cache: IdentityCache) -> None:
+        self._cache = cache
+
+    def __getitem__(self, key: str) -> dict[str, t.Any]:
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: dict[str, t.Any]) -> None:
+        self._cache[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._cache[key]
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+
+STORE = StoreHandle(IdentityCache, "identity_cache.db")
+
+
+def get_identity_cache() -> t.MutableMapping[str, t.Dict[str, t.Any]] | None:
+    """
+    Get the identity cache for the current profile.
+
+    If the cache cannot be opened (e.g. because the data directory is not
+    writable), None is returned and identities are simply not cached.
+    With `--no-cache`, a write-only view of the cache is returned, so that cached
+    identities are not used -- but identities which are looked up are still added
+    to the cache.
+    """
+    from globus_cli.parsing.command_state import caching_is_disabled
+
+    cache = _open_cache()
+    if cache is not None and caching_is_disabled():
+        return WriteOnlyIdentityCache(cache)
+    return cache
+
+
+def _open_cache() -> IdentityCache | None:
+    return STORE.get()
+
+
+def clear_identity_cache() -> None:
+    """
+    Remove all identities for the current profile from the cache.
+    """
+    cache = _open_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def cache_identities(identities: t.Iterable[dict[str, t.Any]]) -> None:
+    """
+    Add identity documents to the cache, each under both its ID and its username.
+    """
+    cache = _open_cache()
+    if cache is not None:
+        cache.update(
+            (key, identity)
+            for identity in identities
+            for key in (identity["id"], identity["username"])
+        )
@@ -0,0 +1,104 @@
+"""
+A persistent cache of directory listings from Transfer, used to complete remote
+paths on the command line.
+
+Completing a path lists its directory, and a user typically presses TAB several
+times in the same directory. Listings are therefore cached on disk for a short time,
+so that only the first completion in a directory has to wait for Transfer.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import typing as t
+
+from globus_cli.services.sqlite_store import SQLiteStore, StoreHandle
+
+# listings change far more often than endpoints do, so they are only kept briefly
+DEFAULT_TTL = 30
+DEFAULT_MAX_ENTRIES = 200
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS listings (
+    namespace TEXT NOT NULL,
+    endpoint_id TEXT NOT NULL,
+    path TEXT NOT NULL,
+    entries TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (namespace, endpoint_id, path)
+);
+CREATE INDEX IF NOT EXISTS listings_fetched_at
+    ON listings (namespace, fetched_at);
+"""
+
+# a listing entry is a pair of (name, is_directory)
+ListingEntry = t.Tuple[str, bool]
+
+
+class ListingCache(SQLiteStore):
+    """
+    A SQLite-backed store of directory listings, keyed by endpoint ID and path.
+
+    Expired listings are evicted, and then the oldest ones, to keep the namespace
+    within `max_entries`.
+    """
+
+    description = "listing cache"
+    table = "listings"
+    schema = _SCHEMA
+    evict_expired = True
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        super().__init__(
+            filename, namespace=namespace, ttl=ttl, max_entries=max_entries
+        )
+
+    def get(self, endpoint_id: str, path: str) -> list[ListingEntry] | None:
+        """
+        Get the cached listing of a directory.
+
+        :param endpoint_id: The ID of the endpoint or collection
+        :param path: The path of the directory
+        :returns: None if there is no fresh listing, or the cache cannot be read
+        """
+        row = None
+        with self._connection("read from") as conn:
+            row = conn.execute(
+                "SELECT entries, fetched_at FROM listings "
+                "WHERE namespace = ? AND endpoint_id = ? AND path = ?",
+                (self.namespace, endpoint_id, path),
+            ).fetchone()
+        if row is None:
+            return None
+
+        entries, fetched_at = row
+        if not self._is_fresh(fetched_at):
+            return None
+        return [(name, is_dir) for name, is_dir in json.loads(entries)]
+
+    def set(self, endpoint_id: str, path: str, entries: list[ListingEntry]) -> None:
+        with self._connection("write to") as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, endpoint_id, path, json.dumps(entries), time.time()),
+            )
+            self._evict(conn)
+
+
+STORE = StoreHandle(ListingCache, "listing_cache.db")
+
+
+def get_listing_cache() -> ListingCache | None:
+    """
+    Get the listing cache for the current profile, or None if it cannot be opened,
+    in which case listings are simply not cached.
+    """
+    return STORE.get()
@@ -0,0 +1,225 @@
+"""
+Client-side rate limiting for calls to Globus services.
+
+A single ``AdaptiveRateLimiter`` is kept for each API host, and is shared by all of the
+clients (and threads) which talk to that host. The limiter is a token bucket whose
+refill rate adapts to feedback from the service:
+
+- every successful response raises the rate by a small, fixed amount
+- every 429 or 503 response cuts the rate in half, and honors any ``Retry-After``
+
+This is the "additive increase, multiplicative decrease" (AIMD) scheme used for
+TCP congestion control.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import typing as t
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if t.TYPE_CHECKING:
+    import globus_sdk
+
+log = logging.getLogger(__name__)
+
+# HTTP statuses which indicate that the service is asking callers to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+
+# defaults for the rate limiters, in requests per second
+INITIAL_RATE = 25.0
+MIN_RATE = 0.5
+MAX_RATE = 100.0
+# the amount the rate grows on each successful call
+RATE_INCREASE = 0.5
+# the factor applied to the rate on each throttled call
+RATE_DECREASE_FACTOR = 0.5
+# the minimum time between two rate decreases, so that a burst of throttled
+# responses to concurrent requests only counts once
+DECREASE_COOLDOWN = 1.0
+
+
+class AdaptiveRateLimiter:
+    """
+    A thread-safe token bucket with an adaptive refill rate.
+
+    :param name: a name for the limiter, used in log messages
+    :param initial_rate: the starting rate, in requests per second
+    :param min_rate: the rate will never be reduced below this value
+    :param max_rate: the rate will never be raised above this value
+    :param burst: the capacity of the bucket, defaults to one second of requests
+        at the initial rate
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        initial_rate: float = INITIAL_RATE,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        burst: float | None = None,
+    ) -> None:
+        if not min_rate <= initial_rate <= max_rate:
+            raise ValueError("initial_rate must be between min_rate and max_rate")
+
+        self.name = name
+        self._rate = initial_rate
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._capacity = burst if burst is not None else initial_rate
+
+        self._lock = threading.Lock()
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_decrease = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """The current rate, in requests per second."""
+        return self._rate
+
+    def acquire(self) -> None:
+        """
+        Take a token from the bucket, sleeping until one is available.
+
+        A token is reserved while holding the lock, but the sleep is done without
+        it, so that concurrent callers each wait for their own turn.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            delay = max(0.0, self._blocked_until - now)
+            if self._tokens < 0:
+                delay = max(delay, -self._tokens / self._rate)
+
+        if delay > 0:
+            log.debug(
+                "rate limiter '%s' sleeping %.3f seconds (rate=%.2f req/s)",
+                self.name,
+                delay,
+                self._rate,
+            )
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        with self._lock:
+            new_rate = min(self._max_rate, self._rate + RATE_INCREASE)
+            if new_rate != self._rate:
+                self._set_rate(new_rate, "increased")
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+                # the bucket is emptied, so that callers resume at the new rate
+                # rather than all at once when the server allows requests again
+                self._tokens = min(self._tokens, 0.0)
+
+            if now - self._last_decrease < DECREASE_COOLDOWN:
+                return
+            self._last_decrease = now
+            self._set_rate(
+                max(self._min_rate, self._rate * RATE_DECREASE_FACTOR), "decreased"
+            )
+
+    def observe_response(self, response: requests.Response) -> None:
+        """
+        Update the rate based on a response from the service.
+        """
+        if response.status_code in THROTTLE_STATUS_CODES:
+            self.record_throttle(_parse_retry_after(response))
+        elif response.status_code < 500:
+            self.record_success()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+    def _set_rate(self, new_rate: float, verb: str) -> None:
+        # tokens accrued at the old rate up to now
+        self._refill(time.monotonic())
+        self._rate = new_rate
+        log.debug(
+            "rate limiter '%s' %s rate to %.2f req/s", self.name, verb, self._rate
+        )
+
+
+class RateLimitingAdapter(HTTPAdapter):
+    """
+    A requests transport adapter which passes every request, including retries,
+    through an ``AdaptiveRateLimiter``.
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter, **kwargs: t.Any) -> None:
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: t.Any
+    ) -> requests.Response:
+        self.limiter.acquire()
+        response = super().send(request, **kwargs)
+        self.limiter.observe_response(response)
+        return response
+
+
+_LIMITERS: dict[str, AdaptiveRateLimiter] = {}
+_ADAPTERS: dict[str, RateLimitingAdapter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(host: str) -> AdaptiveRateLimiter:
+    """
+    Get the rate limiter for an API host, creating it if necessary.
+    """
+    with _LIMITERS_LOCK:
+        if host not in _LIMITERS:
+            _LIMITERS[host] = AdaptiveRateLimiter(host)
+        return _LIMITERS[host]
+
+
+def _get_adapter(host: str) -> RateLimitingAdapter:
+    limiter = get_rate_limiter(host)
+    with _LIMITERS_LOCK:
+        if host not in _ADAPTERS:
+            _ADAPTERS[host] = RateLimitingAdapter(limiter)
+        return _ADAPTERS[host]
+
+
+def install_rate_limiter(client: globus_sdk.BaseClient) -> AdaptiveRateLimiter:
+    """
+    Rate limit all of a client's requests to its service, using the limiter shared
+    by all clients for that service's host.
+
+    The transport adapter which applies the limit is shared as well, and with it
+    the adapter's pool of connections. So clients which are created one after
+    another (e.g. by successive commands in a long-lived process) reuse open
+    connections rather than making new ones.
+    """
+    parsed_url = urllib.parse.urlparse(client.base_url)
+    adapter = _get_adapter(parsed_url.netloc)
+    client.transport.session.mount(
+        f"{parsed_url.scheme}://{parsed_url.netloc}/", adapter
+    )
+    return adapter.limiter
+
+
+def _parse_retry_after(response: requests.Response) -> float | None:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,206 @@
+"""
+The common parts of the CLI's SQLite-backed stores (the identity, endpoint and
+listing caches, and the task index).
+
+Each store is a table in its own database file, in the CLI's data directory. Rows
+are kept in a namespace per profile and environment, so that data for different
+logins is kept apart. A store is opened on first use, and is simply unavailable if
+it cannot be opened, so that a broken data directory never stops a command.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+log = logging.getLogger(__name__)
+
+S = t.TypeVar("S", bound="SQLiteStore")
+
+
+class SQLiteStore:
+    """
+    A table of rows in a SQLite database, within one namespace.
+
+    Subclasses give the table's name and schema. The table must have a `namespace`
+    column, and a store with a `max_entries` limit must have the column named by
+    `evict_by`, whose lowest values are evicted first.
+
+    :param filename: The path to the database file
+    :param namespace: Rows are only visible within their namespace, so that data for
+        different profiles and environments is kept apart
+    :param ttl: The number of seconds after which an entry is stale, if entries
+        expire
+    :param max_entries: The maximum number of entries kept in the namespace, if the
+        store is bounded. Counting the entries costs as much as reading them all, so
+        they are only counted after every so many writes (1% of the limit), and the
+        namespace may briefly hold up to that many more entries.
+    """
+
+    # a name for the store, used in log messages
+    description: t.ClassVar[str]
+    table: t.ClassVar[str]
+    schema: t.ClassVar[str]
+    # a cache can always be rebuilt, so it trades durability for speed, and treats
+    # errors in using the database (e.g. if it is locked by another process for too
+    # long) as misses
+    durable: t.ClassVar[bool] = False
+    # the column ordering entries for eviction, and whether expired entries (by their
+    # `fetched_at` column) are evicted before any others
+    evict_by: t.ClassVar[str] = "fetched_at"
+    evict_expired: t.ClassVar[bool] = False
+
+    def __init__(
+        self,
+        filename: str,
+        *,
+        namespace: str,
+        ttl: float | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self.filename = filename
+        self.namespace = namespace
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._evict_interval = max(1, (max_entries or 0) // 100)
+        self._writes_since_evict = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            filename, isolation_level=None, check_same_thread=False
+        )
+        if not self.durable:
+            self._conn.execute("PRAGMA synchronous = OFF")
+        self._conn.executescript(self.schema)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextlib.contextmanager
+    def _connection(self, action: str) -> t.Iterator[sqlite3.Connection]:
+        """
+        Use the database. Unless the store is durable, any database error is logged
+        rather than raised.
+
+        :param action: What is being done, for the log message, as in "read from"
+        """
+        try:
+            with self._lock:
+                yield self._conn
+        except sqlite3.Error as err:
+            if self.durable:
+                raise
+            log.debug("could not %s the %s: %s", action, self.description, err)
+
+    @contextlib.contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> t.Iterator[None]:
+        """
+        Make several writes in one transaction, which is much faster than committing
+        each of them.
+        """
+        conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return self._ttl is None or 0 <= time.time() - fetched_at < self._ttl
+
+    def _stale_before(self) -> float:
+        """The time before which an entry which was fetched is stale."""
+        if self._ttl is None:
+            return float("-inf")
+        return time.time() - self._ttl
+
+    def clear(self) -> None:
+        with self._connection("clear") as conn:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE namespace = ?", (self.namespace,)
+            )
+
+    def __len__(self) -> int:
+        count = 0
+        with self._connection("read from") as conn:
+            (count,) = conn.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        return int(count)
+
+    def _evict(self, conn: sqlite3.Connection, *, writes: int = 1) -> None:
+        """
+        Evict entries after some entries have been written, if enough writes have
+        been made since the last eviction.
+
+        :param writes: The number of entries which were written
+        """
+        self._writes_since_evict += writes
+        if self._writes_since_evict < self._evict_interval:
+            return
+        self._writes_since_evict = 0
+
+        if self.evict_expired:
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE namespace = ? AND fetched_at < ?",
+                (self.namespace, self._stale_before()),
+            )
+        if self._max_entries is None:
+            return
+        (count,) = conn.execute(
+            f"SELECT COUNT(*) FROM {self.table} WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+        excess = count - self._max_entries
+        if excess > 0:
+            log.debug("evicting %d entries from the %s", excess, self.description)
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE rowid IN ("
+                f"  SELECT rowid FROM {self.table} WHERE namespace = ? "
+                f"  ORDER BY {self.evict_by} LIMIT ?"
+                ")",
+                (self.namespace, excess),
+            )
+
+
+class StoreHandle(t.Generic[S]):
+    """
+    The store of one kind for the current profile, which is opened on first use.
+
+    :param store_class: The class of the store
+    :param filename: The name of the database file in the data directory
+    """
+
+    def __init__(self, store_class: type[S], filename: str) -> None:
+        self.store_class = store_class
+        self.filename = filename
+        self.store: S | None = None
+
+    def get(self) -> S | None:
+        """
+        Get the store, opening it if necessary.
+
+        If the store cannot be opened (e.g. because the data directory is not
+        writable), None is returned.
+        """
+        if self.store is None:
+            from globus_cli.login_manager.storage import _resolve_namespace
+            from globus_cli.utils import ensure_data_dir
+
+            try:
+                self.store = self.store_class(
+                    os.path.join(ensure_data_dir(), self.filename),
+                    namespace=_resolve_namespace(),
+                )
+            except (OSError, sqlite3.Error) as err:
+                log.debug(
+                    "could not open the %s: %s", self.store_class.description, err
+                )
+        return self.store
@@ -0,0 +1,254 @@
+"""
+A local index of the user's Transfer tasks, filled by `globus task sync` and queried
+by `globus task list --local`.
+
+Listing tasks with Transfer is limited to 1000 results per query, and can be slow for
+users with a long task history. The index holds a copy of each task document, along
+with the columns which `task list` can filter on, so that those filters can be
+answered offline.
+
+Filters are given to the index in the same form as they are given to Transfer (e.g.
+`status:ACTIVE,INACTIVE/request_time:2024-01-01 00:00:00,`), so that `task list`
+builds one filter string for either source.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import typing as t
+
+from globus_cli.services.sqlite_store import SQLiteStore, StoreHandle
+
+# the statuses of tasks which may still change
+UNFINISHED_STATUSES = ("ACTIVE", "INACTIVE")
+
+_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS tasks (
+    namespace TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    type TEXT,
+    status TEXT,
+    label TEXT,
+    request_time TEXT,
+    completion_time TEXT,
+    document TEXT NOT NULL,
+    PRIMARY KEY (namespace, task_id)
+);
+CREATE INDEX IF NOT EXISTS tasks_request_time
+    ON tasks (namespace, request_time);
+CREATE INDEX IF NOT EXISTS tasks_status
+    ON tasks (namespace, status);
+"""
+
+# the columns which a filter may compare against a list of values
+_VALUE_FILTERS = ("task_id", "type", "status")
+# the columns which a filter may compare against a range of times
+_TIME_FILTERS = ("request_time", "completion_time")
+
+
+def normalize_time(value: str | None) -> str | None:
+    """
+    Convert a timestamp from a task document (e.g. `2021-09-02T18:04:47+00:00`) to
+    the UTC `YYYY-MM-DD HH:MM:SS` form used in task filters.
+
+    Times in this form sort in the same order as the times they represent, so the
+    index stores and compares them as strings.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _like_pattern(pattern: str) -> str:
+    # `*` is the only wildcard in a task filter, so any SQL wildcards in the pattern
+    # are escaped to match literally
+    escaped = pattern.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return escaped.replace("*", "%")
+
+
+def _label_clause(values: list[str]) -> tuple[str, list[str]]:
+    # a task must match at least one of the label patterns, and none of the negated
+    # ones
+    matches: list[str] = []
+    excludes: list[str] = []
+    params: list[str] = []
+    exclude_params: list[str] = []
+    for value in values:
+        if value.startswith("!~"):
+            excludes.append("label NOT LIKE ? ESCAPE '\\'")
+            exclude_params.append(_like_pattern(value[2:]))
+        elif value.startswith("~"):
+            matches.append("label LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(value[1:]))
+        elif value.startswith("!"):
+            excludes.append("label != ?")
+            exclude_params.append(value[1:])
+        else:
+            matches.append("label = ?")
+            params.append(value[1:] if value.startswith("=") else value)
+
+    clauses = []
+    if matches:
+        clauses.append("(" + " OR ".join(matches) + ")")
+    if excludes:
+        clauses.append("(label IS NULL OR (" + " AND ".join(excludes) + "))")
+    return " AND ".join(clauses), params + exclude_params
+
+
+def filter_to_sql(filter_string: str) -> tuple[str, list[str]]:
+    """
+    Translate a Transfer task filter into a SQL condition on the tasks table.
+
+    :param filter_string: A filter of the form `field:value,value/field:value`
+    :returns: The condition and its parameters
+    :raises ValueError: if the filter uses a field which the index does not hold
+    """
+    clauses: list[str] = []
+    params: list[str] = []
+    for part in filter_string.split("/"):
+        if not part:
+            continue
+        field, _, value = part.partition(":")
+        values = value.split(",")
+        if field in _VALUE_FILTERS:
+            clauses.append(f"{field} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        elif field in _TIME_FILTERS:
+            start, _, end = value.partition(",")
+            if start:
+                clauses.append(f"{field} >= ?")
+                params.append(start)
+            if end:
+                clauses.append(f"{field} < ?")
+                params.append(end)
+        elif field == "label":
+            clause, label_params = _label_clause(values)
+            clauses.append(clause)
+            params.extend(label_params)
+        else:
+            raise ValueError(f"cannot filter indexed tasks by '{field}'")
+    return " AND ".join(clauses) or "1", params
+
+
+class TaskIndex(SQLiteStore):
+    """
+    A SQLite-backed store of task documents, keyed by task ID.
+
+    Unlike the caches of endpoints and listings, entries in the index do not expire:
+    a task is only updated when it is synced again. The index is also not rebuilt
+    cheaply, so it is durable, and errors in reading or writing it are raised.
+    """
+
+    description = "task index"
+    table = "tasks"
+    schema = _SCHEMA
+    durable = True
+
+    def upsert(self, tasks: t.Iterable[dict[str, t.Any]]) -> tuple[int, int]:
+        """
+        Add tasks to the index, replacing any older copies of them.
+
+        :param tasks: Task documents, as returned by Transfer
+        :returns: The number of tasks which were added, and the number of tasks which
+            were already indexed and have changed
+        """
+        added, updated = 0, 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for task in tasks:
+                    document = json.dumps(task, sort_keys=True)
+                    row = self._conn.execute(
+                        "SELECT document FROM tasks "
+                        "WHERE namespace = ? AND task_id = ?",
+                        (self.namespace, task["task_id"]),
+                    ).fetchone()
+                    if row is None:
+                        added += 1
+                    elif row[0] != document:
+                        updated += 1
+                    else:
+                        continue
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            self.namespace,
+                            task["task_id"],
+                            task.get("type"),
+                            task.get("status"),
+                            task.get("label"),
+                            normalize_time(task.get("request_time")),
+                            normalize_time(task.get("completion_time")),
+                            document,
+                        ),
+                    )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return added, updated
+
+    def query(
+        self, filter_string: str = "", *, limit: int | None = None
+    ) -> list[dict[str, t.Any]]:
+        """
+        Get the indexed tasks which match a filter, most recently requested first.
+
+        :param filter_string: A Transfer task filter, see `filter_to_sql`
+        :param limit: The maximum number of tasks to return
+        """
+        condition, params = filter_to_sql(filter_string)
+        sql = (
+            "SELECT document FROM tasks "
+            f"WHERE namespace = ? AND {condition} "
+            "ORDER BY request_time DESC, task_id"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._conn.execute(sql, (self.namespace, *params)).fetchall()
+        return [json.loads(document) for (document,) in rows]
+
+    def latest_request_time(self) -> str | None:
+        """
+        The request time of the most recently requested task in the index.
+        """
+        with self._lock:
+            (value,) = self._conn.execute(
+                "SELECT MAX(request_time) FROM tasks WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        return t.cast("str | None", value)
+
+    def earliest_unfinished_request_time(self) -> str | None:
+        """
+        The request time of the oldest task in the index which is not yet finished,
+        or None if all of the indexed tasks are finished.
+
+        A task cannot complete before it is requested, so any task which has finished
+        since it was indexed has a completion time after this time.
+        """
+        with self._lock:
+            (value,) = self._conn.execute(
+                "SELECT MIN(request_time) FROM tasks "
+                "WHERE namespace = ? AND status IN (?, ?)",
+                (self.namespace, *UNFINISHED_STATUSES),
+            ).fetchone()
+        return t.cast("str | None", value)
+
+
+STORE = StoreHandle(TaskIndex, "task_index.db")
+
+
+def get_task_index() -> TaskIndex | None:
+    """
+    Get the task index for the current profile, or None if it cannot be opened.
+    """
+    return STORE.get()
@@ -4,12 +4,17 @@ from globus_cli.termio import Field, formatters
 
 from .client import CustomTransferClient
 from .data import (
+    ChunkedTaskSubmission,
     add_batch_to_transfer_data,
     assemble_generic_doc,
     display_name_or_cname,
     iterable_response_to_dict,
 )
-from .recursive_ls import RecursiveLsResponse
+from .recursive_ls import (
+    InvalidCheckpointError,
+    RecursiveLsCheckpoint,
+    RecursiveLsResponse,
+)
 
 
 class _NameFormatter(formatters.StrFormatter):
@@ -28,7 +33,10 @@ ENDPOINT_LIST_FIELDS = [
 
 __all__ = (
     "ENDPOINT_LIST_FIELDS",
+    "ChunkedTaskSubmission",
     "CustomTransferClient",
+    "InvalidCheckpointError",
+    "RecursiveLsCheckpoint",
     "RecursiveLsResponse",
     "display_name_or_cname",
     "iterable_response_to_dict",
@@ -17,7 +17,7 @@ from globus_sdk.transport import (
 from globus_cli.login_manager import get_client_login, is_client_login
 
 from .data import display_name_or_cname
-from .recursive_ls import RecursiveLsResponse
+from .recursive_ls import RecursiveLsCheckpoint, RecursiveLsResponse
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +59,8 @@ class CustomTransferClient(globus_sdk.TransferClient):
         endpoint_id: str | uuid.UUID,
         params: dict[str, t.Any],
         depth: int = 3,
+        max_workers: int = 1,
+        checkpoint: RecursiveLsCheckpoint | None = None,
     ) -> RecursiveLsResponse:
         """
         Makes recursive calls to ``GET /operation/endpoint/<endpoint_id>/ls``
@@ -72,15 +74,25 @@ class CustomTransferClient(globus_sdk.TransferClient):
             in params, the start path is determined by this endpoint.
         :param params: Parameters that will be passed through as query params.
         :param depth: The maximum file depth the recursive ls will go to.
+        :param max_workers: The maximum number of directories to list concurrently.
+        :param checkpoint: A checkpoint for saving progress, and resuming from it.
         """
         endpoint_id = str(endpoint_id)
         log.info(
-            "TransferClient.recursive_operation_ls(%s, %s, %s)",
+            "TransferClient.recursive_operation_ls(%s, %s, %s, %s)",
             endpoint_id,
             depth,
             params,
+            max_workers,
+        )
+        return RecursiveLsResponse(
+            self,
+            endpoint_id,
+            params,
+            max_depth=depth,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
         )
-        return RecursiveLsResponse(self, endpoint_id, params, max_depth=depth)
 
     def get_endpoint_w_server_list(
         self, endpoint_id: str | uuid.UUID
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import types
 import typing as t
 
 import click
@@ -11,15 +12,112 @@ from globus_cli.parsing import (
     TaskPath,
     mutex_option_group,
 )
+from globus_cli.termio import StreamingJsonDocument
 from globus_cli.types import JsonValue
 from globus_cli.utils import shlex_process_stream
 
+DataT = t.TypeVar(
+    "DataT", bound=t.Union[globus_sdk.TransferData, globus_sdk.DeleteData]
+)
+
+
+class ChunkedTaskSubmission(t.Generic[DataT]):
+    """
+    Collects the items of a task submission, splitting them into multiple tasks of
+    at most ``max_items`` items each.
+
+    Whenever the current document is full, it is submitted and replaced by a new
+    one, so that only one task's worth of items is held in memory at a time.
+
+    Use as a context manager: if an error occurs after some tasks have already been
+    submitted, their IDs are reported on stderr.
+
+    :param make_data: A callable which creates an empty task document
+    :param submit: A callable which submits a task document
+    :param max_items: The maximum number of items in a task, or None for no limit
+    :param hold_until: A callable which checks a full task document. Until it
+        accepts one, full documents are held back rather than submitted, e.g.
+        because the input is not yet known to be valid. Held documents are
+        submitted along with the first document which it accepts, or by `submit()`.
+    """
+
+    def __init__(
+        self,
+        make_data: t.Callable[[], DataT],
+        submit: t.Callable[[DataT], globus_sdk.GlobusHTTPResponse],
+        *,
+        max_items: int | None = None,
+        hold_until: t.Callable[[DataT], bool] | None = None,
+    ) -> None:
+        self._make_data = make_data
+        self._submit = submit
+        self._max_items = max_items
+        self._hold_until = hold_until
+
+        self.data: DataT = make_data()
+        self.results: list[globus_sdk.GlobusHTTPResponse] = []
+        self._held: list[DataT] = []
+
+    def __enter__(self) -> ChunkedTaskSubmission[DataT]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        if exc_type is not None and self.results:
+            task_ids = ", ".join(str(res["task_id"]) for res in self.results)
+            click.echo(
+                f"{len(self.results)} task(s) were submitted before the error "
+                f"occurred: {task_ids}",
+                err=True,
+            )
+
+    def add_item(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self.data.add_item(*args, **kwargs)
+        if self._max_items is not None and len(self.data["DATA"]) >= self._max_items:
+            self._flush()
+
+    @property
+    def holding(self) -> bool:
+        """
+        Whether full documents are still being held back, because `hold_until` has
+        not accepted one yet.
+        """
+        return self._hold_until is not None and not self.results
+
+    def submit(self) -> list[globus_sdk.GlobusHTTPResponse]:
+        """
+        Submit any items which remain (including any which are held), and return the
+        results of all submissions.
+        """
+        if self.data["DATA"] or not (self.results or self._held):
+            self._held.append(self.data)
+            self.data = self._make_data()
+        self._release()
+        return self.results
+
+    def _flush(self) -> None:
+        self._held.append(self.data)
+        self.data = self._make_data()
+        hold_until = self._hold_until
+        if hold_until is None or self.results or hold_until(self._held[-1]):
+            self._release()
+
+    def _release(self) -> None:
+        while self._held:
+            self.results.append(self._submit(self._held.pop(0)))
+
 
 def add_batch_to_transfer_data(
     source_base_path: str | None,
     dest_base_path: str | None,
     checksum_algorithm: str | globus_sdk.MissingType,
-    transfer_data: globus_sdk.TransferData,
+    transfer_data: (
+        globus_sdk.TransferData | ChunkedTaskSubmission[globus_sdk.TransferData]
+    ),
     batch: t.TextIO,
 ) -> None:
     @click.command()
@@ -54,7 +152,55 @@ def add_batch_to_transfer_data(
             recursive=recursive,
         )
 
-    shlex_process_stream(process_batch_line, batch, "--batch")
+    source_path_type = TaskPath(base_dir=source_base_path)
+    dest_path_type = TaskPath(base_dir=dest_base_path)
+
+    def fast_process_batch_line(argv: list[str]) -> bool:
+        """
+        Parse the common forms of batch lines without building a click context.
+
+        Anything unusual (unknown options, the wrong number of paths, conflicting
+        options) is declined, and left to `process_batch_line` to handle or report.
+        """
+        recursive: bool | globus_sdk.MissingType = globus_sdk.MISSING
+        external_checksum: str | globus_sdk.MissingType = globus_sdk.MISSING
+        paths: list[str] = []
+
+        args = iter(argv)
+        for arg in args:
+            if arg in ("--recursive", "-r"):
+                recursive = True
+            elif arg == "--no-recursive":
+                recursive = False
+            elif arg == "--external-checksum":
+                value = next(args, None)
+                if value is None or value.startswith("-"):
+                    return False
+                external_checksum = value
+            elif arg.startswith("--external-checksum="):
+                external_checksum = arg.partition("=")[2]
+            elif arg.startswith("-") and arg != "-":
+                return False
+            else:
+                paths.append(arg)
+
+        if len(paths) != 2 or not (
+            recursive is globus_sdk.MISSING or external_checksum is globus_sdk.MISSING
+        ):
+            return False
+
+        transfer_data.add_item(
+            str(source_path_type.convert(paths[0], None, None)),
+            str(dest_path_type.convert(paths[1], None, None)),
+            external_checksum=external_checksum,
+            checksum_algorithm=checksum_algorithm,
+            recursive=recursive,
+        )
+        return True
+
+    shlex_process_stream(
+        process_batch_line, batch, "--batch", fast_path=fast_process_batch_line
+    )
 
 
 def _none_to_missing(
@@ -71,16 +217,24 @@ def display_name_or_cname(
     return str(ep_doc["display_name"] or ep_doc["canonical_name"])
 
 
-def iterable_response_to_dict(iterator: t.Iterable[t.Any]) -> dict[str, list[t.Any]]:
-    output_dict: dict[str, list[t.Any]] = {"DATA": []}
-    for item in iterator:
-        dat = item
-        try:
-            dat = item.data
-        except AttributeError:
-            pass
-        output_dict["DATA"].append(dat)
-    return output_dict
+def iterable_response_to_dict(iterator: t.Iterable[t.Any]) -> StreamingJsonDocument:
+    """
+    Convert an iterable of items into a ``{"DATA": [...]}`` document.
+
+    The items are not consumed until the document is printed, so that JSON output
+    for paginated and recursive listings can be written as results arrive.
+    """
+
+    def iter_data() -> t.Iterator[t.Any]:
+        for item in iterator:
+            dat = item
+            try:
+                dat = item.data
+            except AttributeError:
+                pass
+            yield dat
+
+    return StreamingJsonDocument("DATA", iter_data())
 
 
 def assemble_generic_doc(datatype: str, **kwargs: t.Any) -> dict[str, t.Any]:
@@ -0,0 +1,102 @@
+"""
+Completion of remote paths, as in `globus ls ENDPOINT_ID:/path/<TAB>`.
+
+The directory containing the path is listed with Transfer, and its listing is kept in
+the listing cache, so that repeated completions in a directory are answered
+immediately. A completion must never hang the user's shell, so the listing is
+abandoned if it takes longer than a few seconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from globus_cli.services.listing_cache import ListingEntry, get_listing_cache
+
+log = logging.getLogger(__name__)
+
+# the number of seconds to wait for a directory listing
+COMPLETION_TIMEOUT = 3.0
+
+
+def _fetch_listing(endpoint_id: str, path: str) -> list[ListingEntry] | None:
+    import globus_sdk
+
+    from globus_cli.login_manager import LoginManager
+
+    try:
+        transfer_client = LoginManager().get_transfer_client()
+        transfer_client.transport.http_timeout = COMPLETION_TIMEOUT
+        # a completion is not worth retrying, the user can press TAB again
+        transfer_client.retry_config.max_retries = 0
+        response = transfer_client.operation_ls(
+            endpoint_id, path=path or globus_sdk.MISSING, show_hidden=True
+        )
+        return [(item["name"], item["type"] == "dir") for item in response]
+    # completion is best-effort, so any failure (e.g. the user is not logged in, or
+    # the collection requires consent) means that there is nothing to complete
+    except Exception as err:
+        log.debug("could not list %s:%s for completion: %s", endpoint_id, path, err)
+        return None
+
+
+def list_directory(
+    endpoint_id: str, path: str, *, timeout: float = COMPLETION_TIMEOUT
+) -> list[ListingEntry]:
+    """
+    List a directory on an endpoint, using the listing cache if possible.
+
+    :param endpoint_id: The ID of the endpoint or collection
+    :param path: The path of the directory. An empty path lists the endpoint's
+        default directory.
+    :param timeout: The number of seconds after which to give up on the listing
+    :returns: A list of (name, is_directory) pairs, which is empty if the directory
+        could not be listed in time
+    """
+    cache = get_listing_cache()
+    if cache is not None:
+        entries = cache.get(endpoint_id, path)
+        if entries is not None:
+            return entries
+
+    result: list[list[ListingEntry] | None] = []
+    # the listing runs in a daemon thread, so that a slow request (or token refresh)
+    # can be abandoned without waiting for it
+    thread = threading.Thread(
+        target=lambda: result.append(_fetch_listing(endpoint_id, path)),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout)
+    if not result:
+        log.debug("timed out listing %s:%s for completion", endpoint_id, path)
+        return []
+
+    entries = result[0]
+    if entries is None:
+        return []
+    if cache is not None:
+        cache.set(endpoint_id, path, entries)
+    return entries
+
+
+def complete_remote_path(endpoint_id: str, incomplete_path: str) -> list[str]:
+    """
+    Get the completions of a partial path on an endpoint.
+
+    Directories are completed with a trailing slash, so that completion can continue
+    into them. Hidden files are only completed when the name being completed starts
+    with a dot.
+    """
+    directory, slash, partial = incomplete_path.rpartition("/")
+    directory += slash
+
+    completions = []
+    for name, is_dir in list_directory(endpoint_id, directory):
+        if not name.startswith(partial):
+            continue
+        if name.startswith(".") and not partial.startswith("."):
+            continue
+        completions.append(directory + name + ("/" if is_dir else ""))
+    return sorted(completions)
@@ -2,36 +2,140 @@
 
 from __future__ import annotations
 
+import itertools
+import json
 import logging
+import os
 import time
 import typing as t
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import globus_sdk
 
+from globus_cli.login_manager.utils import refresh_token_if_needed
+from globus_cli.utils import make_dict_json_serializable
+
 log = logging.getLogger(__name__)
 
 ITEM_T = t.Dict[str, t.Any]
-QUEUE_T = t.Deque[t.Tuple[t.Optional[str], str, int]]
-
-# constants for controlling client-side rate limiting
-SLEEP_FREQUENCY = 25
-SLEEP_LEN = 1
-
-
-def _client_side_limiter() -> t.Iterator[None]:
-    counter = 0
-    while True:
-        counter += 1
-        # rate limit based on number of ls calls we have made
-        if counter % SLEEP_FREQUENCY == 0:
-            log.debug(
-                "recursive_operation_ls sleeping %s seconds to rate limit itself.",
-                SLEEP_LEN,
+QUEUE_ITEM_T = t.Tuple[t.Optional[str], str, int]
+QUEUE_T = t.Deque[QUEUE_ITEM_T]
+
+# the minimum number of seconds between saves of a checkpoint file
+CHECKPOINT_INTERVAL = 5
+CHECKPOINT_VERSION = 1
+
+
+class InvalidCheckpointError(ValueError):
+    """
+    A checkpoint file which cannot be used to resume a listing.
+    """
+
+
+class RecursiveLsCheckpoint:
+    """
+    A file which records the progress of a recursive ls, so that an interrupted
+    listing can be resumed.
+
+    The checkpoint holds the queue of directories which have yet to be listed, and
+    a cursor over the items which have already been emitted. It is only written
+    between directory listings, so resuming from it never repeats or skips part of
+    a directory.
+
+    :param filename: The path to the checkpoint file.
+    :param interval: The minimum number of seconds between periodic saves.
+    """
+
+    def __init__(self, filename: str, *, interval: float = CHECKPOINT_INTERVAL) -> None:
+        self.filename = filename
+        self._interval = interval
+        self._last_save: float | None = None
+
+    def load(self, key: dict[str, t.Any]) -> tuple[QUEUE_T, int] | None:
+        """
+        Load the queue and count of emitted items from the checkpoint file.
+
+        :param key: A description of the listing; the checkpoint must have been
+            saved with the same key.
+        :returns: None if the file does not exist
+        :raises InvalidCheckpointError: if the file is not a checkpoint for this
+            listing
+        """
+        try:
+            with open(self.filename, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            raise InvalidCheckpointError(
+                f"'{self.filename}' is not a valid recursive ls checkpoint file."
             )
-            time.sleep(SLEEP_LEN)
 
-        yield
+        if data.get("version") != CHECKPOINT_VERSION or data.get("key") != key:
+            raise InvalidCheckpointError(
+                f"'{self.filename}' is a checkpoint for a different listing. "
+                "Use the same endpoint, path, and options to resume, or remove "
+                "the file to start a new listing."
+            )
+
+        cursor = data["cursor"]
+        log.info(
+            "resuming recursive ls from checkpoint '%s' after %d items (last: '%s')",
+            self.filename,
+            cursor["emitted"],
+            cursor["last_path"],
+        )
+        dir_queue: QUEUE_T = deque(
+            (abs_path, rel_path, depth) for abs_path, rel_path, depth in data["queue"]
+        )
+        return dir_queue, cursor["emitted"]
+
+    def maybe_save(
+        self,
+        key: dict[str, t.Any],
+        dir_queue: QUEUE_T,
+        emitted: int,
+        last_path: str | None,
+    ) -> None:
+        """Save the checkpoint if the save interval has elapsed."""
+        now = time.monotonic()
+        if self._last_save is None or now - self._last_save >= self._interval:
+            self.save(key, dir_queue, emitted, last_path)
+
+    def save(
+        self,
+        key: dict[str, t.Any],
+        dir_queue: QUEUE_T,
+        emitted: int,
+        last_path: str | None,
+    ) -> None:
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "key": key,
+            "cursor": {"emitted": emitted, "last_path": last_path},
+            "queue": list(dir_queue),
+        }
+        # write to a temporary file and then move it into place, so that an
+        # interruption while saving never leaves a truncated checkpoint behind
+        tmp_filename = f"{self.filename}.tmp"
+        with open(tmp_filename, "w", encoding="utf-8") as fp:
+            json.dump(data, fp)
+        os.replace(tmp_filename, self.filename)
+
+        self._last_save = time.monotonic()
+        log.debug(
+            "saved recursive ls checkpoint '%s' (%d queued, %d emitted)",
+            self.filename,
+            len(dir_queue),
+            emitted,
+        )
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
 
 
 class RecursiveLsResponse:
@@ -43,12 +147,20 @@ class RecursiveLsResponse:
 
     Uses an internal queue for BFS of the filesystem.
 
-    Rate limits calls to reduce the changes of connection errors.
+    Calls are rate limited by the client-side rate limiter shared by all clients of
+    the Transfer service (see ``globus_cli.services.rate_limit``).
+
+    When ``max_workers`` is greater than 1, directories which are next in the queue
+    are listed concurrently by a pool of worker threads. Results are still yielded
+    in the same order as a serial listing would produce them.
 
     :param client: `TransferClient`` used for making the operation_ls calls.
     :param endpoint_id: The endpoint that will be recursively ls'ed.
     :param ls_params: Query params sent to operation_ls
     :param max_depth: The maximum depth the recursive ls will go into the filesys
+    :param max_workers: The maximum number of operation_ls calls to run at once
+    :param checkpoint: A checkpoint used to save progress, and to resume from any
+        progress which was already saved.
     """
 
     def __init__(
@@ -58,11 +170,18 @@ class RecursiveLsResponse:
         ls_params: dict[str, t.Any],
         *,
         max_depth: int = 3,
+        max_workers: int = 1,
+        checkpoint: RecursiveLsCheckpoint | None = None,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         self._client = client
         self._endpoint_id = endpoint_id
         self._ls_params = ls_params
         self._max_depth = max_depth
+        self._max_workers = max_workers
+        self._checkpoint = checkpoint
 
         start_path = t.cast(t.Optional[str], ls_params.get("path"))
         log.info(
@@ -99,52 +218,131 @@ class RecursiveLsResponse:
         We rely on the implicit StopIteration built into this type of function
         to propagate through the final `next()` call.
         """
-        # iterator used for client-side limiting
-        limiter = _client_side_limiter()
-
         # queue of (absolute_path, relative_path, depth) tuples.
         dir_queue: QUEUE_T = deque()
         # initialized with the start path (if any) and a depth of 0
         dir_queue.append((start_path, "", 0))
 
-        # BFS is not done until the queue is empty
-        while dir_queue:
-            next(limiter)
-            log.debug(
-                "recursive_operation_ls BFS queue not empty, getting next path now."
+        # a cursor over the items which have been emitted, for checkpoints
+        emitted = 0
+        last_path: str | None = None
+        if self._checkpoint is not None:
+            resumed = self._checkpoint.load(self._checkpoint_key)
+            if resumed is not None:
+                dir_queue, emitted = resumed
+
+        # listings which were started ahead of time by the worker pool, keyed
+        # by their queue entries
+        prefetched: dict[QUEUE_ITEM_T, Future[globus_sdk.IterableTransferResponse]] = {}
+        executor: ThreadPoolExecutor | None = None
+        if self._max_workers > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="recursive_ls"
             )
 
-            # get path and current depth from the queue
-            abs_path, rel_path, depth = dir_queue.pop()
-
-            # set the target path to the popped absolute path if it exists
-            if abs_path is not None:
-                self._ls_params["path"] = abs_path
-
-            # do the operation_ls with the updated params
-            res = self._client.operation_ls(self._endpoint_id, **self._ls_params)
-            res_data = res["DATA"]
-
-            # add to the queue if there are additional listings to do
-            # and we are not at the depth limit
-            if depth < self._max_depth:
-                # queue data includes the dir's name in the absolute and relative paths
-                # and increases the depth by one.
-                dir_queue.extend(
-                    [
-                        (
-                            res["path"] + item["name"],
-                            (rel_path + "/" if rel_path else "") + item["name"],
-                            depth + 1,
-                        )
-                        # data is reversed to maintain any "orderby" ordering
-                        for item in reversed(res_data)
-                        if item["type"] == "dir"
-                    ]
+        try:
+            # BFS is not done until the queue is empty
+            while dir_queue:
+                log.debug(
+                    "recursive_operation_ls BFS queue not empty, getting next path now."
                 )
 
-            # for each item in the response data update the item's name with
-            # the relative path popped from the queue, and yield the item
-            for item in res_data:
-                item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
-                yield t.cast(ITEM_T, item)
+                # all items from prior listings have been emitted, so this is a
+                # consistent point at which to save progress
+                if self._checkpoint is not None:
+                    self._checkpoint.maybe_save(
+                        self._checkpoint_key, dir_queue, emitted, last_path
+                    )
+
+                if executor is not None:
+                    self._prefetch(executor, dir_queue, prefetched)
+
+                # get path and current depth from the queue
+                entry = dir_queue.pop()
+                abs_path, rel_path, depth = entry
+
+                try:
+                    if entry in prefetched:
+                        res = prefetched.pop(entry).result()
+                    else:
+                        res = self._operation_ls(abs_path)
+                # if the listing fails or is interrupted, put the entry back and
+                # save progress, so that a resumed listing starts right here
+                except BaseException:
+                    if self._checkpoint is not None:
+                        dir_queue.append(entry)
+                        self._checkpoint.save(
+                            self._checkpoint_key, dir_queue, emitted, last_path
+                        )
+                    raise
+                res_data = res["DATA"]
+
+                # add to the queue if there are additional listings to do
+                # and we are not at the depth limit
+                if depth < self._max_depth:
+                    # queue data includes the dir's name in the absolute and
+                    # relative paths and increases the depth by one.
+                    dir_queue.extend(
+                        [
+                            (
+                                res["path"] + item["name"],
+                                (rel_path + "/" if rel_path else "") + item["name"],
+                                depth + 1,
+                            )
+                            # data is reversed to maintain any "orderby" ordering
+                            for item in reversed(res_data)
+                            if item["type"] == "dir"
+                        ]
+                    )
+
+                # for each item in the response data update the item's name with
+                # the relative path popped from the queue, and yield the item
+                for item in res_data:
+                    item["name"] = (rel_path + "/" if rel_path else "") + item["name"]
+                    emitted += 1
+                    last_path = item["name"]
+                    yield t.cast(ITEM_T, item)
+
+            # the listing is complete, there is nothing left to resume
+            if self._checkpoint is not None:
+                self._checkpoint.remove()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def _checkpoint_key(self) -> dict[str, t.Any]:
+        return {
+            "endpoint_id": self._endpoint_id,
+            "ls_params": make_dict_json_serializable(self._ls_params),
+            "max_depth": self._max_depth,
+        }
+
+    def _prefetch(
+        self,
+        executor: ThreadPoolExecutor,
+        dir_queue: QUEUE_T,
+        prefetched: dict[QUEUE_ITEM_T, Future[globus_sdk.IterableTransferResponse]],
+    ) -> None:
+        """
+        Start listings for the entries which will be popped from the queue next.
+
+        Because only the head of the queue is fetched ahead of time, the order in
+        which results are yielded is the same as for a serial listing.
+        """
+        refresh_token_if_needed(self._client)
+
+        for entry in itertools.islice(reversed(dir_queue), self._max_workers):
+            if entry not in prefetched:
+                prefetched[entry] = executor.submit(self._operation_ls, entry[0])
+
+    def _operation_ls(
+        self, abs_path: str | None
+    ) -> globus_sdk.IterableTransferResponse:
+        # set the target path to the absolute path if it exists
+        # the params are copied so that concurrent calls do not share state
+        ls_params = dict(self._ls_params)
+        if abs_path is not None:
+            ls_params["path"] = abs_path
+
+        return self._client.operation_ls(self._endpoint_id, **ls_params)
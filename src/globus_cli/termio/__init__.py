@@ -1,6 +1,9 @@
+from __future__ import annotations
+
+import typing as t
+
 import click
 
-from ._display import display
 from .context import (
     env_interactive,
     err_is_terminal,
@@ -8,13 +11,39 @@ from .context import (
     is_verbose,
     out_is_terminal,
     outformat_is_json,
+    outformat_is_jsonl,
     outformat_is_text,
     outformat_is_unix,
     term_is_interactive,
     verbosity,
 )
-from .errors import PrintableErrorField, write_error_info
-from .field import Field
+
+if t.TYPE_CHECKING:
+    from ._display import display
+    from .errors import PrintableErrorField, write_error_info
+    from .field import Field
+    from .printers import StreamingJsonDocument
+
+# names which are imported on first use, because they pull in the printers and
+# formatters, which the CLI does not need merely to start up (e.g. for `--help`)
+_LAZY_NAMES = {
+    "display": "._display",
+    "PrintableErrorField": ".errors",
+    "write_error_info": ".errors",
+    "Field": ".field",
+    "StreamingJsonDocument": ".printers",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_LAZY_NAMES[name], __name__), name)
+    globals()[name] = value
+    return value
 
 
 def print_command_hint(message: str, *, color: str = "yellow") -> None:
@@ -31,12 +60,14 @@ __all__ = [
     "PrintableErrorField",
     "write_error_info",
     "Field",
+    "StreamingJsonDocument",
     "display",
     "out_is_terminal",
     "env_interactive",
     "err_is_terminal",
     "term_is_interactive",
     "outformat_is_json",
+    "outformat_is_jsonl",
     "outformat_is_text",
     "outformat_is_unix",
     "get_jmespath_expression",
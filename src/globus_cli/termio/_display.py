@@ -6,10 +6,16 @@ import typing as t
 import click
 import globus_sdk
 
-from .context import outformat_is_json, outformat_is_text, outformat_is_unix
+from .context import (
+    outformat_is_json,
+    outformat_is_jsonl,
+    outformat_is_text,
+    outformat_is_unix,
+)
 from .field import Field
 from .printers import (
     CustomPrinter,
+    JsonLinesPrinter,
     JsonPrinter,
     Printer,
     RecordListPrinter,
@@ -89,9 +95,9 @@ class Renderer:
 
         :param json_converter: a callable to preprocess of JSON output. It must accept
             ``response_data`` and produce another dict or dict-like object
-            (json/unix output only)
+            (json/jsonl/unix output only)
         :param sort_json_keys: If True, JSON keys are rendered sorted. Default: True.
-            (json output only)
+            (json/jsonl output only)
         """
 
         if isinstance(response_data, globus_sdk.GlobusHTTPResponse):
@@ -136,6 +142,9 @@ class Renderer:
         if outformat_is_json() or (outformat_is_text() and text_mode == self.JSON):
             data = json_converter(response_data) if json_converter else response_data
             JsonPrinter(sort_keys=sort_json_keys).echo(data, stream=stream)
+        elif outformat_is_jsonl():
+            data = json_converter(response_data) if json_converter else response_data
+            JsonLinesPrinter(sort_keys=sort_json_keys).echo(data, stream=stream)
         elif outformat_is_unix():
             data = json_converter(response_data) if json_converter else response_data
             UnixPrinter().echo(data, stream=stream)
@@ -28,6 +28,15 @@ def outformat_is_unix() -> bool:
     return state.outformat_is_unix()
 
 
+def outformat_is_jsonl() -> bool:
+    """
+    Only safe to call within a click context.
+    """
+    ctx = click.get_current_context()
+    state = ctx.ensure_object(CommandState)
+    return state.outformat_is_jsonl()
+
+
 def outformat_is_text() -> bool:
     """
     Only safe to call within a click context.
@@ -4,7 +4,7 @@ import json
 
 import click
 
-from .context import outformat_is_json
+from .context import outformat_is_json, outformat_is_jsonl
 
 
 class PrintableErrorField:
@@ -43,16 +43,17 @@ class PrintableErrorField:
 
 
 def write_error_info(error_name: str, fields: list[PrintableErrorField]) -> None:
-    if outformat_is_json():
+    if outformat_is_json() or outformat_is_jsonl():
         # dictify joined tuple lists and dump to json string
+        # for JSON Lines output, the error is written on a single line
         message = click.style(
             json.dumps(
                 dict(
                     [("error_name", error_name)]
                     + [(f.name, f.raw_value) for f in fields]
                 ),
-                indent=2,
-                separators=(",", ": "),
+                indent=None if outformat_is_jsonl() else 2,
+                separators=(",", ":") if outformat_is_jsonl() else (",", ": "),
                 sort_keys=True,
             ),
             fg="yellow",
@@ -28,8 +28,14 @@ class PrincipalFormatter(FieldFormatter[t.Tuple[str, str]]):
     """
 
     def __init__(self, auth_client: globus_sdk.AuthClient) -> None:
+        from globus_cli.services.identity_cache import get_identity_cache
+
         self.auth_client = auth_client
-        self.resolved_ids = globus_sdk.IdentityMap(auth_client)
+        # identities are looked up in the persistent cache before going to Auth,
+        # and any which are looked up are added to it
+        self.resolved_ids = globus_sdk.IdentityMap(
+            auth_client, cache=get_identity_cache()
+        )
 
     def render_identity_id(self, identity_id: str) -> str:
         try:
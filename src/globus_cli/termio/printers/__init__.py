@@ -1,6 +1,7 @@
 from .base import Printer
 from .custom_printer import CustomPrinter
-from .json_printer import JsonPrinter
+from .json_printer import JsonLinesPrinter, JsonPrinter
+from .json_stream import StreamingJsonDocument
 from .record_printer import RecordListPrinter, RecordPrinter
 from .table_printer import TablePrinter
 from .unix_printer import UnixPrinter
@@ -9,6 +10,8 @@ __all__ = (
     "Printer",
     "CustomPrinter",
     "JsonPrinter",
+    "JsonLinesPrinter",
+    "StreamingJsonDocument",
     "UnixPrinter",
     "TablePrinter",
     "RecordPrinter",
@@ -8,6 +8,7 @@ import globus_sdk
 from globus_cli.types import JsonValue
 
 from ..context import get_jmespath_expression
+from .json_stream import StreamingJsonDocument
 
 DataType = t.TypeVar("DataType")
 
@@ -20,12 +21,15 @@ class Printer(abc.ABC, t.Generic[DataType]):
 
     @classmethod
     def jmespath_preprocess(
-        cls, res: JsonValue | globus_sdk.GlobusHTTPResponse
+        cls,
+        res: JsonValue | globus_sdk.GlobusHTTPResponse | StreamingJsonDocument,
     ) -> t.Any:
         jmespath_expr = get_jmespath_expression()
 
         if isinstance(res, globus_sdk.GlobusHTTPResponse):
             res = res.data
+        elif isinstance(res, StreamingJsonDocument):
+            res = res.materialize()
 
         if not isinstance(res, str):
             if jmespath_expr is not None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import textwrap
 import typing as t
 
 import click
@@ -8,9 +9,11 @@ import globus_sdk
 
 from globus_cli.types import JsonValue
 
+from ..context import get_jmespath_expression
 from .base import Printer
+from .json_stream import StreamingJsonDocument
 
-DataObject = t.Union[JsonValue, globus_sdk.GlobusHTTPResponse]
+DataObject = t.Union[JsonValue, globus_sdk.GlobusHTTPResponse, StreamingJsonDocument]
 
 
 class JsonPrinter(Printer[DataObject]):
@@ -26,6 +29,9 @@ class JsonPrinter(Printer[DataObject]):
       "f": 7
     }
 
+    A ``StreamingJsonDocument`` is printed item by item, as the items are produced,
+    unless a jmespath expression needs to be applied to the whole document.
+
     :param sort_keys: if True, sort the keys of the json object before printing.
     """
 
@@ -33,6 +39,75 @@ class JsonPrinter(Printer[DataObject]):
         self._sort_keys = sort_keys
 
     def echo(self, data: DataObject, stream: t.IO[str] | None = None) -> None:
+        if (
+            isinstance(data, StreamingJsonDocument)
+            and get_jmespath_expression() is None
+        ):
+            self._echo_streaming(data, stream)
+            return
+
         res = JsonPrinter.jmespath_preprocess(data)
         res = json.dumps(res, indent=2, sort_keys=self._sort_keys)
         click.echo(res, file=stream)
+
+    def _echo_streaming(
+        self, data: StreamingJsonDocument, stream: t.IO[str] | None
+    ) -> None:
+        """
+        Print a streaming document, producing the same text as ``json.dumps`` would
+        for the materialized document.
+        """
+        click.echo(f"{{\n  {json.dumps(data.key)}: [", file=stream, nl=False)
+
+        separator = "\n"
+        for item in data:
+            item_text = json.dumps(item, indent=2, sort_keys=self._sort_keys)
+            click.echo(
+                separator + textwrap.indent(item_text, "    "), file=stream, nl=False
+            )
+            separator = ",\n"
+
+        # the separator is only changed if there was at least one item
+        click.echo("]\n}" if separator == "\n" else "\n  ]\n}", file=stream)
+
+
+class JsonLinesPrinter(Printer[DataObject]):
+    """
+    A printer to render data as JSON Lines, one compact json document per line:
+
+    {"a":"b","c":1}
+    {"a":"d","c":2}
+
+    Lists of items are printed with one item per line. A list may be
+    - the items of a ``StreamingJsonDocument``, printed as they are produced
+    - a json array
+    - the "DATA" array of a json object, as used in Transfer API responses
+
+    Any other data is printed on a single line.
+
+    :param sort_keys: if True, sort the keys of the json objects before printing.
+    """
+
+    def __init__(self, *, sort_keys: bool = True) -> None:
+        self._sort_keys = sort_keys
+
+    def echo(self, data: DataObject, stream: t.IO[str] | None = None) -> None:
+        for record in self._iter_records(data):
+            click.echo(
+                json.dumps(record, separators=(",", ":"), sort_keys=self._sort_keys),
+                file=stream,
+            )
+
+    def _iter_records(self, data: DataObject) -> t.Iterable[t.Any]:
+        if (
+            isinstance(data, StreamingJsonDocument)
+            and get_jmespath_expression() is None
+        ):
+            return data
+
+        res = JsonLinesPrinter.jmespath_preprocess(data)
+        if isinstance(res, list):
+            return res
+        if isinstance(res, dict) and isinstance(res.get("DATA"), list):
+            return t.cast(t.List[t.Any], res["DATA"])
+        return (res,)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import typing as t
+
+from globus_cli.types import JsonValue
+
+
+class StreamingJsonDocument:
+    """
+    A JSON document of the form ``{key: [item, ...]}`` whose items are produced
+    lazily, e.g. as pages of results arrive.
+
+    The ``JsonPrinter`` writes each item as soon as it is produced, so the full list
+    is never held in memory. Printers which need the whole document use
+    ``materialize()`` instead.
+
+    A document can only be iterated once.
+
+    :param key: the key under which the items are listed
+    :param items: an iterable of JSON data
+    """
+
+    def __init__(self, key: str, items: t.Iterable[JsonValue]) -> None:
+        self.key = key
+        self._items = items
+
+    def __iter__(self) -> t.Iterator[JsonValue]:
+        yield from self._items
+
+    def materialize(self) -> dict[str, JsonValue]:
+        return {self.key: list(self)}
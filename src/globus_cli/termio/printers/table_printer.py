@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import functools
+import itertools
 import typing as t
 
 import click
@@ -8,6 +9,9 @@ import click
 from ..field import Field
 from .base import Printer
 
+# the number of rows used to compute column widths before rows start to print
+DEFAULT_MAX_LOOKAHEAD = 1000
+
 
 class TablePrinter(Printer[t.Iterable[t.Any]]):
     """
@@ -17,15 +21,27 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
     -------------- | -------------- | ... | --------------
     <obj1.value 1> | <obj1.value 2> | ... | <obj1.value N>
 
+    Rows are streamed: column widths are computed from the first ``max_lookahead``
+    rows, and those rows are printed as soon as they are available. Any later row
+    with a cell wider than its column is printed without truncation, overflowing
+    the column.
+
     :param fields: a list of Fields with load and render instructions; one per column.
     :param print_headers: if False, omit the header row & separator row.
+    :param max_lookahead: the number of rows used to compute column widths. If None,
+        all rows are read before any are printed.
     """
 
     def __init__(
-        self, fields: t.Iterable[Field], *, print_headers: bool = True
+        self,
+        fields: t.Iterable[Field],
+        *,
+        print_headers: bool = True,
+        max_lookahead: int | None = DEFAULT_MAX_LOOKAHEAD,
     ) -> None:
         self._fields = tuple(fields)
         self._print_headers = print_headers
+        self._max_lookahead = max_lookahead
 
     def echo(self, data: t.Iterable[t.Any], stream: t.IO[str] | None = None) -> None:
         """
@@ -36,8 +52,12 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
         """
         echo = functools.partial(click.echo, file=stream)
 
+        data_iter = iter(data)
         try:
-            table = DataTable.from_data(self._fields, data)
+            # only the lookahead rows are held in memory, to size the columns
+            table = DataTable.from_data(
+                self._fields, itertools.islice(data_iter, self._max_lookahead)
+            )
 
             if self._print_headers:
                 echo(self._serialize_row(table, self._headers))
@@ -46,6 +66,10 @@ class TablePrinter(Printer[t.Iterable[t.Any]]):
             for y in range(table.num_rows):
                 values = [table[x, y] for x in range(table.num_columns)]
                 echo(self._serialize_row(table, values))
+
+            for data_obj in data_iter:
+                row = tuple(field.serialize(data_obj) for field in self._fields)
+                echo(self._serialize_row(table, row))
         except EmptyTableError:
             if self._print_headers:
                 header_table = DataTable((self._headers,))
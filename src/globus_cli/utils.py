@@ -1,5 +1,13 @@
 from __future__ import annotations
 
+import collections
+import collections.abc
+import itertools
+import os
+import queue
+import re
+import sys
+import threading
 import typing as t
 import uuid
 
@@ -12,8 +20,10 @@ if t.TYPE_CHECKING:
     # NB: GARE parsing requires other SDK components and therefore needs to be deferred
     # to avoid the performance impact of non-lazy imports
     from globus_sdk.gare import GARE
+    from globus_sdk.paging import Paginator
 
     from globus_cli.services.auth import CustomAuthClient
+    from globus_cli.termio import StreamingJsonDocument
 
 F = t.TypeVar("F", bound=AnyCallable)
 
@@ -28,6 +38,38 @@ def str2bool(v: str) -> bool | None:
         return None
 
 
+def get_data_dir() -> str:
+    # get the dir to store Globus CLI data
+    #
+    # on Windows, the datadir is typically
+    #   ~\AppData\Local\globus\cli
+    #
+    # on Linux and macOS, we use
+    #   ~/.globus/cli/
+    #
+    # This is not necessarily a match with XDG_DATA_HOME or macOS use of
+    # '~/Library/Application Support'. The simplified directories for non-Windows
+    # platforms will allow easier access to the dir if necessary in support of users
+    if sys.platform == "win32":
+        # try to get the app data dir, preferring the local appdata
+        datadir = os.getenv("LOCALAPPDATA", os.getenv("APPDATA"))
+        if not datadir:
+            home = os.path.expanduser("~")
+            datadir = os.path.join(home, "AppData", "Local")
+        return os.path.join(datadir, "globus", "cli")
+    else:
+        return os.path.expanduser("~/.globus/cli/")
+
+
+def ensure_data_dir() -> str:
+    dirname = get_data_dir()
+    try:
+        os.makedirs(dirname)
+    except FileExistsError:
+        pass
+    return dirname
+
+
 def make_dict_json_serializable(data: dict[str, t.Any]) -> dict[str, t.Any]:
     return {
         k: _make_json_serializable(v)
@@ -132,14 +174,171 @@ def format_plural_str(
     return formatstr.format(**argdict)
 
 
+# the number of pages which are fetched ahead of the page being displayed
+PREFETCH_DEPTH = 2
+# the number of pages of offset-paginated results which are requested at once
+PARALLEL_PAGE_REQUESTS = 4
+
+
+def offset_pages(
+    paginator: Paginator[t.Any],
+    *,
+    limit: int | None = None,
+    max_workers: int = PARALLEL_PAGE_REQUESTS,
+) -> t.Iterator[t.Any]:
+    """
+    Iterate over the pages of an offset-paginated call, like `paginator.pages()`, but
+    request several pages at once. Pages are yielded in order.
+
+    The first page is fetched alone, to find the page size (and, where the API
+    reports it, the total number of results). The offsets of the remaining pages are
+    then requested by a pool of `max_workers` threads, no more than `max_workers`
+    pages ahead of the page being yielded. Without a total, the requests continue
+    until a page reports that there is no next page.
+
+    If a `limit` is given, no results past that limit are requested.
+    """
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from globus_sdk.paging import HasNextPaginator, LimitOffsetTotalPaginator
+
+    if not isinstance(paginator, (HasNextPaginator, LimitOffsetTotalPaginator)):
+        raise TypeError(f"{type(paginator).__name__} is not an offset paginator")
+
+    # the offset at which to stop requesting results, if it is known yet
+    # some paginated methods do not set a maximum, in which case it may be None
+    end: int | None = paginator.max_total_results
+    if limit is not None:
+        end = limit if end is None else min(end, limit)
+    page_size = paginator.limit if end is None else min(paginator.limit, end)
+
+    def fetch(offset: int) -> t.Any:
+        kwargs = {
+            **paginator.client_kwargs,
+            "offset": offset,
+            "limit": page_size if end is None else min(page_size, end - offset),
+        }
+        return paginator.method(*paginator.client_args, **kwargs)
+
+    first_page = fetch(0)
+    yield first_page
+    # the service may return fewer results than were asked for, so the first page
+    # shows the size of the pages which follow
+    page_size = paginator.get_page_size(first_page)
+    if isinstance(paginator, LimitOffsetTotalPaginator):
+        total: int = first_page["total"]
+        end = total if end is None else min(end, total)
+    elif not first_page["has_next_page"]:
+        return
+    if page_size == 0:
+        return
+
+    offsets: t.Iterator[int] = (
+        itertools.count(page_size, page_size)
+        if end is None
+        else iter(range(page_size, end, page_size))
+    )
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        window: collections.deque[Future[t.Any]] = collections.deque(
+            executor.submit(fetch, offset)
+            for offset in itertools.islice(offsets, max_workers)
+        )
+        while window:
+            page = window.popleft().result()
+            yield page
+            if not isinstance(paginator, LimitOffsetTotalPaginator) and not page.get(
+                "has_next_page"
+            ):
+                return
+            for offset in itertools.islice(offsets, 1):
+                window.append(executor.submit(fetch, offset))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def prefetch_items(
+    paginator: Paginator[t.Any],
+    *,
+    limit: int | None = None,
+    depth: int = PREFETCH_DEPTH,
+) -> t.Iterator[t.Any]:
+    """
+    Iterate over the items of a paginator, like `paginator.items()`, but fetch the
+    pages in a background thread, so that the next page is already on its way while
+    the current one is displayed.
+
+    At most `depth` pages are held ahead of the consumer. If a `limit` is given, no
+    more pages are fetched once that many items have arrived.
+    An error from fetching a page is raised when that page would have been reached.
+    """
+    if paginator.items_key is None:
+        raise ValueError("Cannot prefetch items from a paginator without an items_key")
+    items_key: str = paginator.items_key
+
+    pages: queue.Queue[tuple[str, t.Any]] = queue.Queue(maxsize=depth)
+    # set when the consumer stops iterating, so that the fetching thread stops too
+    stopped = threading.Event()
+
+    def put(kind: str, value: t.Any) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fetch() -> None:
+        fetched = 0
+        try:
+            for page in _iter_pages(paginator, limit=limit):
+                items = page[items_key]
+                if not put("page", items):
+                    return
+                fetched += len(items)
+                if limit is not None and fetched >= limit:
+                    break
+        except Exception as err:
+            put("error", err)
+            return
+        put("done", None)
+
+    threading.Thread(target=fetch, daemon=True).start()
+    try:
+        while True:
+            kind, value = pages.get()
+            if kind == "error":
+                raise value
+            if kind == "done":
+                return
+            yield from value
+    finally:
+        stopped.set()
+
+
+def _iter_pages(paginator: Paginator[t.Any], *, limit: int | None) -> t.Iterator[t.Any]:
+    from globus_sdk.paging import HasNextPaginator, LimitOffsetTotalPaginator
+
+    if isinstance(paginator, (HasNextPaginator, LimitOffsetTotalPaginator)):
+        return offset_pages(paginator, limit=limit)
+    return paginator.pages()
+
+
 # wrap to add a `has_next()` method and `limit` param to a naive iterator
+# given a paginator, rather than an iterator, its pages are prefetched
 class PagingWrapper:
     def __init__(
         self,
-        iterator: t.Iterator[t.Any],
+        iterator: t.Iterator[t.Any] | Paginator[t.Any],
         limit: int | None = None,
         json_conversion_key: str | None = None,
     ) -> None:
+        if not isinstance(iterator, collections.abc.Iterator):
+            # fetch one result past the limit, which `has_next()` looks for
+            iterator = prefetch_items(
+                iterator, limit=None if limit is None else limit + 1
+            )
         self.iterator = iterator
         self.next = None
         self.limit = limit
@@ -166,49 +365,83 @@ class PagingWrapper:
     @property
     def json_converter(
         self,
-    ) -> t.Callable[[t.Iterator[t.Any]], dict[str, list[t.Any]]]:
+    ) -> t.Callable[[t.Iterator[t.Any]], StreamingJsonDocument]:
         if self.json_conversion_key is None:
             raise NotImplementedError("does not support json_converter")
         key: str = self.json_conversion_key
 
-        def converter(it: t.Iterator[t.Any]) -> dict[str, list[t.Any]]:
-            return {key: list(it)}
+        def converter(it: t.Iterator[t.Any]) -> StreamingJsonDocument:
+            from globus_cli.termio import StreamingJsonDocument
+
+            return StreamingJsonDocument(key, it)
 
         return converter
 
 
 def shlex_process_stream(
-    process_command: click.Command, stream: t.TextIO, name: str
+    process_command: click.Command,
+    stream: t.TextIO,
+    name: str,
+    *,
+    fast_path: t.Callable[[list[str]], bool] | None = None,
 ) -> None:
     """
     Use shlex to process stdin line-by-line.
     Also prints help text.
 
+    The stream is read one line at a time, so that large inputs are never held
+    in memory all at once.
+
     Requires that @process_command be a Click command object, used for
     processing single lines of input. helptext is prepended to the standard
     message printed to interactive sessions.
+
+    Building a click context for every line is by far the most expensive part of
+    processing, so a `fast_path` callable may be given to handle the common forms of
+    lines directly. It is tried first with each argument vector, and returns False
+    to decline a line, which is then processed (and any error reported) by
+    @process_command as usual.
     """
+    for lineno, line in enumerate(stream):
+        argv = split_batch_line(line)
+        if not argv or (fast_path is not None and fast_path(argv)):
+            continue
+
+        try:
+            with process_command.make_context(f"<process {name}>", argv) as ctx:
+                process_command.invoke(ctx)
+        except click.ClickException as error:
+            click.echo(
+                f"error encountered processing '{name}' in "
+                f"{stream.name} at line {lineno}:",
+                err=True,
+            )
+            click.echo(
+                click.style(f"  {error.format_message()}", fg="yellow"), err=True
+            )
+            click.get_current_context().exit(2)
+
+
+# characters which have a special meaning to shlex -- if a line contains none of them,
+# it can be split on whitespace alone
+_SHLEX_SPECIAL_CHARS = re.compile(r"[\\\"'#]")
+_SHLEX_WHITESPACE_SPLIT = re.compile(r"[^ \t\r\n]+")
+
+
+def split_batch_line(line: str) -> list[str]:
+    """
+    Split a line of batch input into an argument vector.
+
+    Uses a shlex split to handle quoted paths with spaces in them, and to allow
+    comments with #. Most lines contain no quotes, escapes, or comments, and these
+    are split the same way with a much faster regex.
+    """
+    if _SHLEX_SPECIAL_CHARS.search(line) is None:
+        return _SHLEX_WHITESPACE_SPLIT.findall(line)
+
     import shlex
 
-    for lineno, line in enumerate(stream.read().splitlines()):
-        # get the argument vector:
-        # do a shlex split to handle quoted paths with spaces in them
-        # also lets us have comments with #
-        argv = shlex.split(line, comments=True)
-        if argv:
-            try:
-                with process_command.make_context(f"<process {name}>", argv) as ctx:
-                    process_command.invoke(ctx)
-            except click.ClickException as error:
-                click.echo(
-                    f"error encountered processing '{name}' in "
-                    f"{stream.name} at line {lineno}:",
-                    err=True,
-                )
-                click.echo(
-                    click.style(f"  {error.format_message()}", fg="yellow"), err=True
-                )
-                click.get_current_context().exit(2)
+    return shlex.split(line, comments=True)
 
 
 class CLIAuthRequirementsError(Exception):
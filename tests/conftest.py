@@ -16,12 +16,12 @@ import responses
 from click.testing import CliRunner
 from globus_sdk.scopes import ScopeParser, TimersScopes
 from globus_sdk.testing import register_response_set
-from globus_sdk.token_storage.legacy import SQLiteAdapter
 from ruamel.yaml import YAML
 
 import globus_cli
 from globus_cli._click_compat import NEWER_CLICK_API
 from globus_cli.login_manager.scopes import CURRENT_SCOPE_CONTRACT_VERSION
+from globus_cli.login_manager.storage import ThreadSafeSQLiteAdapter
 
 yaml = YAML()
 log = logging.getLogger(__name__)
@@ -174,7 +174,7 @@ def logged_in_client_id():
 @pytest.fixture
 def test_token_storage(logged_in_client_id, mock_login_token_response, mock_user_data):
     """Put memory-backed sqlite token storage in place for the testsuite to use."""
-    mockstore = SQLiteAdapter(":memory:")
+    mockstore = ThreadSafeSQLiteAdapter(":memory:")
     real_close = mockstore.close
     mockstore.close = mock.Mock()
     mockstore.store_config(
@@ -203,6 +203,24 @@ def patch_tokenstorage(monkeypatch, test_token_storage):
     )
 
 
+@pytest.fixture(autouse=True)
+def memory_stores(monkeypatch):
+    """
+    Put a fresh memory-backed copy of each of the CLI's SQLite stores in place for
+    each test, keyed by the name of its module (e.g. "endpoint_cache").
+    """
+    import importlib
+
+    stores = {}
+    for name in ("identity_cache", "endpoint_cache", "listing_cache", "task_index"):
+        handle = importlib.import_module(f"globus_cli.services.{name}").STORE
+        stores[name] = handle.store_class(":memory:", namespace="test")
+        monkeypatch.setattr(handle, "store", stores[name])
+    yield stores
+    for store in stores.values():
+        store.close()
+
+
 @pytest.fixture
 def add_gcs_login(test_token_storage):
     def func(gcs_id):
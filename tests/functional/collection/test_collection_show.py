@@ -1,4 +1,5 @@
 import pytest
+import responses
 from globus_sdk.testing import load_response_set
 
 
@@ -73,3 +74,28 @@ def test_collection_show_on_non_collection(run_line, base_command, epid_key, ep_
         "Please run the following command instead:\n\n"
         f"    globus endpoint show {epid}"
     ) in result.stderr
+
+
+def _get_endpoint_calls(endpoint_id):
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.endswith(f"/v0.10/endpoint/{endpoint_id}")
+    ]
+
+
+def test_collection_show_caches_collection_lookup(
+    run_line, add_gcs_login, get_identities_mocker
+):
+    meta = load_response_set("cli.collection_operations").metadata
+    get_identities_mocker.configure_one(id=meta["identity_id"])
+    cid = meta["mapped_collection_id"]
+    add_gcs_login(meta["endpoint_id"])
+
+    run_line(f"globus collection show {cid}")
+    run_line(f"globus collection show {cid}")
+    assert len(_get_endpoint_calls(cid)) == 1
+
+    # --no-cache looks up the collection again
+    run_line(f"globus collection show --no-cache {cid}")
+    assert len(_get_endpoint_calls(cid)) == 2
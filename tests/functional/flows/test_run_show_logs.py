@@ -1,7 +1,10 @@
 import datetime
 import json
+import urllib.parse
 
 import pytest
+import responses
+from globus_sdk.config import get_service_url
 from globus_sdk.testing import (
     RegisteredResponse,
     load_response,
@@ -14,6 +17,8 @@ from globus_sdk.testing.data.flows.get_run_logs import (
 )
 from responses.matchers import query_param_matcher
 
+from globus_cli.commands.flows.run import show_logs
+
 EXPECTED_EVENT_CODES = [
     "FlowStarted",
     "FlowSucceeded",
@@ -147,3 +152,132 @@ def test_run_show_logs_paginated_response(run_line, limit):
         time, code, _ = (value.strip() for value in line.split("|"))
         assert isinstance(datetime.datetime.fromisoformat(time), datetime.datetime)
         assert code in EXPECTED_EVENT_CODES
+
+
+@pytest.fixture
+def live_run(monkeypatch):
+    """
+    Serve a run which logs more entries each time that its status is checked.
+
+    `stages` lists, for each status check, the status returned and the entries which
+    have been logged by then. Log pages hold two entries, and their markers are
+    offsets into the log.
+    """
+    monkeypatch.setattr(show_logs, "FOLLOW_PAGE_SIZE", 2)
+    stages = []
+    state = {"stage": 0, "next": 0}
+    markers = []
+
+    def run_callback(request):
+        state["stage"] = state["next"]
+        state["next"] = min(state["next"] + 1, len(stages) - 1)
+        status, _ = stages[state["stage"]]
+        return (200, {}, json.dumps({"run_id": RUN_ID, "status": status}))
+
+    def log_callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        marker = query.get("marker", [None])[0]
+        markers.append(marker)
+        start, limit = int(marker or 0), int(query["limit"][0])
+        _, entries = stages[state["stage"]]
+        has_next_page = start + limit < len(entries)
+        data = {
+            "entries": entries[start : start + limit],
+            "has_next_page": has_next_page,
+            "marker": str(start + limit) if has_next_page else None,
+        }
+        return (200, {}, json.dumps(data))
+
+    base_url = get_service_url("flows")
+    responses.add_callback(
+        responses.GET, f"{base_url}runs/{RUN_ID}", callback=run_callback
+    )
+    responses.add_callback(
+        responses.GET, f"{base_url}runs/{RUN_ID}/log", callback=log_callback
+    )
+    return stages, markers
+
+
+def _entry(code):
+    return {
+        "time": "2023-04-25T18:54:30.683000+00:00",
+        "code": code,
+        "description": f"description of {code}",
+        "details": {"code": code},
+    }
+
+
+def test_run_show_logs_follow(run_line, monkeypatch, mocksleep, live_run):
+    monkeypatch.setenv("GLOBUS_CLI_INTERACTIVE", "1")
+    monkeypatch.setattr("globus_cli.termio.err_is_terminal", lambda: True)
+    monkeypatch.setattr("globus_cli.termio.out_is_terminal", lambda: True)
+    stages, markers = live_run
+    first = [_entry("E0"), _entry("E1"), _entry("E2")]
+    more = first + [_entry("E3"), _entry("E4")]
+    stages.extend(
+        [
+            ("ACTIVE", first),
+            ("INACTIVE", more),
+            ("INACTIVE", more),
+            ("SUCCEEDED", more + [_entry("E5")]),
+        ]
+    )
+
+    result = run_line(f"globus flows run show-logs --follow -F jsonl {RUN_ID}")
+    assert [json.loads(line)["code"] for line in result.stdout.splitlines()] == [
+        "E0",
+        "E1",
+        "E2",
+        "E3",
+        "E4",
+        "E5",
+    ]
+    assert result.stderr.count("NOTE: This run is INACTIVE.") == 1
+    # each check starts from the page holding the newest entry seen
+    assert markers == [None, "2", "2", "2", "4", "4", "4"]
+    # polling backs off while there are no entries, and speeds up when they arrive
+    sleeps = [args[0] for args, _ in mocksleep.call_args_list if args[0] in (2, 4)]
+    assert sleeps == [2, 4, 2]
+
+
+def test_run_show_logs_follow_details(run_line, mocksleep, live_run):
+    stages, _ = live_run
+    stages.extend(
+        [
+            ("ACTIVE", [_entry("E0")]),
+            ("FAILED", [_entry("E0"), _entry("E1")]),
+        ]
+    )
+    result = run_line(f"globus flows run show-logs -f --details {RUN_ID}")
+    records = [section.splitlines() for section in result.output.split("\n\n")]
+    assert [record[1].split(":", 1)[1].strip() for record in records] == ["E0", "E1"]
+    assert json.loads(records[1][3].split(":", 1)[1]) == {"code": "E1"}
+
+
+def test_run_show_logs_follow_and_reverse_are_exclusive(run_line):
+    result = run_line(
+        f"globus flows run show-logs --follow --reverse {RUN_ID}",
+        assert_exit_code=2,
+    )
+    assert "--follow cannot be used with --reverse" in result.stderr
+
+
+def test_run_show_logs_details_json_is_unchanged(run_line):
+    meta = load_response("flows.get_run_logs").metadata
+    _setup_get_response(meta["run_id"])
+
+    result = run_line(
+        [
+            "globus",
+            "flows",
+            "run",
+            "show-logs",
+            meta["run_id"],
+            "--details",
+            "-F",
+            "json",
+        ]
+    )
+    entries = json.loads(result.output)
+    assert len(entries) == 4
+    assert all(isinstance(json.loads(entry["details"]), dict) for entry in entries)
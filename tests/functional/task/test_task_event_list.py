@@ -1,3 +1,11 @@
+import json
+import urllib.parse
+import uuid
+
+import globus_sdk
+import pytest
+import responses
+from globus_sdk.config import get_service_url
 from globus_sdk.testing import load_response_set
 
 
@@ -6,3 +14,150 @@ def test_task_event_list_success(run_line):
     task_id = meta["task_id"]
     result = run_line(f"globus task event-list {task_id}")
     assert "Canceled by the task owner" in result.output
+
+
+TASK_ID = "42277910-0c18-11ec-ba76-138ac5bdb19f"
+
+
+def _event(code, second):
+    return {
+        "DATA_TYPE": "event",
+        "code": code,
+        "description": code.lower(),
+        "details": f"details of {code}",
+        "is_error": False,
+        "time": f"2024-05-01T00:00:{second:02d}+00:00",
+    }
+
+
+@pytest.fixture
+def active_task():
+    """
+    Serve a task which logs more events each time that its status is checked.
+
+    `stages` lists, for each status check, the status returned and the events which
+    have been logged by then (oldest first).
+    """
+    stages = []
+    # the stage which the last status check returned, and the next one
+    state = {"stage": 0, "next": 0}
+    event_queries = []
+
+    def task_callback(request):
+        state["stage"] = state["next"]
+        state["next"] = min(state["next"] + 1, len(stages) - 1)
+        status, _ = stages[state["stage"]]
+        data = {
+            "task_id": TASK_ID,
+            "status": status,
+            "bytes_transferred": 1_000_000 * (state["stage"] + 1),
+        }
+        return (200, {}, json.dumps(data))
+
+    def event_callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        offset, limit = int(query["offset"][0]), int(query["limit"][0])
+        event_queries.append((offset, limit))
+        # events are listed newest first
+        _, events = stages[state["stage"]]
+        data = events[::-1][offset : offset + limit]
+        return (200, {}, json.dumps({"DATA": data, "total": len(events)}))
+
+    base_url = get_service_url("transfer")
+    responses.add_callback(
+        responses.GET, f"{base_url}v0.10/task/{TASK_ID}", callback=task_callback
+    )
+    responses.add_callback(
+        responses.GET,
+        f"{base_url}v0.10/task/{TASK_ID}/event_list",
+        callback=event_callback,
+    )
+    return stages, event_queries
+
+
+def test_task_event_list_follow(run_line, mocksleep, active_task):
+    stages, event_queries = active_task
+    first = [_event("QUEUED", 1), _event("STARTED", 2)]
+    more = first + [_event("PROGRESS", 3), _event("FAULT", 3)]
+    stages.extend(
+        [
+            ("ACTIVE", first),
+            ("ACTIVE", first),
+            ("ACTIVE", more),
+            ("ACTIVE", more),
+            ("SUCCEEDED", more + [_event("SUCCEEDED", 4)]),
+        ]
+    )
+
+    result = run_line(f"globus task event-list --follow -F jsonl {TASK_ID}")
+    assert [json.loads(line)["code"] for line in result.stdout.splitlines()] == [
+        "QUEUED",
+        "STARTED",
+        "PROGRESS",
+        "FAULT",
+        "SUCCEEDED",
+    ]
+    # each check reads a single page, as there are never many new events
+    assert all(offset == 0 for offset, _ in event_queries)
+    assert "SUCCEEDED: 5.0 MB transferred (" in result.stderr
+
+    # polling backs off while there are no events, and speeds up when they arrive
+    sleeps = [args[0] for args, _ in mocksleep.call_args_list if args[0] in (2, 4, 8)]
+    assert sleeps == [2, 4, 8, 2]
+
+
+def test_task_event_list_follow_text(run_line, mocksleep, active_task):
+    stages, _ = active_task
+    stages.extend(
+        [
+            ("ACTIVE", [_event("QUEUED", 1)]),
+            ("SUCCEEDED", [_event("QUEUED", 1), _event("SUCCEEDED", 2)]),
+        ]
+    )
+    result = run_line(f"globus task event-list -f {TASK_ID}")
+    lines = result.stdout.splitlines()
+    assert lines[0].startswith("Time ")
+    assert [line.split(" | ")[1].strip() for line in lines[2:]] == [
+        "QUEUED",
+        "SUCCEEDED",
+    ]
+
+
+def test_event_tail_reads_only_new_events(monkeypatch, active_task):
+    from globus_cli.commands.task import event_list
+
+    monkeypatch.setattr(event_list, "FOLLOW_PAGE_SIZE", 2)
+    stages, event_queries = active_task
+    events = [_event(f"E{n}", n) for n in range(6)]
+    stages.append(("ACTIVE", events))
+
+    tail = event_list.EventTail(globus_sdk.TransferClient(), uuid.UUID(TASK_ID), "")
+    # with a limit, only the most recent events are read
+    assert [e["code"] for e in tail.fetch_new(limit=3)] == ["E3", "E4", "E5"]
+    assert event_queries == [(0, 2), (2, 2)]
+
+    # events logged later are found at the start of the list, and reading stops
+    # when it reaches an event which has been seen
+    events.extend([_event("E6", 6), _event("E7", 6), _event("E8", 7)])
+    event_queries.clear()
+    assert [e["code"] for e in tail.fetch_new()] == ["E6", "E7", "E8"]
+    assert event_queries == [(0, 2), (2, 2)]
+    assert tail.fetch_new() == []
+
+
+def test_event_tail_skips_events_pushed_onto_the_next_page(monkeypatch):
+    from globus_cli.commands.task import event_list
+
+    monkeypatch.setattr(event_list, "FOLLOW_PAGE_SIZE", 2)
+    events = [_event(f"E{n}", n) for n in range(4)]
+
+    class FakeTransferClient:
+        def task_event_list(self, task_id, *, limit, offset, query_params):
+            page = events[::-1][offset : offset + limit]
+            # an event is logged after each page is read, so the last event of
+            # this page is listed again on the next one
+            events.append(_event(f"E{len(events)}", len(events)))
+            return {"DATA": page}
+
+    tail = event_list.EventTail(FakeTransferClient(), uuid.UUID(TASK_ID), "")
+    assert [e["code"] for e in tail.fetch_new()] == ["E0", "E1", "E2", "E3"]
@@ -1,3 +1,4 @@
+import json
 import urllib.parse
 import uuid
 
@@ -194,3 +195,14 @@ def test_task_list_control_filter_task_id(run_line, number_of_ids):
             uuid.UUID(task_id)
         except ValueError:  # clearer failure mode than a "dirty" ValueError
             pytest.fail(f"task_id filter contained non-uuid value: {task_id}")
+
+
+def test_task_list_jsonl_output(run_line):
+    load_response_set("cli.task_list")
+    result = run_line("globus task list -F jsonl")
+
+    lines = result.output.splitlines()
+    assert len(lines) == 1
+    task = json.loads(lines[0])
+    assert task["task_id"] == "42277910-0c18-11ec-ba76-138ac5bdb19f"
+    assert task["status"] == "SUCCEEDED"
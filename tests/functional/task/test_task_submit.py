@@ -2,6 +2,7 @@ import json
 
 import globus_sdk
 import pytest
+import responses
 from globus_sdk.testing import get_last_request, load_response, load_response_set
 
 
@@ -209,3 +210,181 @@ def test_recursion_options_in_batch_input(run_line, go_ep1_id, go_ep2_id, option
         assert item["recursive"] is False
     else:  # option == ""
         assert "recursive" not in item
+
+
+def _submitted_bodies(path):
+    return [
+        json.loads(call.request.body)
+        for call in responses.calls
+        if call.request.method == "POST" and call.request.url.endswith(path)
+    ]
+
+
+def test_transfer_batch_split_into_multiple_tasks(run_line, go_ep1_id):
+    load_response(globus_sdk.TransferClient.submit_transfer)
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    stdin = "".join(f"src{i} dst{i}\n" for i in range(5))
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--batch",
+            "-",
+            "--max-items-per-task",
+            "2",
+            "-F",
+            "json",
+            f"{go_ep1_id}:/",
+            f"{go_ep1_id}:/",
+        ],
+        stdin=stdin,
+    )
+
+    bodies = _submitted_bodies("/transfer")
+    assert [[item["source_path"] for item in body["DATA"]] for body in bodies] == [
+        ["/src0", "/src1"],
+        ["/src2", "/src3"],
+        ["/src4"],
+    ]
+    # every task gets its own submission ID
+    assert (
+        len([c for c in responses.calls if c.request.url.endswith("/submission_id")])
+        == 3
+    )
+
+    assert len(json.loads(result.stdout)["DATA"]) == 3
+
+
+def test_transfer_batch_split_drops_filter_rules_for_non_recursive_tasks(
+    run_line, go_ep1_id
+):
+    load_response(globus_sdk.TransferClient.submit_transfer)
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    run_line(
+        [
+            "globus",
+            "transfer",
+            "--exclude",
+            "*.txt",
+            "--batch",
+            "-",
+            "--max-items-per-task",
+            "1",
+            f"{go_ep1_id}:/",
+            f"{go_ep1_id}:/",
+        ],
+        stdin="abc def\nghi jkl --recursive\n",
+    )
+
+    first, second = _submitted_bodies("/transfer")
+    assert "filter_rules" not in first
+    assert second["filter_rules"] == [
+        {
+            "DATA_TYPE": "filter_rule",
+            "method": "exclude",
+            "name": "*.txt",
+            "type": "file",
+        }
+    ]
+
+
+def test_transfer_batch_split_rejects_filter_rules_without_recursive_items(
+    run_line, go_ep1_id
+):
+    load_response(globus_sdk.TransferClient.submit_transfer)
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--exclude",
+            "*.txt",
+            "--batch",
+            "-",
+            "--max-items-per-task",
+            "1",
+            f"{go_ep1_id}:/",
+            f"{go_ep1_id}:/",
+        ],
+        stdin="abc def\nghi jkl\nmno pqr\n",
+        assert_exit_code=2,
+    )
+    assert (
+        "`--include` and `--exclude` can only be used with `--recursive` transfers"
+        in result.stderr
+    )
+    # no task was submitted before the input was found to be invalid
+    assert _submitted_bodies("/transfer") == []
+
+
+def test_transfer_batch_split_reports_submitted_tasks_on_error(run_line, go_ep1_id):
+    load_response(globus_sdk.TransferClient.submit_transfer)
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    result = run_line(
+        [
+            "globus",
+            "transfer",
+            "--batch",
+            "-",
+            "--max-items-per-task",
+            "1",
+            f"{go_ep1_id}:/",
+            f"{go_ep1_id}:/",
+        ],
+        stdin="abc def\nghi\n",
+        assert_exit_code=2,
+    )
+    assert len(_submitted_bodies("/transfer")) == 1
+    assert "1 task(s) were submitted before the error occurred" in result.stderr
+
+
+def test_delete_batch_split_into_multiple_tasks(run_line, go_ep1_id):
+    load_response(globus_sdk.TransferClient.submit_delete)
+    load_response(globus_sdk.TransferClient.get_submission_id)
+
+    result = run_line(
+        [
+            "globus",
+            "delete",
+            "--batch",
+            "-",
+            "--max-items-per-task",
+            "2",
+            f"{go_ep1_id}:/",
+        ],
+        stdin="a\nb\nc\n",
+    )
+
+    bodies = _submitted_bodies("/delete")
+    assert [[item["path"] for item in body["DATA"]] for body in bodies] == [
+        ["/a", "/b"],
+        ["/c"],
+    ]
+    assert "Task ID" in result.stdout
+
+
+@pytest.mark.parametrize("command", ("transfer", "delete"))
+def test_max_items_per_task_requires_batch(run_line, go_ep1_id, command):
+    paths = (
+        f"{go_ep1_id}:/a" if command == "delete" else f"{go_ep1_id}:/a {go_ep1_id}:/b"
+    )
+    result = run_line(
+        f"globus {command} --max-items-per-task 2 {paths}", assert_exit_code=2
+    )
+    assert "`--max-items-per-task` can only be used with `--batch`" in result.stderr
+
+
+@pytest.mark.parametrize("command", ("transfer", "delete"))
+def test_max_items_per_task_conflicts_with_submission_id(run_line, go_ep1_id, command):
+    paths = f"{go_ep1_id}:/" if command == "delete" else f"{go_ep1_id}:/ {go_ep1_id}:/"
+    result = run_line(
+        f"globus {command} --batch - --max-items-per-task 2 "
+        f"--submission-id foo {paths}",
+        stdin="a b\n",
+        assert_exit_code=2,
+    )
+    assert "You cannot use `--submission-id`" in result.stderr
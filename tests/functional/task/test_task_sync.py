@@ -0,0 +1,142 @@
+import json
+import urllib.parse
+
+import pytest
+import responses
+from globus_sdk.config import get_service_url
+
+from globus_cli.commands.task import sync
+
+
+def _task(task_id, status="SUCCEEDED", **kwargs):
+    task = {
+        "task_id": task_id,
+        "type": "TRANSFER",
+        "status": status,
+        "label": f"label of {task_id}",
+        "request_time": "2024-05-01T12:00:00+00:00",
+        "completion_time": (
+            None if status in ("ACTIVE", "INACTIVE") else "2024-05-01T12:05:00+00:00"
+        ),
+        "source_endpoint_display_name": "source",
+        "destination_endpoint_display_name": "dest",
+    }
+    task.update(kwargs)
+    return task
+
+
+@pytest.fixture
+def task_list_pages():
+    """
+    Serve task_list responses from a queue of pages, recording the query parameters
+    of each request.
+    """
+    pages = []
+    queries = []
+
+    def callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        queries.append({k: v[0] for k, v in query.items()})
+        data = pages.pop(0) if pages else []
+        return (
+            200,
+            {},
+            json.dumps({"DATA_TYPE": "task_list", "DATA": data, "total": len(data)}),
+        )
+
+    responses.add_callback(
+        responses.GET,
+        f"{get_service_url('transfer')}v0.10/task_list",
+        callback=callback,
+    )
+    return pages, queries
+
+
+def test_sync_then_list_locally(run_line, task_list_pages):
+    pages, queries = task_list_pages
+    pages.append(
+        [
+            _task("t1"),
+            _task("t2", "ACTIVE", request_time="2024-05-02T00:00:00+00:00"),
+        ]
+    )
+    result = run_line("globus task sync")
+    assert "Added:         2" in result.output
+    assert "Indexed Tasks: 2" in result.output
+    # the first sync reads the whole history
+    assert queries == [
+        {
+            "filter": "type:TRANSFER,DELETE",
+            "orderby": "request_time ASC",
+            "limit": "1000",
+        }
+    ]
+
+    # the next sync starts from the cursors, and picks up the completion of t2
+    queries.clear()
+    pages.extend(
+        [
+            [_task("t3", request_time="2024-05-03T00:00:00+00:00")],
+            [_task("t2", request_time="2024-05-02T00:00:00+00:00")],
+        ]
+    )
+    result = run_line("globus task sync -F json")
+    assert json.loads(result.output) == {"added": 1, "updated": 1, "total": 3}
+    assert [q["filter"] for q in queries] == [
+        "type:TRANSFER,DELETE/request_time:2024-05-02 00:00:00,",
+        "type:TRANSFER,DELETE/completion_time:2024-05-02 00:00:00,",
+        "type:TRANSFER,DELETE/status:ACTIVE,INACTIVE"
+        "/request_time:2024-05-02 00:00:00,",
+    ]
+
+    # listing from the index makes no requests
+    calls = len(responses.calls)
+    result = run_line(
+        "globus task list --local --filter-status SUCCEEDED --limit 2 -F json"
+    )
+    assert [t["task_id"] for t in json.loads(result.output)["DATA"]] == ["t3", "t2"]
+    result = run_line("globus task list --local --filter-label '*of t1'")
+    assert "t1" in result.output
+    assert "t2" not in result.output
+    assert len(responses.calls) == calls
+
+
+def test_sync_reads_long_histories_in_windows(run_line, task_list_pages, monkeypatch):
+    monkeypatch.setattr(sync, "TASK_LIST_MAX_RESULTS", 2)
+    pages, queries = task_list_pages
+    pages.extend(
+        [
+            [
+                _task("t1", request_time="2024-05-01T00:00:00+00:00"),
+                _task("t2", request_time="2024-05-02T00:00:00+00:00"),
+            ],
+            [
+                _task("t2", request_time="2024-05-02T00:00:00+00:00"),
+                _task("t3", request_time="2024-05-03T00:00:00+00:00"),
+            ],
+            [_task("t3", request_time="2024-05-03T00:00:00+00:00")],
+        ]
+    )
+    result = run_line("globus task sync -F json")
+    assert json.loads(result.output) == {"added": 3, "updated": 0, "total": 3}
+    assert [q["filter"] for q in queries] == [
+        "type:TRANSFER,DELETE",
+        "type:TRANSFER,DELETE/request_time:2024-05-02 00:00:00,",
+        "type:TRANSFER,DELETE/request_time:2024-05-03 00:00:00,",
+    ]
+
+
+def test_sync_full_rebuilds_the_index(run_line, task_list_pages, memory_stores):
+    pages, queries = task_list_pages
+    memory_stores["task_index"].upsert([_task("deleted-task")])
+    pages.append([_task("t1")])
+    result = run_line("globus task sync --full -F json")
+    assert json.loads(result.output) == {"added": 1, "updated": 0, "total": 1}
+    assert queries[0]["filter"] == "type:TRANSFER,DELETE"
+
+
+def test_list_locally_does_not_need_a_login(run_line, test_token_storage):
+    test_token_storage.remove_tokens_for_resource_server("transfer.api.globus.org")
+    run_line("globus task list --local")
+    result = run_line("globus task list", assert_exit_code=4)
+    assert "globus login" in result.stderr
@@ -0,0 +1,137 @@
+import json
+import uuid
+from unittest import mock
+
+import pytest
+import responses
+from globus_sdk.config import get_service_url
+
+
+def _register_task(task_id, *statuses):
+    # each call to get the task returns the next status, repeating the last one
+    for status in statuses:
+        responses.add(
+            responses.GET,
+            f"{get_service_url('transfer')}v0.10/task/{task_id}",
+            json={"DATA_TYPE": "task", "task_id": task_id, "status": status},
+        )
+
+
+def _task_calls(task_id):
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.endswith(f"/v0.10/task/{task_id}")
+    ]
+
+
+def test_task_wait_single_task_does_not_refetch_after_completion(run_line):
+    task_id = str(uuid.uuid4())
+    _register_task(task_id, "ACTIVE", "SUCCEEDED")
+
+    result = run_line(f"globus task wait -F json {task_id}")
+    assert json.loads(result.stdout)["status"] == "SUCCEEDED"
+    # one check while active, one which sees the completion -- and no more
+    assert len(_task_calls(task_id)) == 2
+
+
+def test_task_wait_single_task_text_output_is_silent(run_line):
+    task_id = str(uuid.uuid4())
+    _register_task(task_id, "FAILED")
+
+    result = run_line(f"globus task wait {task_id}", assert_exit_code=1)
+    assert result.stdout == ""
+
+
+def test_task_wait_multiple_tasks_success(run_line, mocksleep):
+    task_ids = [str(uuid.uuid4()) for _ in range(3)]
+    _register_task(task_ids[0], "SUCCEEDED")
+    _register_task(task_ids[1], "ACTIVE", "SUCCEEDED")
+    _register_task(task_ids[2], "ACTIVE", "ACTIVE", "SUCCEEDED")
+
+    result = run_line(
+        ["globus", "task", "wait", "--polling-interval", "5", "-F", "json"] + task_ids
+    )
+    data = json.loads(result.stdout)["DATA"]
+    assert [task["task_id"] for task in data] == task_ids
+    assert all(task["status"] == "SUCCEEDED" for task in data)
+
+    # completed tasks are not checked again, and the waits are shared
+    assert [len(_task_calls(task_id)) for task_id in task_ids] == [1, 2, 3]
+    # (other sleeps may come from client-side rate limiting)
+    assert mocksleep.call_args_list.count(mock.call(5)) == 2
+
+
+def test_task_wait_multiple_tasks_text_output(run_line):
+    task_ids = [str(uuid.uuid4()) for _ in range(2)]
+    _register_task(task_ids[0], "SUCCEEDED")
+    _register_task(task_ids[1], "FAILED")
+
+    result = run_line(["globus", "task", "wait"] + task_ids, assert_exit_code=1)
+    lines = result.stdout.splitlines()
+    assert lines[0].split() == ["Task", "ID", "|", "Status"]
+    assert lines[2].split() == [task_ids[0], "|", "SUCCEEDED"]
+    assert lines[3].split() == [task_ids[1], "|", "FAILED"]
+
+
+@pytest.mark.parametrize(
+    "statuses, exit_code",
+    (
+        (("SUCCEEDED", "SUCCEEDED"), 0),
+        (("SUCCEEDED", "ACTIVE"), 50),
+        (("FAILED", "ACTIVE"), 1),
+    ),
+)
+def test_task_wait_multiple_tasks_exit_code(run_line, statuses, exit_code):
+    task_ids = [str(uuid.uuid4()) for _ in statuses]
+    for task_id, status in zip(task_ids, statuses):
+        _register_task(task_id, status)
+
+    result = run_line(
+        ["globus", "task", "wait", "--timeout", "2", "--timeout-exit-code", "50"]
+        + task_ids,
+        assert_exit_code=exit_code,
+    )
+    if "ACTIVE" in statuses:
+        assert "1 of 2 tasks have yet to complete after 2 seconds" in result.stderr
+
+
+def test_task_wait_ignores_duplicate_task_ids(run_line):
+    task_id = str(uuid.uuid4())
+    _register_task(task_id, "SUCCEEDED")
+
+    run_line(["globus", "task", "wait", task_id, task_id])
+    assert len(_task_calls(task_id)) == 1
+
+
+def test_task_wait_requires_a_task_id(run_line):
+    result = run_line("globus task wait", assert_exit_code=2)
+    assert "Missing argument 'TASK_ID...'" in result.stderr
+
+
+def test_task_wait_adaptive_polling(run_line, mocksleep):
+    task_id = str(uuid.uuid4())
+    _register_task(task_id, *(["ACTIVE"] * 5 + ["SUCCEEDED"]))
+
+    run_line(f"globus task wait --max-polling-interval 6 {task_id}")
+    sleeps = [
+        args[0] for args, _ in mocksleep.call_args_list if args[0] in (1, 2, 4, 6)
+    ]
+    assert sleeps == [1, 2, 4, 6, 6]
+
+
+def test_task_wait_does_not_sleep_past_timeout(run_line, mocksleep):
+    task_id = str(uuid.uuid4())
+    _register_task(task_id, "ACTIVE")
+
+    run_line(
+        f"globus task wait --polling-interval 4 --timeout 10 {task_id}",
+        assert_exit_code=1,
+    )
+    assert [
+        c for c in mocksleep.call_args_list if c in (mock.call(4), mock.call(2))
+    ] == [
+        mock.call(4),
+        mock.call(4),
+        mock.call(2),
+    ]
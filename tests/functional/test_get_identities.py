@@ -1,4 +1,9 @@
 import json
+import urllib.parse
+import uuid
+
+import responses
+from globus_sdk.config import get_service_url
 
 
 def test_get_identities_requires_at_least_one(run_line):
@@ -87,3 +92,107 @@ def test_json(run_line, get_identities_mocker):
     output = json.loads(run_line("globus get-identities -F json " + user_id).output)
     for key in ["id", "username", "name", "organization", "email"]:
         assert meta[key] == output["identities"][0][key]
+
+
+def _register_identities_callback():
+    # respond to any lookup with an identity for each requested username
+    def callback(request):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query)
+        usernames = query["usernames"][0].split(",")
+        identities = [
+            {"id": str(uuid.uuid5(uuid.NAMESPACE_DNS, name)), "username": name}
+            for name in usernames
+            if not name.startswith("missing")
+        ]
+        return (200, {}, json.dumps({"identities": identities}))
+
+    responses.add_callback(
+        responses.GET,
+        f"{get_service_url('auth')}v2/api/identities",
+        callback=callback,
+        content_type="application/json",
+    )
+
+
+def _identity_calls():
+    return [
+        call for call in responses.calls if "/v2/api/identities" in call.request.url
+    ]
+
+
+def test_from_file_is_batched_and_ordered(run_line, tmp_path):
+    _register_identities_callback()
+    usernames = [f"user{i}@example.org" for i in range(250)]
+    # duplicates, blank lines, and unknown users
+    lines = usernames + ["", usernames[0], "missing@example.org"]
+    path = tmp_path / "usernames.txt"
+    path.write_text("\n".join(lines) + "\n")
+
+    result = run_line(f"globus get-identities --from-file {path}")
+    expected = [str(uuid.uuid5(uuid.NAMESPACE_DNS, name)) for name in usernames]
+    expected += [expected[0], "NO_SUCH_IDENTITY"]
+    assert result.output.splitlines() == expected
+
+    # 251 distinct usernames fit in three batches
+    calls = _identity_calls()
+    assert len(calls) == 3
+    requested = [
+        urllib.parse.parse_qs(urllib.parse.urlparse(call.request.url).query)[
+            "usernames"
+        ][0].split(",")
+        for call in calls
+    ]
+    assert sorted(len(batch) for batch in requested) == [51, 100, 100]
+
+
+def test_each_batch_is_cached_at_once(run_line, tmp_path, memory_stores, monkeypatch):
+    _register_identities_callback()
+    cache = memory_stores["identity_cache"]
+    updates = []
+    real_update = cache.update
+
+    def update(items):
+        items = list(items)
+        updates.append(len(items))
+        real_update(items)
+
+    monkeypatch.setattr(cache, "update", update)
+    path = tmp_path / "usernames.txt"
+    path.write_text("\n".join(f"user{i}@example.org" for i in range(250)) + "\n")
+
+    run_line(f"globus get-identities --from-file {path}")
+    # each identity is cached under its ID and its username
+    assert sorted(updates) == [100, 200, 200]
+    assert len(cache) == 500
+
+
+def test_from_file_combined_with_arguments(run_line, tmp_path):
+    _register_identities_callback()
+    path = tmp_path / "usernames.txt"
+    path.write_text("b@example.org\n")
+
+    result = run_line(f"globus get-identities a@example.org --from-file {path} -F json")
+    identities = json.loads(result.output)["identities"]
+    assert [i["username"] for i in identities] == ["a@example.org", "b@example.org"]
+    assert len(_identity_calls()) == 1
+
+
+def test_cached_identities_are_not_looked_up_again(run_line):
+    _register_identities_callback()
+    run_line("globus get-identities a@example.org")
+    result = run_line("globus get-identities a@example.org b@example.org")
+    assert result.output.splitlines() == [
+        str(uuid.uuid5(uuid.NAMESPACE_DNS, "a@example.org")),
+        str(uuid.uuid5(uuid.NAMESPACE_DNS, "b@example.org")),
+    ]
+    calls = _identity_calls()
+    assert len(calls) == 2
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(calls[1].request.url).query)
+    assert query["usernames"] == ["b@example.org"]
+
+
+def test_from_file_rejects_invalid_values(run_line, tmp_path):
+    path = tmp_path / "usernames.txt"
+    path.write_text("a@example.org\ninvalid\n")
+    result = run_line(f"globus get-identities --from-file {path}", assert_exit_code=2)
+    assert "'invalid' does not appear to be a valid identity" in result.stderr
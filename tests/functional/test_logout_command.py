@@ -122,3 +122,37 @@ def test_logout_with_client_id(
     assert "Revoking all CLI tokens for" in result.output
     # Make sure the storage was cleared out
     assert manager.storage.read_well_known_config("auth_user_data") is None
+
+
+def test_logout_clears_identity_cache(run_line, memory_stores):
+    memory_stores["identity_cache"]["some-id"] = {
+        "id": "some-id",
+        "username": "x@example.org",
+    }
+
+    run_line("globus logout --yes")
+    assert len(memory_stores["identity_cache"]) == 0
+
+
+def test_logout_clears_token_validations(run_line):
+    manager = LoginManager()
+    tokens = manager.storage.adapter.get_token_data("auth.globus.org")
+    manager.storage.record_token_validation(tokens["refresh_token"])
+
+    run_line("globus logout --yes")
+    assert not manager.storage.token_validation_is_fresh(tokens["refresh_token"])
+
+
+def test_logout_clears_stored_consents(run_line, mock_user_data):
+    manager = LoginManager()
+    manager.storage.store_consents(mock_user_data["sub"], [])
+
+    run_line("globus logout --yes")
+    assert manager.storage.read_consents(mock_user_data["sub"]) is None
+
+
+def test_logout_clears_endpoint_cache(run_line, memory_stores):
+    memory_stores["endpoint_cache"].set("some-id", {"id": "some-id"})
+
+    run_line("globus logout --yes")
+    assert len(memory_stores["endpoint_cache"]) == 0
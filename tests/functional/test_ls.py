@@ -1,5 +1,6 @@
 import urllib.parse
 
+import pytest
 from globus_sdk.testing import (
     RegisteredResponse,
     get_last_request,
@@ -99,3 +100,77 @@ def test_orderby_encoding(run_line, go_ep1_id):
     parsed_params = urllib.parse.parse_qs(parsed_url.query)
     assert "orderby" in parsed_params
     assert parsed_params["orderby"] == ["size DESC,name ASC"]
+
+
+@pytest.mark.parametrize("parallel", (2, 8))
+def test_recursive_parallel_matches_serial(run_line, go_ep1_id, parallel):
+    """
+    Confirms that a --recursive ls with --parallel produces the same output, in the
+    same order, as a serial listing.
+    """
+    load_response_set("cli.ls_results")
+    cmd = f"globus ls -r --recursive-depth-limit 1 -F json {go_ep1_id}:/"
+    serial_result = run_line(cmd)
+    parallel_result = run_line(f"{cmd} --parallel {parallel}")
+    assert '"name": "share/godata"' in serial_result.output
+    assert parallel_result.output == serial_result.output
+
+
+def test_parallel_must_be_positive(run_line, go_ep1_id):
+    result = run_line(f"globus ls -r --parallel 0 {go_ep1_id}:/", assert_exit_code=2)
+    assert "Invalid value for '--parallel'" in result.stderr
+
+
+def test_checkpoint_is_removed_on_completion(run_line, go_ep1_id, tmp_path):
+    load_response_set("cli.ls_results")
+    checkpoint = tmp_path / "ls.checkpoint"
+    result = run_line(
+        f"globus ls -r --recursive-depth-limit 1 --checkpoint {checkpoint} "
+        f"{go_ep1_id}:/"
+    )
+    assert "share/godata/" in result.output
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_resumes_interrupted_listing(run_line, go_ep1_id, tmp_path):
+    """
+    Interrupt a recursive listing with a network error after the first directory,
+    then resume it from the checkpoint and confirm that only the remaining
+    directories are listed.
+    """
+    checkpoint = tmp_path / "ls.checkpoint"
+    cmd = (
+        f"globus ls -r --recursive-depth-limit 1 --checkpoint {checkpoint} "
+        f"{go_ep1_id}:/"
+    )
+    # only the listing of "/" is available, so listing "/home" fails
+    ls_root = f"get_transfer_/v0.10/operation/endpoint/{go_ep1_id}/ls_0"
+    load_response("cli.ls_results", case=ls_root)
+    result = run_line(cmd, assert_exit_code=1)
+    assert "home/" in result.output
+    assert checkpoint.exists()
+
+    load_response_set("cli.ls_results")
+    result = run_line(cmd)
+    assert "home/" not in result.output.splitlines()
+    assert "share/godata/" in result.output
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_for_other_listing_is_rejected(run_line, go_ep1_id, tmp_path):
+    checkpoint = tmp_path / "ls.checkpoint"
+    checkpoint.write_text(
+        '{"version": 1, "key": {"endpoint_id": "other"}, "cursor": {}, "queue": []}'
+    )
+    result = run_line(
+        f"globus ls -r --checkpoint {checkpoint} {go_ep1_id}:/", assert_exit_code=2
+    )
+    assert "is a checkpoint for a different listing" in result.stderr
+
+
+def test_checkpoint_requires_recursive(run_line, go_ep1_id, tmp_path):
+    result = run_line(
+        f"globus ls --checkpoint {tmp_path / 'ls.checkpoint'} {go_ep1_id}:/",
+        assert_exit_code=2,
+    )
+    assert "`--checkpoint` can only be used with `--recursive`" in result.stderr
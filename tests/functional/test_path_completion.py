@@ -0,0 +1,113 @@
+import threading
+
+import click
+import pytest
+import responses
+from globus_sdk.config import get_service_url
+
+from globus_cli.parsing import ENDPOINT_PLUS_OPTPATH
+from globus_cli.services.transfer import path_completion
+
+EP_ID = "aa752cea-8222-5bc8-acd9-555b090c0ccb"
+
+
+def _register_ls(path, entries, status=200):
+    responses.add(
+        responses.GET,
+        f"{get_service_url('transfer')}v0.10/operation/endpoint/{EP_ID}/ls",
+        match=[
+            responses.matchers.query_param_matcher({"path": path}, strict_match=False)
+        ],
+        status=status,
+        json={
+            "DATA_TYPE": "file_list",
+            "DATA": [
+                {"DATA_TYPE": "file", "name": name, "type": type_}
+                for name, type_ in entries
+            ],
+        },
+    )
+
+
+def _ls_calls():
+    return [c for c in responses.calls if "/ls" in c.request.url]
+
+
+def _complete(incomplete):
+    ctx = click.Context(click.Command("ls"))
+    param = click.Argument(["endpoint_plus_path"], type=ENDPOINT_PLUS_OPTPATH)
+    return [
+        item.value
+        for item in ENDPOINT_PLUS_OPTPATH.shell_complete(ctx, param, incomplete)
+    ]
+
+
+@pytest.fixture
+def listing():
+    _register_ls(
+        "/home/",
+        [("docs", "dir"), ("data.csv", "file"), ("notes.txt", "file"), (".ssh", "dir")],
+    )
+
+
+@pytest.mark.parametrize(
+    "incomplete, expect",
+    (
+        ("/home/", ["/home/data.csv", "/home/docs/", "/home/notes.txt"]),
+        ("/home/d", ["/home/data.csv", "/home/docs/"]),
+        ("/home/.", ["/home/.ssh/"]),
+        ("/home/x", []),
+    ),
+)
+def test_completes_remote_paths(listing, incomplete, expect):
+    assert _complete(f"{EP_ID}:{incomplete}") == [f"{EP_ID}:{p}" for p in expect]
+
+
+def test_repeated_completion_uses_cache(listing, memory_stores):
+    _complete(f"{EP_ID}:/home/")
+    _complete(f"{EP_ID}:/home/d")
+    _complete(f"{EP_ID}:/home/n")
+    assert len(_ls_calls()) == 1
+    assert memory_stores["listing_cache"].get(EP_ID, "/home/") is not None
+
+
+@pytest.mark.parametrize("incomplete", ("", "/home/", "not-an-id:/home/", EP_ID))
+def test_no_completion_without_an_endpoint(incomplete):
+    assert _complete(incomplete) == []
+    assert _ls_calls() == []
+
+
+def test_errors_complete_nothing(memory_stores):
+    _register_ls("/home/", [], status=502)
+    assert _complete(f"{EP_ID}:/home/") == []
+    # the listing is not retried, and the failure is not cached
+    assert len(_ls_calls()) == 1
+    assert len(memory_stores["listing_cache"]) == 0
+
+
+def test_slow_listings_are_abandoned(monkeypatch):
+    release = threading.Event()
+
+    def fetch_listing(endpoint_id, path):
+        release.wait()
+        return [("late", False)]
+
+    monkeypatch.setattr(path_completion, "_fetch_listing", fetch_listing)
+    try:
+        assert path_completion.list_directory(EP_ID, "/", timeout=0.1) == []
+    finally:
+        release.set()
+
+
+def test_bash_completion_of_remote_path(run_line, listing, monkeypatch):
+    # answer through click, rather than building a completion index
+    monkeypatch.setattr(
+        "globus_cli.parsing.completion_index.complete_from_index",
+        lambda *args: False,
+    )
+    monkeypatch.setenv("_GLOBUS_COMPLETE", "bash_complete")
+    # bash splits the word on the colon, and only replaces the text after it
+    monkeypatch.setenv("COMP_WORDS", f"globus ls {EP_ID} : /home/d")
+    monkeypatch.setenv("COMP_CWORD", "4")
+    result = run_line("globus")
+    assert result.output == "plain,/home/data.csv\nplain,/home/docs/\n"
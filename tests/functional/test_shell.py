@@ -0,0 +1,92 @@
+import pytest
+import responses
+from globus_sdk.testing import load_response_set
+
+from globus_cli.login_manager import LoginManager
+
+
+def _transfer_calls():
+    return [c for c in responses.calls if c.request.url.startswith("https://transfer.")]
+
+
+def test_shell_runs_commands_from_stdin(run_line, go_ep1_id):
+    load_response_set("cli.ls_results")
+    result = run_line(
+        "globus shell",
+        stdin=(
+            "# list the endpoint twice\n"
+            f"ls {go_ep1_id}:/\n"
+            "\n"
+            f"globus ls -r {go_ep1_id}:/share\n"
+        ),
+    )
+    assert "home/" in result.output
+    assert "file1.txt" in result.output
+    assert len(_transfer_calls()) > 1
+
+
+def test_shell_runs_script(run_line, go_ep1_id, tmp_path):
+    load_response_set("cli.ls_results")
+    script = tmp_path / "commands.txt"
+    script.write_text(f"ls {go_ep1_id}:/\n")
+
+    result = run_line(["globus", "shell", str(script)])
+    assert "home/" in result.output
+
+
+def test_shell_shares_login_manager(run_line, go_ep1_id, monkeypatch):
+    load_response_set("cli.ls_results")
+    managers = []
+    real_init = LoginManager.__init__
+
+    def init(self):
+        managers.append(self)
+        real_init(self)
+
+    monkeypatch.setattr(LoginManager, "__init__", init)
+    run_line("globus shell", stdin=f"ls {go_ep1_id}:/\nls {go_ep1_id}:/share\n")
+    assert len(managers) == 1
+
+
+def test_shell_exits_with_last_status(run_line, go_ep1_id):
+    load_response_set("cli.ls_results")
+    result = run_line("globus shell", stdin=f"no-such-command\nls {go_ep1_id}:/\n")
+    assert "No such command 'no-such-command'" in result.stderr
+    assert "home/" in result.output
+
+    result = run_line(
+        "globus shell",
+        stdin=f"ls {go_ep1_id}:/\nno-such-command\n",
+        assert_exit_code=2,
+    )
+    assert "home/" in result.output
+
+
+def test_shell_exit_on_error(run_line, go_ep1_id):
+    load_response_set("cli.ls_results")
+    result = run_line(
+        "globus shell --exit-on-error",
+        stdin=f"no-such-command\nls {go_ep1_id}:/\n",
+        assert_exit_code=2,
+    )
+    assert "home/" not in result.output
+    assert _transfer_calls() == []
+
+
+def test_shell_exit_command(run_line, go_ep1_id):
+    load_response_set("cli.ls_results")
+    result = run_line("globus shell", stdin=f"exit\nls {go_ep1_id}:/\n")
+    assert result.output == ""
+
+
+@pytest.mark.parametrize(
+    "line, expect_error",
+    (
+        ("shell", "globus shell: 'shell' cannot be run here"),
+        ("-F json update", "globus shell: 'update' cannot be run here"),
+        ("ls 'unbalanced", "globus shell: No closing quotation"),
+    ),
+)
+def test_shell_rejected_lines(run_line, line, expect_error):
+    result = run_line("globus shell", stdin=f"{line}\n", assert_exit_code=2)
+    assert expect_error in result.stderr
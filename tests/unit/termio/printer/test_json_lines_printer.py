@@ -0,0 +1,70 @@
+import json
+from io import StringIO
+
+import jmespath
+import pytest
+
+from globus_cli.parsing.command_state import CommandState
+from globus_cli.termio.printers import JsonLinesPrinter, StreamingJsonDocument
+
+
+@pytest.mark.parametrize(
+    "data",
+    (
+        [{"b": 1, "a": 2}, {"a": 3}],
+        {"DATA": [{"b": 1, "a": 2}, {"a": 3}], "DATA_TYPE": "some_list"},
+        StreamingJsonDocument("items", iter([{"b": 1, "a": 2}, {"a": 3}])),
+    ),
+)
+def test_json_lines_printer_prints_one_line_per_item(click_context, data):
+    printer = JsonLinesPrinter()
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo(data, stream)
+            printed = stream.getvalue()
+
+    # fmt: off
+    assert printed == (
+        '{"a":2,"b":1}\n'
+        '{"a":3}\n'
+    )
+    # fmt: on
+
+
+def test_json_lines_printer_prints_object_on_one_line(click_context):
+    printer = JsonLinesPrinter(sort_keys=False)
+    data = {"b": 1, "a": {"nested": [1, 2]}}
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo(data, stream)
+            printed = stream.getvalue()
+
+    assert printed == '{"b":1,"a":{"nested":[1,2]}}\n'
+
+
+def test_json_lines_printer_prints_nothing_for_empty_list(click_context):
+    printer = JsonLinesPrinter()
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo(StreamingJsonDocument("DATA", []), stream)
+            printed = stream.getvalue()
+
+    assert printed == ""
+
+
+def test_json_lines_printer_applies_jmespath_to_whole_document(click_context):
+    printer = JsonLinesPrinter()
+    data = StreamingJsonDocument("DATA", iter([{"a": 1}, {"a": 2}, {"a": 3}]))
+
+    with StringIO() as stream:
+        with click_context() as ctx:
+            ctx.ensure_object(CommandState).jmespath_expr = jmespath.compile(
+                "DATA[?a > `1`]"
+            )
+            printer.echo(data, stream)
+            printed = stream.getvalue()
+
+    assert [json.loads(line) for line in printed.splitlines()] == [{"a": 2}, {"a": 3}]
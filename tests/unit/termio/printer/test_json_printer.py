@@ -1,6 +1,11 @@
+import json
 from io import StringIO
 
-from globus_cli.termio.printers import JsonPrinter
+import jmespath
+import pytest
+
+from globus_cli.parsing.command_state import CommandState
+from globus_cli.termio.printers import JsonPrinter, StreamingJsonDocument
 
 
 def test_json_printer_prints_with_sorted_keys(click_context):
@@ -41,3 +46,52 @@ def test_json_printer_prints_without_sorted_keys(click_context):
         "}\n"
     )
     # fmt: on
+
+
+@pytest.mark.parametrize(
+    "items",
+    (
+        [],
+        [{"b": 1, "a": 2}],
+        [{"a": {"nested": [1, 2, {"c": None}]}}, {"a": "multi\nline"}, 3, []],
+    ),
+)
+@pytest.mark.parametrize("sort_keys", (True, False))
+def test_json_printer_streams_same_text_as_materialized_document(
+    click_context, items, sort_keys
+):
+    printer = JsonPrinter(sort_keys=sort_keys)
+
+    with StringIO() as stream:
+        with click_context():
+            printer.echo(StreamingJsonDocument("DATA", iter(items)), stream)
+            printed_json = stream.getvalue()
+
+    expect = json.dumps({"DATA": items}, indent=2, sort_keys=sort_keys) + "\n"
+    assert printed_json == expect
+
+
+def test_json_printer_prints_streamed_items_before_data_is_exhausted(click_context):
+    printer = JsonPrinter()
+    stream = StringIO()
+
+    def generate_items():
+        yield {"a": 1}
+        yield {"a": 2}
+        assert '"a": 2' in stream.getvalue()
+
+    with click_context():
+        printer.echo(StreamingJsonDocument("DATA", generate_items()), stream)
+
+
+def test_json_printer_materializes_streamed_document_for_jmespath(click_context):
+    printer = JsonPrinter()
+    items = ({"a": 1}, {"a": 2})
+
+    with StringIO() as stream:
+        with click_context() as ctx:
+            ctx.ensure_object(CommandState).jmespath_expr = jmespath.compile("DATA[].a")
+            printer.echo(StreamingJsonDocument("DATA", items), stream)
+            printed_json = stream.getvalue()
+
+    assert json.loads(printed_json) == [1, 2]
@@ -129,6 +129,59 @@ def test_table_printer_handles_missing_fields():
     # fmt: on
 
 
+def test_table_printer_sizes_columns_from_lookahead_rows():
+    fields = (Field("A", "a"), Field("B", "b"))
+    data = (
+        {"a": 1, "b": 2},
+        {"a": 3, "b": 4},
+        {"a": "wide", "b": 5},
+    )
+
+    printer = TablePrinter(fields=fields, max_lookahead=2)
+
+    with StringIO() as stream:
+        printer.echo(data, stream)
+        printed_table = stream.getvalue()
+
+    # the third row is not used to size the columns, so it overflows
+    # fmt: off
+    assert printed_table == (
+        "A | B\n"
+        "- | -\n"
+        "1 | 2\n"
+        "3 | 4\n"
+        "wide | 5\n"
+    )
+    # fmt: on
+
+
+def test_table_printer_prints_rows_before_data_is_exhausted():
+    fields = (Field("A", "a"),)
+    stream = StringIO()
+
+    def generate_data():
+        for i in range(5):
+            yield {"a": i}
+        # by the time the last item is requested, the earlier rows were printed
+        assert stream.getvalue().splitlines() == ["A", "-", "0", "1", "2", "3", "4"]
+
+    printer = TablePrinter(fields=fields, max_lookahead=3)
+    printer.echo(generate_data(), stream)
+
+
+def test_table_printer_without_lookahead_limit_buffers_all_rows():
+    fields = (Field("A", "a"),)
+    data = ({"a": 1}, {"a": 22}, {"a": 333})
+
+    printer = TablePrinter(fields=fields, max_lookahead=None)
+
+    with StringIO() as stream:
+        printer.echo(data, stream)
+        printed_table = stream.getvalue()
+
+    assert printed_table == "A  \n---\n1  \n22 \n333\n"
+
+
 def test_data_table_raises_index_error_when_out_of_bounds_access():
     fields = (Field("A", "a"), Field("B", "b"))
     data = ({"a": 1, "b": 2}, {"a": 3, "b": 4})
@@ -0,0 +1,72 @@
+import io
+
+import click
+import globus_sdk
+import pytest
+
+import globus_cli.services.transfer.data
+from globus_cli.services.transfer import add_batch_to_transfer_data
+from globus_cli.utils import shlex_process_stream, split_batch_line
+
+BATCH_LINES = (
+    "abc def",
+    "  abc\tdef  ",
+    "abc def # a comment",
+    "'path with spaces' def",
+    r"path\ with\ escapes def",
+    "-r abc def",
+    "--recursive abc def",
+    "abc --no-recursive def",
+    "abc def --recursive --no-recursive",
+    "--external-checksum deadbeef abc def",
+    "--external-checksum=deadbeef abc def",
+    "../up/and/over ./here",
+    "~/home/path /abs/path",
+    "- def",
+)
+
+
+def _parse_transfer_batch(text):
+    transfer_data = globus_sdk.TransferData(
+        source_endpoint="src", destination_endpoint="dst"
+    )
+    add_batch_to_transfer_data(
+        "/src/base/", "/dst/base/", "md5", transfer_data, io.StringIO(text)
+    )
+    return [dict(item) for item in transfer_data["DATA"]]
+
+
+@pytest.mark.parametrize("line", BATCH_LINES)
+def test_split_batch_line_matches_shlex(line):
+    import shlex
+
+    assert split_batch_line(line) == shlex.split(line, comments=True)
+
+
+@pytest.mark.parametrize("line", BATCH_LINES)
+def test_transfer_batch_fast_path_matches_click(monkeypatch, line):
+    fast_items = _parse_transfer_batch(line + "\n")
+
+    # disable the fast path, so that every line is parsed by click
+    def click_only(process_command, stream, name, *, fast_path=None):
+        shlex_process_stream(process_command, stream, name)
+
+    monkeypatch.setattr(
+        globus_cli.services.transfer.data, "shlex_process_stream", click_only
+    )
+    click_items = _parse_transfer_batch(line + "\n")
+
+    assert len(fast_items) == 1
+    assert fast_items == click_items
+
+
+def test_transfer_batch_fast_path_does_not_make_click_contexts(monkeypatch):
+    def fail_make_context(*args, **kwargs):
+        raise AssertionError("the click parser should not be used")
+
+    monkeypatch.setattr(click.Command, "make_context", fail_make_context)
+    items = _parse_transfer_batch("abc def\n\n# comment\n-r ghi jkl\n")
+    assert [(item["source_path"], item["recursive"]) for item in items] == [
+        ("/src/base/abc", globus_sdk.MISSING),
+        ("/src/base/ghi", True),
+    ]
@@ -31,7 +31,7 @@ def test_main_group_reraises_epipe_errors_without_invoking_custom_handler(runner
     #
     # if it does, that means we won't get click's cleanup for EPIPE, which includes
     # special wrapping of `sys.stdout` and `sys.stderr`
-    with mock.patch("globus_cli.parsing.commands.custom_except_hook") as mock_handler:
+    with mock.patch("globus_cli.exception_handling.custom_except_hook") as mock_handler:
         result = runner.invoke(foo, ["bar"])
 
     # make sure that our custom hook was not called
@@ -0,0 +1,195 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import click
+import pytest
+from click.shell_completion import BashComplete
+
+from globus_cli import main
+from globus_cli.parsing import completion_index
+
+# building an index loads every command, which takes a while under coverage
+pytestmark = pytest.mark.timeout(30)
+
+
+@pytest.fixture(scope="module")
+def cli_index():
+    return completion_index.build_index(main)
+
+
+@pytest.fixture
+def index_file(tmp_path, monkeypatch):
+    path = tmp_path / "completion_index.json"
+    monkeypatch.setattr(completion_index, "index_path", lambda: str(path))
+    return path
+
+
+def _click_completions(cli, args, incomplete):
+    comp = BashComplete(cli, {}, "globus", "_GLOBUS_COMPLETE")
+    return [(i.value, i.type, i.help) for i in comp.get_completions(args, incomplete)]
+
+
+def _index_completions(index, args, incomplete):
+    items = completion_index.complete(index["tree"], args, incomplete)
+    assert items is not None
+    return [(i.value, i.type, i.help) for i in items]
+
+
+@pytest.mark.parametrize(
+    "args, incomplete",
+    (
+        ([], ""),
+        ([], "tr"),
+        ([], "--"),
+        (["-F"], ""),
+        ([], "--format=j"),
+        (["-F", "json"], "end"),
+        (["endpoint"], "s"),
+        (["endpoint", "permission"], ""),
+        (["transfer"], "--"),
+        (["transfer", "--label", "foo"], "--l"),
+        (["transfer", "--sync-level"], ""),
+        (["transfer", "--sync-level"], "ch"),
+        (["transfer", "--batch"], ""),
+        (["timer", "create", "transfer"], "--"),
+        (["ls", "-r"], "--"),
+        (["whoami"], ""),
+    ),
+)
+def test_index_completes_like_click(cli_index, args, incomplete):
+    assert _index_completions(cli_index, args, incomplete) == _click_completions(
+        main, args, incomplete
+    )
+
+
+def test_index_defers_to_click():
+    @click.group()
+    def cli():
+        pass
+
+    @cli.command()
+    @click.option("--name", shell_complete=lambda ctx, param, incomplete: [])
+    @click.option("--color", type=click.Choice(["red", "green"]))
+    def paint(name, color):
+        pass
+
+    @cli.command(hidden=True)
+    def secret():
+        pass
+
+    index = completion_index.build_index(cli)
+    assert completion_index.complete(index["tree"], ["paint", "--name"], "") is None
+    assert completion_index.complete(index["tree"], ["secret"], "--") is None
+    assert _index_completions(index, ["paint", "--color"], "g") == [
+        ("green", "plain", None)
+    ]
+
+
+def test_completion_uses_index(run_line, index_file, cli_index, monkeypatch):
+    monkeypatch.setenv("_GLOBUS_COMPLETE", "zsh_complete")
+    monkeypatch.setenv("COMP_WORDS", "globus endpoint sh")
+    monkeypatch.setenv("COMP_CWORD", "2")
+    # an index which is out of date is rebuilt
+    index_file.write_text(json.dumps({"fingerprint": "stale", "tree": {}}))
+    builds = []
+
+    def build_index(cli):
+        builds.append(cli)
+        return cli_index
+
+    monkeypatch.setattr(completion_index, "build_index", build_index)
+
+    result = run_line("globus")
+    assert result.output == "plain\nshow\nDisplay a detailed endpoint definition.\n"
+    assert len(builds) == 1
+    assert json.loads(index_file.read_text()) == cli_index
+
+    # and on the next completion, the stored index is used
+    run_line("globus")
+    assert len(builds) == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the data dir is found via HOME")
+def test_completion_doesnt_import_commands(tmp_path, cli_index):
+    env = dict(os.environ)
+    env.update(
+        HOME=str(tmp_path),
+        _GLOBUS_COMPLETE="bash_complete",
+        COMP_WORDS="globus timer create transfer --skip",
+        COMP_CWORD="4",
+    )
+    data_dir = tmp_path / ".globus" / "cli"
+    data_dir.mkdir(parents=True)
+    (data_dir / "completion_index.json").write_text(json.dumps(cli_index))
+
+    to_run = textwrap.dedent(
+        """
+        import atexit, sys
+        from globus_cli import main
+
+        @atexit.register
+        def check_imports():
+            loaded = [m for m in sys.modules if m.startswith("globus_cli.commands.")]
+            print(f"loaded={loaded}")
+
+        main.main()
+        """
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "plain,--skip-source-errors" in proc.stdout
+    assert "loaded=[]" in proc.stdout
+
+
+def test_fingerprint_of_installed_cli_is_its_version(tmp_path, monkeypatch):
+    module_path = tmp_path / "site-packages" / "globus_cli" / "parsing" / "mod.py"
+    monkeypatch.setattr(completion_index, "__file__", str(module_path))
+    assert completion_index.source_fingerprint() == completion_index.__version__
+
+
+def test_fingerprint_of_editable_cli_changes_with_its_source(tmp_path, monkeypatch):
+    package_dir = tmp_path / "src" / "globus_cli"
+    (package_dir / "parsing").mkdir(parents=True)
+    monkeypatch.setattr(
+        completion_index, "__file__", str(package_dir / "parsing" / "mod.py")
+    )
+    fingerprint = completion_index.source_fingerprint()
+
+    stat = package_dir.stat()
+    os.utime(package_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert completion_index.source_fingerprint() != fingerprint
+
+
+def test_fingerprint_of_editable_cli_changes_with_its_command_packages(
+    tmp_path, monkeypatch
+):
+    package_dir = tmp_path / "src" / "globus_cli"
+    (package_dir / "parsing").mkdir(parents=True)
+    (package_dir / "commands" / "task" / "__pycache__").mkdir(parents=True)
+    monkeypatch.setattr(
+        completion_index, "__file__", str(package_dir / "parsing" / "mod.py")
+    )
+    # a command package is newer than the package directory
+    for path in (package_dir, package_dir / "commands"):
+        os.utime(path, ns=(0, 0))
+    fingerprint = completion_index.source_fingerprint()
+
+    # bytecode being written is not a change
+    (package_dir / "commands" / "task" / "__pycache__" / "mod.pyc").touch()
+    assert completion_index.source_fingerprint() == fingerprint
+
+    # but a command being added is
+    task_dir = package_dir / "commands" / "task"
+    stat = task_dir.stat()
+    (task_dir / "new_command.py").touch()
+    os.utime(task_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert completion_index.source_fingerprint() != fingerprint
@@ -0,0 +1,250 @@
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from globus_cli.daemon import SOCKET_ENV_VAR, forward_to_daemon
+from globus_cli.daemon.client import (
+    connect_when_ready,
+    recv_message,
+    request,
+    send_message,
+)
+from globus_cli.daemon.server import DaemonAlreadyRunningError, DaemonServer
+
+pytestmark = [
+    pytest.mark.skipif(
+        not hasattr(socket, "send_fds"), reason="the daemon requires send_fds"
+    ),
+    # the daemon runs in a thread here, so forking warns on newer Pythons
+    pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning"),
+]
+
+
+@pytest.fixture
+def socket_path(monkeypatch):
+    # not under `tmp_path`, which may be too long for a socket path
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "daemon.sock")
+        monkeypatch.setenv(SOCKET_ENV_VAR, path)
+        yield path
+
+
+def _wait_for(path):
+    # wait (for a while) until a file exists, or else fail the command
+    deadline = time.monotonic() + 10
+    while not os.path.exists(path):
+        if time.monotonic() > deadline:
+            return 2
+        time.sleep(0.01)
+    return 0
+
+
+def _test_runner(release_path):
+    # commands run in a process of their own, so the runner reports what it saw
+    # on the client's stdout
+    def runner(argv):
+        if argv == ["wait"]:
+            open(release_path + ".started", "w").close()
+            try:
+                return _wait_for(release_path)
+            except KeyboardInterrupt:
+                return 130
+        if argv == ["release"]:
+            open(release_path, "w").close()
+            return 0
+
+        seen = {"argv": argv, "cwd": os.getcwd(), "env": os.environ.get("DAEMON_TEST")}
+        os.write(1, json.dumps(seen).encode() + b"\n")
+        return 3
+
+    return runner
+
+
+@pytest.fixture
+def release_path(tmp_path):
+    return str(tmp_path / "release")
+
+
+@pytest.fixture
+def start_daemon(socket_path, release_path):
+    threads = []
+
+    def start(**kwargs):
+        server = DaemonServer(socket_path, runner=_test_runner(release_path), **kwargs)
+        server.bind()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    yield start
+
+    if threads:
+        request(socket_path, {"op": "stop"})
+    for thread in threads:
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+
+@pytest.fixture
+def daemon(start_daemon):
+    start_daemon()
+
+
+def _forward_in_thread(argv):
+    results = []
+    thread = threading.Thread(
+        target=lambda: results.append(forward_to_daemon(argv)), daemon=True
+    )
+    thread.start()
+    return thread, results
+
+
+def test_forward_runs_command_in_daemon(daemon, tmp_path, monkeypatch, capfd):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DAEMON_TEST", "hello")
+
+    assert forward_to_daemon(["ls", "--long"]) == 3
+
+    assert json.loads(capfd.readouterr().out) == {
+        "argv": ["ls", "--long"],
+        "cwd": os.getcwd(),
+        "env": "hello",
+    }
+    # the daemon's own state is untouched
+    assert os.getcwd() == str(tmp_path)
+
+
+def test_daemon_runs_commands_at_once(daemon, release_path):
+    # the first command only finishes once the second has run
+    waiting, results = _forward_in_thread(["wait"])
+    assert forward_to_daemon(["release"]) == 0
+    waiting.join(timeout=10)
+    assert results == [0]
+
+
+def test_busy_daemon_runs_command_locally(start_daemon, release_path, capfd):
+    start_daemon(max_commands=1)
+    waiting, results = _forward_in_thread(["wait"])
+    assert _wait_for(release_path + ".started") == 0
+
+    assert forward_to_daemon(["ls"]) is None
+    assert capfd.readouterr().out == ""
+    open(release_path, "w").close()
+    waiting.join(timeout=10)
+    assert results == [0]
+
+
+def test_command_is_interrupted_when_client_hangs_up(daemon, socket_path):
+    sock = connect_when_ready(socket_path, timeout=5)
+    assert sock is not None
+    with sock:
+        send_message(
+            sock,
+            {
+                "op": "run",
+                "argv": ["wait"],
+                "cwd": os.getcwd(),
+                "env": dict(os.environ),
+            },
+            fds=[0, 1, 2],
+        )
+        # as the client does on Ctrl-C
+        sock.shutdown(socket.SHUT_WR)
+        sock.settimeout(5)
+        reply, _ = recv_message(sock)
+    assert reply == {"status": "ok", "exit_code": 130}
+
+
+def test_forward_to_unresponsive_daemon_runs_locally(socket_path):
+    # a socket which is listened on, but never accepted from
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.bind(socket_path)
+        sock.listen()
+        assert forward_to_daemon(["ls"], timeout=0.1) is None
+
+
+def test_forward_without_daemon_runs_locally(socket_path):
+    assert forward_to_daemon(["ls"]) is None
+
+
+def test_forward_without_socket_env_var_runs_locally(daemon, monkeypatch, capfd):
+    monkeypatch.delenv(SOCKET_ENV_VAR)
+    assert forward_to_daemon(["ls"]) is None
+    assert capfd.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "argv, expect_name",
+    (
+        (["daemon", "status"], "daemon"),
+        (["-v", "daemon", "stop"], "daemon"),
+        (["-F", "json", "update"], "update"),
+        (["--jmespath", "DATA", "ls", "-l"], "ls"),
+        (["--format=json", "ls"], "ls"),
+        (["--help"], None),
+    ),
+)
+def test_get_subcommand_name(argv, expect_name):
+    from globus_cli.commands import main
+
+    assert main.get_subcommand_name(argv) == expect_name
+
+
+def test_daemon_rejects_different_configuration(daemon, monkeypatch, capfd):
+    monkeypatch.setenv("GLOBUS_PROFILE", "some-other-profile")
+    assert forward_to_daemon(["ls"]) is None
+    assert capfd.readouterr().out == ""
+
+
+def test_daemon_ping_and_stop(socket_path):
+    server = DaemonServer(socket_path, runner=lambda argv: 0)
+    server.bind()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    assert request(socket_path, {"op": "ping"}) == {
+        "status": "ok",
+        "pid": os.getpid(),
+    }
+    assert request(socket_path, {"op": "stop"}) == {"status": "ok"}
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    # the socket is removed, and the daemon is gone
+    assert not os.path.exists(socket_path)
+    assert request(socket_path, {"op": "ping"}) is None
+
+
+def test_daemon_idle_timeout(socket_path):
+    server = DaemonServer(socket_path, idle_timeout=0.1, runner=lambda argv: 0)
+    server.serve_forever()
+    assert not os.path.exists(socket_path)
+
+
+def test_daemon_refuses_to_replace_running_daemon(daemon, socket_path):
+    with pytest.raises(DaemonAlreadyRunningError):
+        DaemonServer(socket_path).bind()
+
+
+def test_daemon_replaces_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server = DaemonServer(socket_path)
+    server.bind()
+    try:
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+    finally:
+        server.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="the daemon requires Unix")
+def test_daemon_status_without_daemon(run_line, socket_path):
+    result = run_line(["globus", "daemon", "status"], assert_exit_code=1)
+    assert f"No daemon is listening on {socket_path}" in result.output
@@ -0,0 +1,134 @@
+import uuid
+
+import globus_sdk
+import pytest
+import responses
+from globus_sdk.config import get_service_url
+
+from globus_cli.endpointish import Endpointish, EntityType
+from globus_cli.services.endpoint_cache import EndpointCache
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    class FakeTime:
+        now = 1_000_000.0
+
+        def time(self):
+            return self.now
+
+    clock = FakeTime()
+    monkeypatch.setattr("globus_cli.services.endpoint_cache.time.time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def endpoint_id():
+    return str(uuid.uuid4())
+
+
+def _endpoint_doc(endpoint_id, **kwargs):
+    return {
+        "DATA_TYPE": "endpoint",
+        "id": endpoint_id,
+        "entity_type": "GCSv5_endpoint",
+        "gcs_manager_url": "https://abc.xyz.data.globus.org",
+        **kwargs,
+    }
+
+
+def _register_endpoint(endpoint_id, **kwargs):
+    responses.add(
+        responses.GET,
+        f"{get_service_url('transfer')}v0.10/endpoint/{endpoint_id}",
+        **kwargs,
+    )
+
+
+def _endpoint_calls(endpoint_id):
+    return [
+        call
+        for call in responses.calls
+        if call.request.url.endswith(f"/endpoint/{endpoint_id}")
+    ]
+
+
+def test_cache_roundtrip(fake_time):
+    cache = EndpointCache(":memory:", namespace="test", ttl=10)
+    cache.set("ep-1", {"id": "ep-1"})
+    assert cache.get("ep-1") == {"id": "ep-1"}
+    assert cache.get("ep-2") is None
+
+    fake_time.now += 10
+    assert cache.get("ep-1") is None
+    # expired entries are kept, for use when the endpoint cannot be looked up
+    assert cache.get("ep-1", allow_stale=True) == {"id": "ep-1"}
+
+    cache.delete("ep-1")
+    assert cache.get("ep-1", allow_stale=True) is None
+
+
+def test_cache_tolerates_database_errors():
+    cache = EndpointCache(":memory:", namespace="test")
+    cache.close()
+
+    cache.set("ep-1", {"id": "ep-1"})
+    assert cache.get("ep-1") is None
+    cache.delete("ep-1")
+    cache.clear()
+
+
+def test_cache_namespaces_are_separate(tmp_path):
+    filename = str(tmp_path / "endpoint_cache.db")
+    cache_a = EndpointCache(filename, namespace="a")
+    cache_b = EndpointCache(filename, namespace="b")
+    cache_a.set("ep-1", {"id": "ep-1"})
+    assert cache_b.get("ep-1") is None
+
+    cache_b.clear()
+    assert len(cache_a) == 1
+
+
+def test_cache_evicts_oldest_entries(fake_time):
+    cache = EndpointCache(":memory:", namespace="test", max_entries=2)
+    for n in range(3):
+        fake_time.now += 1
+        cache.set(f"ep-{n}", {"id": f"ep-{n}"})
+    assert len(cache) == 2
+    assert cache.get("ep-0") is None
+
+
+def test_endpointish_uses_cache(endpoint_id):
+    _register_endpoint(endpoint_id, json=_endpoint_doc(endpoint_id))
+    client = globus_sdk.TransferClient()
+
+    for _ in range(2):
+        epish = Endpointish(endpoint_id, transfer_client=client, use_cache=True)
+        assert epish.entity_type == EntityType.GCSV5_ENDPOINT
+    assert len(_endpoint_calls(endpoint_id)) == 1
+
+    # without use_cache, the endpoint is always looked up
+    Endpointish(endpoint_id, transfer_client=client)
+    assert len(_endpoint_calls(endpoint_id)) == 2
+
+
+def test_endpointish_uses_stale_data_on_server_error(
+    memory_stores, endpoint_id, fake_time
+):
+    memory_stores["endpoint_cache"].set(endpoint_id, _endpoint_doc(endpoint_id))
+    fake_time.now += 2 * 60 * 60
+    _register_endpoint(endpoint_id, status=503, json={"code": "ServiceUnavailable"})
+    client = globus_sdk.TransferClient()
+
+    epish = Endpointish(endpoint_id, transfer_client=client, use_cache=True)
+    assert epish.get_gcs_address() == "https://abc.xyz.data.globus.org/api"
+
+
+def test_endpointish_does_not_mask_client_errors(memory_stores, endpoint_id, fake_time):
+    memory_stores["endpoint_cache"].set(endpoint_id, _endpoint_doc(endpoint_id))
+    fake_time.now += 2 * 60 * 60
+    _register_endpoint(endpoint_id, status=404, json={"code": "EndpointNotFound"})
+    client = globus_sdk.TransferClient()
+
+    with pytest.raises(globus_sdk.TransferAPIError):
+        Endpointish(endpoint_id, transfer_client=client, use_cache=True)
@@ -0,0 +1,147 @@
+import click
+import globus_sdk
+import pytest
+import responses
+from globus_sdk.testing import load_response
+
+from globus_cli.parsing.command_state import CommandState
+from globus_cli.services.auth import CustomAuthClient
+from globus_cli.services.identity_cache import IdentityCache, get_identity_cache
+from globus_cli.termio.formatters.auth import IdentityIDFormatter
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    class FakeTime:
+        now = 1_000_000.0
+
+        def time(self):
+            return self.now
+
+    clock = FakeTime()
+    monkeypatch.setattr("globus_cli.services.identity_cache.time.time", clock.time)
+    return clock
+
+
+def _identity(n):
+    return {"id": f"id-{n}", "username": f"user{n}@example.org"}
+
+
+def _identities_calls():
+    return [c for c in responses.calls if "/v2/api/identities" in c.request.url]
+
+
+def test_cache_roundtrip():
+    cache = IdentityCache(":memory:", namespace="test")
+    cache["id-1"] = _identity(1)
+    assert cache["id-1"] == _identity(1)
+    assert "id-2" not in cache
+    assert list(cache) == ["id-1"]
+    assert len(cache) == 1
+
+    del cache["id-1"]
+    assert "id-1" not in cache
+    with pytest.raises(KeyError):
+        del cache["id-1"]
+
+
+def test_cache_namespaces_are_separate(tmp_path):
+    filename = str(tmp_path / "identity_cache.db")
+    IdentityCache(filename, namespace="one")["id-1"] = _identity(1)
+
+    assert "id-1" in IdentityCache(filename, namespace="one")
+    assert "id-1" not in IdentityCache(filename, namespace="two")
+
+
+def test_cache_entries_expire(fake_time):
+    cache = IdentityCache(":memory:", namespace="test", ttl=60)
+    cache["id-1"] = _identity(1)
+
+    fake_time.now += 59
+    assert "id-1" in cache
+    fake_time.now += 1
+    assert "id-1" not in cache
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(fake_time):
+    cache = IdentityCache(":memory:", namespace="test", max_entries=3)
+    for n in range(3):
+        cache[f"id-{n}"] = _identity(n)
+        fake_time.now += 1
+
+    # use the oldest entry, so that the second one becomes the least recently used
+    assert cache["id-0"]
+    fake_time.now += 1
+    cache["id-3"] = _identity(3)
+
+    assert sorted(cache) == ["id-0", "id-2", "id-3"]
+
+
+def test_cache_update_writes_many_entries(fake_time):
+    cache = IdentityCache(":memory:", namespace="test", max_entries=3)
+    cache["id-0"] = _identity(0)
+    fake_time.now += 1
+
+    cache.update({f"id-{n}": _identity(n) for n in range(1, 4)})
+    # eviction happens once, after the whole batch is written
+    assert sorted(cache) == ["id-1", "id-2", "id-3"]
+    assert cache["id-2"] == _identity(2)
+
+
+def test_cache_evicts_after_a_fraction_of_the_limit_is_written():
+    cache = IdentityCache(":memory:", namespace="test", max_entries=200)
+    for n in range(201):
+        cache[f"id-{n}"] = _identity(n)
+    # entries are counted after every 2 writes, so the limit may be exceeded briefly
+    assert len(cache) == 201
+    cache["id-201"] = _identity(201)
+    assert len(cache) == 200
+
+
+def test_formatter_uses_cache_across_instances():
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    auth_client = globus_sdk.AuthClient()
+
+    for _ in range(2):
+        formatter = IdentityIDFormatter(auth_client)
+        formatter.add_items(meta["id"])
+        assert formatter.render((meta["id"], "identity")) == meta["username"]
+
+    assert len(_identities_calls()) == 1
+
+
+def test_auth_client_lookups_use_cache():
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    auth_client = CustomAuthClient()
+
+    assert auth_client.lookup_identity_name(meta["id"]) == meta["username"]
+    assert auth_client.lookup_identity_name(meta["id"]) == meta["username"]
+    # a lookup in the other direction is answered by the same cached identity
+    assert auth_client.maybe_lookup_identity_id(meta["username"]) == meta["id"]
+
+    assert len(_identities_calls()) == 1
+
+
+def test_auth_client_lookup_populates_formatter_cache():
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    auth_client = CustomAuthClient()
+
+    auth_client.maybe_lookup_identity_id(meta["username"])
+    formatter = IdentityIDFormatter(auth_client)
+    assert formatter.render((meta["id"], "identity")) == meta["username"]
+
+    assert len(_identities_calls()) == 1
+
+
+def test_no_cache_lookups_are_still_cached(test_click_context):
+    meta = load_response(globus_sdk.AuthClient.get_identities).metadata
+    auth_client = CustomAuthClient()
+
+    click.get_current_context().ensure_object(CommandState).no_cache = True
+    assert auth_client.lookup_identity_name(meta["id"]) == meta["username"]
+    assert auth_client.lookup_identity_name(meta["id"]) == meta["username"]
+    assert len(_identities_calls()) == 2
+
+    click.get_current_context().ensure_object(CommandState).no_cache = False
+    assert get_identity_cache()[meta["id"]]["username"] == meta["username"]
@@ -34,6 +34,7 @@ its (almost entirely eager) imports.
 
 import subprocess
 import sys
+import textwrap
 
 import pytest
 
@@ -72,3 +73,39 @@ def test_importing_cli_doesnt_import_forbidden_modules(forbidden_module):
     assert status == 0, str(proc.communicate())
     proc.stdout.close()
     proc.stderr.close()
+
+
+# loading every command takes a while, especially under coverage
+@pytest.mark.timeout(30)
+def test_showing_help_doesnt_import_forbidden_modules():
+    # show the help for every command, in one process, which loads every command
+    # module -- and exits via an exception, which must not load the SDK either
+    to_run = textwrap.dedent(
+        """
+        import sys
+        import click
+        from globus_cli import main
+
+        def walk(cmd, path):
+            if isinstance(cmd, click.Group):
+                ctx = click.Context(cmd)
+                for name in cmd.list_commands(ctx):
+                    yield from walk(cmd.get_command(ctx, name), path + [name])
+            yield path
+
+        for path in list(walk(main, [])):
+            try:
+                main.main(path + ["--help"])
+            except SystemExit:
+                pass
+        assert "requests" not in sys.modules, "requests was imported"
+        """
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", to_run],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr
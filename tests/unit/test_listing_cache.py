@@ -0,0 +1,50 @@
+import pytest
+
+from globus_cli.services.listing_cache import ListingCache
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    class FakeTime:
+        now = 1_000_000.0
+
+        def time(self):
+            return self.now
+
+    clock = FakeTime()
+    monkeypatch.setattr("globus_cli.services.listing_cache.time.time", clock.time)
+    return clock
+
+
+def test_cache_roundtrip(fake_time):
+    cache = ListingCache(":memory:", namespace="test", ttl=10)
+    cache.set("ep-1", "/home/", [("docs", True), ("notes.txt", False)])
+    assert cache.get("ep-1", "/home/") == [("docs", True), ("notes.txt", False)]
+    assert cache.get("ep-1", "/") is None
+    assert cache.get("ep-2", "/home/") is None
+
+    fake_time.now += 10
+    assert cache.get("ep-1", "/home/") is None
+
+
+def test_cache_namespaces_are_separate(tmp_path):
+    filename = str(tmp_path / "listing_cache.db")
+    cache_a = ListingCache(filename, namespace="a")
+    cache_b = ListingCache(filename, namespace="b")
+    cache_a.set("ep-1", "/", [])
+    assert cache_b.get("ep-1", "/") is None
+
+    cache_b.clear()
+    assert len(cache_a) == 1
+
+
+def test_cache_evicts_expired_and_oldest_entries(fake_time):
+    cache = ListingCache(":memory:", namespace="test", ttl=10, max_entries=2)
+    cache.set("ep-1", "/old/", [])
+    fake_time.now += 10
+    for n in range(3):
+        fake_time.now += 1
+        cache.set("ep-1", f"/{n}/", [])
+    assert len(cache) == 2
+    assert cache.get("ep-1", "/0/") is None
+    assert cache.get("ep-1", "/2/") == []
@@ -1,14 +1,19 @@
 import datetime
 import re
+import time
 import typing as t
 import uuid
 from unittest import mock
 
+import click
 import globus_sdk
 import globus_sdk.scopes
 import jwt
 import pytest
+import responses
+from globus_sdk.config import get_service_url
 
+import globus_cli.login_manager.storage
 from globus_cli.login_manager import (
     LoginManager,
     MissingLoginError,
@@ -303,6 +308,194 @@ def test_client_login_gcs(client_login, add_gcs_login, test_click_context):
         assert dummy_command(collection_id=gcs_id)
 
 
+@pytest.fixture
+def count_token_validations(disable_login_manager_validate_token):
+    validate = mock.Mock(return_value=True)
+    # replace the usual patch, so that it is undone along with it
+    disable_login_manager_validate_token.setattr(
+        LoginManager, "_validate_token", validate
+    )
+    return validate
+
+
+def test_has_login_skips_recently_validated_tokens(count_token_validations):
+    LoginManager().has_login("auth.globus.org")
+    LoginManager().has_login("auth.globus.org")
+    assert count_token_validations.call_count == 1
+
+
+def test_has_login_revalidates_after_ttl(count_token_validations, monkeypatch):
+    LoginManager().has_login("auth.globus.org")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 301)
+    LoginManager().has_login("auth.globus.org")
+    assert count_token_validations.call_count == 2
+
+
+def test_has_login_does_not_cache_failed_validations(count_token_validations):
+    count_token_validations.return_value = False
+    assert not LoginManager().has_login("auth.globus.org")
+    assert not LoginManager().has_login("auth.globus.org")
+    assert count_token_validations.call_count == 2
+
+
+def test_token_validation_cache_can_be_disabled(count_token_validations, monkeypatch):
+    monkeypatch.setenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL", "0")
+    LoginManager().has_login("auth.globus.org")
+    LoginManager().has_login("auth.globus.org")
+    assert count_token_validations.call_count == 2
+
+
+@pytest.mark.parametrize("value", ("soon", "-1", "nan"))
+def test_token_validation_ttl_must_be_a_non_negative_number(
+    count_token_validations, monkeypatch, value
+):
+    monkeypatch.setenv("GLOBUS_CLI_TOKEN_VALIDATION_TTL", value)
+    with pytest.raises(
+        click.ClickException, match="must be a non-negative number of seconds"
+    ):
+        LoginManager().has_login("auth.globus.org")
+
+
+def test_token_validation_cache_is_cleared(count_token_validations):
+    manager = LoginManager()
+    manager.has_login("auth.globus.org")
+    manager.storage.clear_token_validations()
+    manager.has_login("auth.globus.org")
+    assert count_token_validations.call_count == 2
+
+
+_DEPENDENT_REQUIREMENT = globus_sdk.scopes.Scope(
+    "root:scope", dependencies=(globus_sdk.scopes.Scope("dep:scope"),)
+)
+
+
+def _consent(consent_id, scope_name, dependency_path):
+    return {
+        "id": consent_id,
+        "scope_name": scope_name,
+        "scope": str(uuid.UUID(int=consent_id)),
+        "dependency_path": dependency_path,
+        "allows_refresh": True,
+        "atomically_revocable": False,
+        "auto_approved": False,
+        "client": str(uuid.UUID(int=1)),
+        "created": "1970-01-01T00:00:00.000000+00:00",
+        "effective_identity": str(uuid.UUID(int=2)),
+        "last_used": "1970-01-01T00:00:00.000000+00:00",
+        "status": "approved",
+        "updated": "1970-01-01T00:00:00.000000+00:00",
+    }
+
+
+@pytest.fixture
+def consents_url(mock_user_data):
+    return (
+        f"{get_service_url('auth')}v2/api/identities/{mock_user_data['sub']}/consents"
+    )
+
+
+def _set_consents(url, *consents):
+    responses.upsert(responses.GET, url, json={"consents": list(consents)})
+
+
+def _consent_calls(url):
+    return [call for call in responses.calls if call.request.url.startswith(url)]
+
+
+def _meets_dependent_requirement():
+    manager = LoginManager()
+    manager.add_requirement("rs.example.org", [_DEPENDENT_REQUIREMENT])
+    return manager._tokens_meet_nonstatic_requirements("rs.example.org", {})
+
+
+def test_consents_are_stored_across_invocations(test_click_context, consents_url):
+    _set_consents(
+        consents_url,
+        _consent(1, "root:scope", [1]),
+        _consent(2, "dep:scope", [1, 2]),
+    )
+    assert _meets_dependent_requirement()
+    assert _meets_dependent_requirement()
+    assert len(_consent_calls(consents_url)) == 1
+
+
+def test_stored_consents_are_refreshed_if_requirements_are_unmet(
+    test_click_context, consents_url
+):
+    _set_consents(consents_url, _consent(1, "root:scope", [1]))
+    # consents which were just fetched are not fetched again
+    assert not _meets_dependent_requirement()
+    assert len(_consent_calls(consents_url)) == 1
+
+    # the dependent consent is granted after the stored copy was fetched
+    _set_consents(
+        consents_url,
+        _consent(1, "root:scope", [1]),
+        _consent(2, "dep:scope", [1, 2]),
+    )
+    assert _meets_dependent_requirement()
+    assert len(_consent_calls(consents_url)) == 2
+
+
+def test_stored_consents_expire(test_click_context, consents_url, monkeypatch):
+    _set_consents(
+        consents_url,
+        _consent(1, "root:scope", [1]),
+        _consent(2, "dep:scope", [1, 2]),
+    )
+    assert _meets_dependent_requirement()
+
+    monkeypatch.setattr(globus_cli.login_manager.storage, "CONSENTS_TTL", 0)
+    assert _meets_dependent_requirement()
+    assert len(_consent_calls(consents_url)) == 2
+
+
+def test_refreshing_tokens_keeps_stored_consents(mock_login_token_response):
+    manager = LoginManager()
+    manager.storage.store_consents("some-identity", [])
+
+    # `store()` is also the callback for token refreshes
+    manager.storage.store(mock_login_token_response)
+    assert manager.storage.read_consents("some-identity") == []
+
+
+def test_login_clears_stored_consents(test_click_context, mock_login_token_response):
+    manager = LoginManager()
+    manager.storage.store_consents("some-identity", [])
+
+    user_data = manager.storage.read_well_known_config("auth_user_data")
+    mock_login_token_response.decode_id_token.return_value = {
+        "sub": user_data["sub"] if user_data else "some-identity"
+    }
+    mock_auth_client = mock.MagicMock(spec=globus_sdk.NativeAppAuthClient)
+    mock_auth_client.oauth2_exchange_code_for_tokens.return_value = (
+        mock_login_token_response
+    )
+    exchange_code_and_store(manager.storage, mock_auth_client, "code")
+    assert manager.storage.read_consents("some-identity") is None
+
+
+def test_shared_manager_reuses_clients(test_token_storage, mock_login_token_response):
+    with LoginManager.shared() as manager:
+        with LoginManager.shared() as nested:
+            assert nested is manager
+
+        client = manager.get_transfer_client()
+        assert manager.get_transfer_client() is client
+        assert manager.get_groups_client() is not client
+
+        # after a new login, the client is replaced
+        by_rs = mock_login_token_response.by_resource_server
+        by_rs["transfer.api.globus.org"]["refresh_token"] = "newRT"
+        test_token_storage.store(mock_login_token_response)
+        assert manager.get_transfer_client() is not client
+
+    unshared = LoginManager()
+    assert unshared.get_transfer_client() is not unshared.get_transfer_client()
+
+
 def test_compute_timer_scope_no_data_access():
     transfer_scope = globus_sdk.scopes.TransferScopes.all
 
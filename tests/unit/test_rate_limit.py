@@ -0,0 +1,145 @@
+import pytest
+import requests
+import responses
+
+from globus_cli.services.rate_limit import (
+    MAX_RATE,
+    MIN_RATE,
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+    install_rate_limiter,
+)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    class FakeClock:
+        now = 1000.0
+
+        def monotonic(self):
+            return self.now
+
+    clock = FakeClock()
+    monkeypatch.setattr(
+        "globus_cli.services.rate_limit.time.monotonic", clock.monotonic
+    )
+    return clock
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    return response
+
+
+def test_acquire_does_not_sleep_while_tokens_remain(fake_clock, mocksleep):
+    limiter = AdaptiveRateLimiter("test", initial_rate=5)
+    for _ in range(5):
+        limiter.acquire()
+    mocksleep.assert_not_called()
+
+
+def test_acquire_sleeps_when_bucket_is_empty(fake_clock, mocksleep):
+    limiter = AdaptiveRateLimiter("test", initial_rate=5)
+    for _ in range(6):
+        limiter.acquire()
+    mocksleep.assert_called_once_with(pytest.approx(0.2))
+
+
+def test_bucket_refills_over_time(fake_clock, mocksleep):
+    limiter = AdaptiveRateLimiter("test", initial_rate=5)
+    for _ in range(5):
+        limiter.acquire()
+    fake_clock.now += 1
+    for _ in range(5):
+        limiter.acquire()
+    mocksleep.assert_not_called()
+
+
+def test_success_increases_rate_up_to_max(fake_clock):
+    limiter = AdaptiveRateLimiter("test", initial_rate=10)
+    limiter.observe_response(_response(200))
+    assert limiter.rate > 10
+
+    for _ in range(1000):
+        limiter.observe_response(_response(200))
+    assert limiter.rate == MAX_RATE
+
+
+@pytest.mark.parametrize("status", (429, 503))
+def test_throttle_halves_rate_once_per_cooldown(fake_clock, status):
+    limiter = AdaptiveRateLimiter("test", initial_rate=10)
+    limiter.observe_response(_response(status))
+    limiter.observe_response(_response(status))
+    assert limiter.rate == 5
+
+    fake_clock.now += 5
+    limiter.observe_response(_response(status))
+    assert limiter.rate == 2.5
+
+
+def test_throttle_does_not_go_below_min_rate(fake_clock):
+    limiter = AdaptiveRateLimiter("test", initial_rate=1)
+    for _ in range(10):
+        fake_clock.now += 5
+        limiter.record_throttle()
+    assert limiter.rate == MIN_RATE
+
+
+def test_retry_after_blocks_acquire(fake_clock, mocksleep):
+    limiter = AdaptiveRateLimiter("test", initial_rate=10)
+    limiter.observe_response(_response(429, {"Retry-After": "3"}))
+    limiter.acquire()
+    (delay,), _ = mocksleep.call_args
+    assert delay >= 3
+
+
+def test_server_errors_do_not_change_rate(fake_clock):
+    limiter = AdaptiveRateLimiter("test", initial_rate=10)
+    limiter.observe_response(_response(500))
+    assert limiter.rate == 10
+
+
+def test_limiters_are_shared_by_host():
+    assert get_rate_limiter("a.example.org") is get_rate_limiter("a.example.org")
+    assert get_rate_limiter("a.example.org") is not get_rate_limiter("b.example.org")
+
+
+def test_installed_limiter_observes_every_response(go_ep1_id):
+    import globus_sdk
+
+    client = globus_sdk.TransferClient()
+    # the testsuite disables retries, but this test checks the retry path
+    client.retry_config.max_retries = 1
+    limiter = install_rate_limiter(client)
+    assert limiter is get_rate_limiter("transfer.api.globus.org")
+
+    responses.add(
+        responses.GET,
+        f"{client.base_url}v0.10/endpoint/{go_ep1_id}",
+        status=429,
+        headers={"Retry-After": "1"},
+    )
+    responses.add(
+        responses.GET,
+        f"{client.base_url}v0.10/endpoint/{go_ep1_id}",
+        json={"id": go_ep1_id},
+    )
+    rate_before = limiter.rate
+    client.get_endpoint(go_ep1_id)
+    # one throttled response (rate halved) and one success (small increase)
+    assert limiter.rate < rate_before
+
+
+def test_clients_share_connection_pools_by_host():
+    import globus_sdk
+
+    clients = [globus_sdk.TransferClient() for _ in range(2)]
+    for client in clients:
+        install_rate_limiter(client)
+
+    adapters = [
+        client.transport.session.get_adapter(client.base_url) for client in clients
+    ]
+    assert adapters[0] is adapters[1]
@@ -0,0 +1,73 @@
+"""
+Check that common commands start up within a time budget.
+
+The CPU time taken to import the CLI and run the command is measured in a fresh
+interpreter (excluding the startup of the interpreter itself), and the best of
+several runs is compared to the budget. CPU time, rather than elapsed time, is
+measured so that other work on the machine (e.g. the rest of the testsuite running
+in parallel) does not count against the budget.
+
+The budgets are deliberately loose, to tolerate slow and busy test machines, so
+that only a substantial regression -- e.g. a newly eager import of a large
+dependency -- fails these tests. Use `scripts/benchmark_startup.py` to measure
+startup time, and to find slow imports.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# seconds
+STARTUP_BUDGETS = {
+    ("--help",): 0.5,
+    # `globus version` looks up the latest version, and so needs `requests`
+    ("version",): 0.6,
+}
+RUNS = 3
+
+_TIMED_RUN = """\
+import sys, time
+start = time.process_time()
+from globus_cli import main
+try:
+    main.main(sys.argv[1:], prog_name="globus")
+except SystemExit:
+    pass
+sys.stderr.write(f"{time.process_time() - start}\\n")
+"""
+
+
+def _time_startup(args):
+    # when the testsuite runs under coverage, it is also started in subprocesses
+    # (see `patch = ["subprocess"]` in the coverage config) by these variables,
+    # which would make the timings meaningless
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("COVERAGE_", "COV_CORE_"))
+    }
+    # nothing listens on the discard port, so web requests fail immediately
+    env["HTTPS_PROXY"] = "http://127.0.0.1:9"
+    env.pop("GLOBUS_CLI_DAEMON_SOCKET", None)
+
+    proc = subprocess.run(
+        [sys.executable, "-c", _TIMED_RUN, *args],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    return float(proc.stderr.strip().splitlines()[-1])
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize("args, budget", STARTUP_BUDGETS.items())
+def test_startup_within_budget(args, budget):
+    elapsed = min(_time_startup(args) for _ in range(RUNS))
+    assert elapsed < budget, (
+        f"'globus {' '.join(args)}' took {elapsed:.3f}s to start, "
+        f"over its budget of {budget}s"
+    )
@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+
+from globus_cli.services.task_index import TaskIndex, filter_to_sql, normalize_time
+
+
+def _task(task_id, **kwargs):
+    task = {
+        "task_id": task_id,
+        "type": "TRANSFER",
+        "status": "SUCCEEDED",
+        "label": None,
+        "request_time": "2024-05-01T12:00:00+00:00",
+        "completion_time": "2024-05-01T12:05:00+00:00",
+    }
+    task.update(kwargs)
+    return task
+
+
+@pytest.fixture
+def index():
+    index = TaskIndex(":memory:", namespace="test")
+    index.upsert(
+        [
+            _task("t1", label="nightly backup"),
+            _task(
+                "t2",
+                type="DELETE",
+                status="FAILED",
+                label="Cleanup 100%",
+                request_time="2024-06-01T08:00:00+00:00",
+                completion_time="2024-06-01T08:01:00+00:00",
+            ),
+            _task(
+                "t3",
+                status="ACTIVE",
+                request_time="2024-07-01T00:00:00+02:00",
+                completion_time=None,
+            ),
+        ]
+    )
+    return index
+
+
+def _ids(tasks):
+    return [task["task_id"] for task in tasks]
+
+
+def test_normalize_time():
+    assert normalize_time("2021-09-02T18:04:47+00:00") == "2021-09-02 18:04:47"
+    assert normalize_time("2021-09-02T18:04:47+02:00") == "2021-09-02 16:04:47"
+    assert normalize_time(None) is None
+
+
+def test_upsert_counts_added_and_updated(index):
+    assert index.upsert([_task("t1", label="nightly backup")]) == (0, 0)
+    assert index.upsert([_task("t1", label="renamed"), _task("t4")]) == (1, 1)
+    assert len(index) == 4
+
+
+@pytest.mark.parametrize(
+    "filter_string, expect",
+    (
+        ("", ["t3", "t2", "t1"]),
+        ("type:TRANSFER,DELETE", ["t3", "t2", "t1"]),
+        ("type:DELETE", ["t2"]),
+        ("status:ACTIVE,FAILED", ["t3", "t2"]),
+        ("task_id:t1,t3", ["t3", "t1"]),
+        ("label:~*BACKUP*", ["t1"]),
+        ("label:~cleanup 100%", ["t2"]),
+        ("label:~cleanup 1000%", []),
+        ("label:=nightly backup", ["t1"]),
+        ("label:=Nightly backup", []),
+        ("label:!~nightly*", ["t3", "t2"]),
+        ("label:~*a*,!~*%", ["t1"]),
+        ("request_time:2024-06-01 00:00:00,", ["t3", "t2"]),
+        ("request_time:,2024-06-01 08:00:00", ["t1"]),
+        ("completion_time:2024-05-02 00:00:00,", ["t2"]),
+        ("status:SUCCEEDED/type:DELETE", []),
+    ),
+)
+def test_query_filters(index, filter_string, expect):
+    assert _ids(index.query(filter_string)) == expect
+
+
+def test_query_limit(index):
+    assert _ids(index.query(limit=2)) == ["t3", "t2"]
+
+
+def test_query_rejects_unknown_fields():
+    with pytest.raises(ValueError, match="owner_id"):
+        filter_to_sql("owner_id:abc")
+
+
+def test_cursors(index):
+    assert index.latest_request_time() == "2024-06-30 22:00:00"
+    assert index.earliest_unfinished_request_time() == "2024-06-30 22:00:00"
+    index.upsert([_task("t3", request_time="2024-07-01T00:00:00+02:00")])
+    assert index.earliest_unfinished_request_time() is None
+
+
+def test_namespaces_are_separate(tmp_path):
+    filename = str(tmp_path / "task_index.db")
+    index_a = TaskIndex(filename, namespace="a")
+    index_b = TaskIndex(filename, namespace="b")
+    index_a.upsert([_task("t1")])
+    assert index_b.query() == []
+
+    index_b.clear()
+    assert len(index_a) == 1
+
+
+def test_database_errors_are_raised():
+    # unlike the caches, the index cannot be cheaply rebuilt, so errors surface
+    index = TaskIndex(":memory:", namespace="test")
+    index.close()
+    with pytest.raises(sqlite3.Error):
+        index.clear()
+    with pytest.raises(sqlite3.Error):
+        len(index)
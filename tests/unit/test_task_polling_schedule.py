@@ -0,0 +1,97 @@
+import pytest
+
+from globus_cli.commands._common import TaskPollingSchedule
+
+
+def _active_task(**progress):
+    return {"status": "ACTIVE", **progress}
+
+
+def test_fixed_polling_interval():
+    schedule = TaskPollingSchedule(5)
+    assert [schedule.next_interval([_active_task()]) for _ in range(4)] == [5] * 4
+
+
+def test_adaptive_polling_backs_off_to_max():
+    schedule = TaskPollingSchedule(1, 30)
+    intervals = [schedule.next_interval([_active_task()]) for _ in range(7)]
+    assert intervals == [1, 2, 4, 8, 16, 30, 30]
+
+
+def test_adaptive_polling_max_below_initial_interval_is_fixed():
+    schedule = TaskPollingSchedule(10, 2)
+    assert [schedule.next_interval([_active_task()]) for _ in range(3)] == [10] * 3
+
+
+@pytest.mark.parametrize(
+    "progress, expect_interval",
+    (
+        # 4 files of 100MB remaining at 10MB/s: finishes in 40 seconds
+        (
+            {
+                "files": 5,
+                "files_transferred": 1,
+                "bytes_transferred": 100_000_000,
+                "effective_bytes_per_second": 10_000_000,
+            },
+            40,
+        ),
+        # the prediction is never shorter than the initial interval
+        (
+            {
+                "files": 2,
+                "files_transferred": 1,
+                "bytes_transferred": 1000,
+                "effective_bytes_per_second": 10_000_000,
+            },
+            1,
+        ),
+        # all files are done (e.g. the task is verifying checksums)
+        (
+            {
+                "files": 3,
+                "files_transferred": 2,
+                "files_skipped": 1,
+                "bytes_transferred": 1000,
+                "effective_bytes_per_second": 1000,
+            },
+            1,
+        ),
+        # a prediction later than the next scheduled check is ignored
+        (
+            {
+                "files": 1000,
+                "files_transferred": 1,
+                "bytes_transferred": 100_000_000,
+                "effective_bytes_per_second": 10_000_000,
+            },
+            64,
+        ),
+        # no progress, no prediction
+        ({"files": 10, "effective_bytes_per_second": 0}, 64),
+    ),
+)
+def test_adaptive_polling_uses_task_progress(progress, expect_interval):
+    schedule = TaskPollingSchedule(1, 300)
+    # back off for a while, so that the scheduled interval is 64 seconds
+    for _ in range(6):
+        schedule.next_interval([_active_task()])
+
+    assert schedule.next_interval([_active_task(**progress)]) == expect_interval
+
+
+def test_adaptive_polling_uses_earliest_prediction():
+    schedule = TaskPollingSchedule(1, 300)
+    for _ in range(6):
+        schedule.next_interval([_active_task()])
+
+    tasks = [
+        _active_task(
+            files=1 + remaining,
+            files_transferred=1,
+            bytes_transferred=10,
+            effective_bytes_per_second=1,
+        )
+        for remaining in (5, 2, 3)
+    ]
+    assert schedule.next_interval(tasks) == 20
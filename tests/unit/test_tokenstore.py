@@ -1,9 +1,15 @@
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import globus_sdk
 from globus_sdk.testing import RegisteredResponse, get_last_request
 
-from globus_cli.login_manager.storage import CLIStorage, _resolve_namespace
+from globus_cli.login_manager.storage import (
+    CLIStorage,
+    ThreadSafeSQLiteAdapter,
+    _resolve_namespace,
+)
 
 
 def test_default_namespace():
@@ -79,3 +85,20 @@ def test_storage_creates_fresh_client_after_delete():
     last_req = get_last_request()
     assert last_req.method == "POST"
     assert last_req.url.endswith("/v2/api/clients")
+
+
+def test_thread_safe_adapter_can_be_used_from_other_threads(tmp_path):
+    adapter = ThreadSafeSQLiteAdapter(str(tmp_path / "storage.db"))
+
+    def store_config(n):
+        assert threading.current_thread() is not threading.main_thread()
+        adapter.store_config(f"config-{n}", {"n": n})
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(store_config, range(20)))
+
+    assert [adapter.read_config(f"config-{n}") for n in range(20)] == [
+        {"n": n} for n in range(20)
+    ]
+    assert list(adapter.iter_namespaces(include_config_namespaces=True)) == ["DEFAULT"]
+    adapter.close()
@@ -1,12 +1,19 @@
+import io
+import threading
+import time
 import unittest.mock
 
 import click
 import pytest
+from globus_sdk.paging import HasNextPaginator, LimitOffsetTotalPaginator
 
 from globus_cli.services.auth import CustomAuthClient
 from globus_cli.utils import (
+    PagingWrapper,
     format_list_of_words,
     format_plural_str,
+    offset_pages,
+    prefetch_items,
     resolve_principal_urn,
     shlex_process_stream,
     unquote_cmdprompt_single_quotes,
@@ -58,8 +65,7 @@ def test_shlex_process_stream_success():
     def foo(bar):
         values.append(bar)
 
-    text_like = unittest.mock.Mock()
-    text_like.read.return_value = "alpha\nbeta  # gamma\n"
+    text_like = io.StringIO("alpha\nbeta  # gamma\n")
     text_like.name = "alphabet.txt"
 
     with outer_main.make_context("main", []):
@@ -79,8 +85,7 @@ def test_shlex_process_stream_error_handling(capsys):
     def foo(bar):
         values.append(bar)
 
-    text_like = unittest.mock.Mock()
-    text_like.read.return_value = "alpha beta\n"
+    text_like = io.StringIO("alpha beta\n")
     text_like.name = "alphabet.txt"
 
     with pytest.raises(click.exceptions.Exit) as excinfo:
@@ -254,3 +259,156 @@ def test_resolve_principal_urn__when_principal_type_key_is_non_default():
         )
 
     assert e.value.message.startswith("'--foobarjohn identity' but")
+
+
+class _FakePaginator:
+    items_key = "DATA"
+
+    def __init__(self, pages, error=None):
+        self._pages = pages
+        self._error = error
+        self.fetched = 0
+
+    def pages(self):
+        for page in self._pages:
+            self.fetched += 1
+            yield {"DATA": page}
+        if self._error is not None:
+            raise self._error
+
+
+def test_prefetch_items_yields_all_items():
+    paginator = _FakePaginator([[1, 2], [3], [], [4, 5]])
+    assert list(prefetch_items(paginator)) == [1, 2, 3, 4, 5]
+
+
+def test_prefetch_items_stops_fetching_at_limit():
+    paginator = _FakePaginator([[1, 2], [3, 4], [5, 6], [7, 8]])
+    assert list(prefetch_items(paginator, limit=3)) == [1, 2, 3, 4]
+    assert paginator.fetched == 2
+
+
+def test_prefetch_items_raises_errors_in_order():
+    paginator = _FakePaginator([[1], [2]], error=RuntimeError("page 3 failed"))
+    items = prefetch_items(paginator)
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        next(items)
+
+
+def test_prefetch_items_fetches_a_bounded_number_of_pages():
+    paginator = _FakePaginator([[n] for n in range(10)])
+    items = prefetch_items(paginator, depth=2)
+    assert next(items) == 0
+    # the fetching thread blocks once the queue is full
+    time.sleep(0.2)
+    assert paginator.fetched <= 4
+    items.close()
+
+
+@pytest.mark.parametrize("limit, expect", ((None, [1, 2, 3]), (2, [1, 2])))
+def test_paging_wrapper_prefetches_paginators(limit, expect):
+    wrapper = PagingWrapper(_FakePaginator([[1, 2], [3]]), limit=limit)
+    assert wrapper.has_next()
+    assert list(wrapper) == expect
+
+
+def _offset_paginator(
+    paginator_class, total, *, page_size=10, max_total_results=1000, on_request=None
+):
+    requests = []
+
+    def method(**kwargs):
+        offset, limit = kwargs["offset"], kwargs["limit"]
+        requests.append((offset, limit))
+        if on_request is not None:
+            on_request(offset)
+        data = list(range(offset, min(offset + limit, total)))
+        return {
+            "DATA": data,
+            "total": total,
+            "has_next_page": offset + len(data) < total,
+        }
+
+    paginator = paginator_class(
+        method,
+        items_key="DATA",
+        get_page_size=lambda page: len(page["DATA"]),
+        max_total_results=max_total_results,
+        page_size=page_size,
+        client_args=(),
+        client_kwargs={},
+    )
+    return paginator, requests
+
+
+@pytest.mark.parametrize(
+    "paginator_class", (LimitOffsetTotalPaginator, HasNextPaginator)
+)
+def test_offset_pages_yields_pages_in_order(paginator_class):
+    paginator, requests = _offset_paginator(paginator_class, total=95)
+    pages = list(offset_pages(paginator, max_workers=4))
+    assert [item for page in pages for item in page["DATA"]] == list(range(95))
+    offsets = sorted(offset for offset, _ in requests)
+    if paginator_class is LimitOffsetTotalPaginator:
+        assert offsets == list(range(0, 100, 10))
+    # without a total, a few pages past the end may be requested
+    else:
+        assert offsets[:10] == list(range(0, 100, 10))
+        assert len(offsets) <= 10 + 4
+
+
+def test_offset_pages_requests_pages_concurrently():
+    # every page after the first waits for another to be requested at the same time
+    barrier = threading.Barrier(2, timeout=2)
+
+    def on_request(offset):
+        if offset > 0:
+            barrier.wait()
+
+    paginator, _ = _offset_paginator(
+        LimitOffsetTotalPaginator, total=30, on_request=on_request
+    )
+    assert len(list(offset_pages(paginator, max_workers=2))) == 3
+
+
+@pytest.mark.parametrize(
+    "paginator_class", (LimitOffsetTotalPaginator, HasNextPaginator)
+)
+@pytest.mark.parametrize("limit", (None, 25))
+def test_offset_pages_without_max_total_results(paginator_class, limit):
+    paginator, _ = _offset_paginator(paginator_class, total=95, max_total_results=None)
+    pages = list(offset_pages(paginator, limit=limit, max_workers=4))
+    expect = list(range(95 if limit is None else limit))
+    assert [item for page in pages for item in page["DATA"]] == expect
+
+
+def test_offset_pages_respects_limit():
+    paginator, requests = _offset_paginator(LimitOffsetTotalPaginator, total=95)
+    pages = list(offset_pages(paginator, limit=25))
+    assert [item for page in pages for item in page["DATA"]] == list(range(25))
+    assert sorted(requests) == [(0, 10), (10, 10), (20, 5)]
+
+
+def test_offset_pages_raises_errors():
+    def on_request(offset):
+        if offset == 20:
+            raise RuntimeError("page 3 failed")
+
+    paginator, _ = _offset_paginator(
+        LimitOffsetTotalPaginator, total=50, on_request=on_request
+    )
+    pages = offset_pages(paginator)
+    assert next(pages)["DATA"][0] == 0
+    assert next(pages)["DATA"][0] == 10
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        next(pages)
+
+
+def test_paging_wrapper_fetches_offset_pages_past_limit_for_has_next():
+    paginator, requests = _offset_paginator(LimitOffsetTotalPaginator, total=95)
+    wrapper = PagingWrapper(paginator, limit=20)
+    assert list(wrapper) == list(range(20))
+    assert wrapper.has_next()
+    assert sorted(requests) == [(0, 10), (10, 10), (20, 1)]